@@ -3,19 +3,20 @@ Analytics & Monitoring Endpoints
 Serves data for the Advanced Analytics & Monitoring UI.
 Includes RAG memory stats and local AI service health capabilities.
 """
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import logging
 import httpx
 import os
 
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, desc
 
 from app.db.base import get_db
 from app.api.v1.endpoints.auth import get_current_user
 from app.models.user import User
 from app.models.profile import Profile
+from app.models.pipeline import PipelineRun
 from app.core.config import settings
 from app.utils.path_utils import resolve_sadtalker_dir, running_in_docker, is_windows_style_path
 
@@ -66,7 +67,7 @@ async def get_performance_stats(
 ) -> Any:
     """Get performance and health status of local AI services."""
     import shutil
-    import subprocess
+    from app.services.media_probe import media_probe
 
     try:
         stats = {
@@ -111,15 +112,13 @@ async def get_performance_stats(
         except Exception:
             stats["local"]["sd_next"]["status"] = "offline"
 
-        # Check FFmpeg
-        ffmpeg_path = shutil.which("ffmpeg")
-        if ffmpeg_path:
-            try:
-                version_out = subprocess.check_output(["ffmpeg", "-version"], text=True, stderr=subprocess.STDOUT)
-                first_line = version_out.split('\n')[0]
+        # Check FFmpeg (capabilities are detected once per process)
+        if shutil.which("ffmpeg"):
+            capabilities = await media_probe.capabilities()
+            if capabilities["available"]:
                 stats["local"]["ffmpeg"]["status"] = "online"
-                stats["local"]["ffmpeg"]["version"] = first_line.split('version')[-1].split('Copyright')[0].strip()
-            except Exception:
+                stats["local"]["ffmpeg"]["version"] = capabilities["version"]
+            else:
                 stats["local"]["ffmpeg"]["status"] = "error"
         else:
             stats["local"]["ffmpeg"]["status"] = "missing"
@@ -181,3 +180,45 @@ async def get_distribution_stats(
         "twitter": bool(settings.TWITTER_API_KEY and settings.TWITTER_ACCESS_TOKEN),
         "discord": bool(settings.DISCORD_WEBHOOK_URL)
     }
+
+
+@router.get("/pipeline-stages", response_model=Dict[str, Any])
+async def get_pipeline_stage_timings(
+    limit: int = 100,
+    category: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """p50/p95 duration per span name (stages, LLM calls, images, FFmpeg) over recent traced runs."""
+    from app.core.tracing import percentile
+
+    query = select(PipelineRun.spans).where(PipelineRun.trace_id.isnot(None))
+    if category:
+        query = query.where(PipelineRun.category == category)
+    query = query.order_by(desc(PipelineRun.finished_at)).limit(min(limit, 1000))
+    result = await db.execute(query)
+
+    durations: Dict[str, List[float]] = {}
+    cache_hits: Dict[str, int] = {}
+    runs = 0
+    for (spans,) in result.all():
+        runs += 1
+        for span in spans or []:
+            if span.get("duration_ms") is None:
+                continue
+            durations.setdefault(span["name"], []).append(span["duration_ms"])
+            if (span.get("attributes") or {}).get("cache_hit"):
+                cache_hits[span["name"]] = cache_hits.get(span["name"], 0) + 1
+
+    stages = {
+        name: {
+            "count": len(values),
+            "p50_ms": percentile(values, 50),
+            "p95_ms": percentile(values, 95),
+            "max_ms": max(values),
+            "total_ms": round(sum(values), 2),
+            "cache_hits": cache_hits.get(name, 0),
+        }
+        for name, values in sorted(durations.items(), key=lambda item: -sum(item[1]))
+    }
+    return {"runs": runs, "stages": stages}
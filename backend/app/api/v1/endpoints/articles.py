@@ -12,6 +12,7 @@ from app.db.base import get_db
 from app.models.article import NormalizedArticle, ArticleStatus
 from app.models.user import User, UserRole
 from app.api.v1.endpoints.auth import get_current_active_user, require_role
+from app.services.risk_service import risk_service
 from pydantic import BaseModel
 
 class GenerateFromUrlRequest(BaseModel):
@@ -53,8 +54,10 @@ async def create_article(
     )
     
     db.add(db_article)
+    risk_scores = await risk_service.score_ingested_articles([db_article], db, assessed_by=current_user.id)
     await db.commit()
     await db.refresh(db_article)
+    risk_service.enqueue_deep_checks(risk_scores)
     
     # Pre-generate dictionary to avoid lazy loading issues during serialization
     article_dict = {
@@ -224,8 +227,10 @@ async def process_raw_article(
     )
     
     db.add(normalized)
+    risk_scores = await risk_service.score_ingested_articles([normalized], db, assessed_by=current_user.id)
     await db.commit()
     await db.refresh(normalized)
+    risk_service.enqueue_deep_checks(risk_scores)
     
     return normalized.to_dict()
 
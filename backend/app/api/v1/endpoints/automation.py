@@ -11,6 +11,7 @@ from sqlalchemy import select, desc
 
 from app.db.base import get_db
 from app.models.automation import AutomationSchedule, AutomationTaskType
+from app.core.scheduler import notify_schedule_change
 from app.api.v1.endpoints.auth import get_current_active_user, require_role
 from app.models.user import UserRole
 
@@ -52,6 +53,7 @@ async def create_schedule(
     db.add(schedule)
     await db.commit()
     await db.refresh(schedule)
+    notify_schedule_change()
     return schedule.to_dict()
 
 
@@ -83,6 +85,7 @@ async def update_schedule(
     
     await db.commit()
     await db.refresh(schedule)
+    notify_schedule_change()
     return schedule.to_dict()
 
 
@@ -101,6 +104,7 @@ async def delete_schedule(
     
     await db.delete(schedule)
     await db.commit()
+    notify_schedule_change()
     return {"message": "Schedule deleted"}
 
 
@@ -10,6 +10,7 @@ from sqlalchemy import select, desc
 
 from app.db.base import get_db
 from app.models.campaign import Campaign
+from app.core.scheduler import notify_schedule_change
 from app.api.v1.endpoints.auth import get_current_active_user, require_role
 from app.models.user import UserRole
 
@@ -64,6 +65,7 @@ async def create_campaign(
     db.add(campaign)
     await db.commit()
     await db.refresh(campaign)
+    notify_schedule_change()
     return campaign.to_dict()
 
 
@@ -112,6 +114,7 @@ async def update_campaign(
     
     await db.commit()
     await db.refresh(campaign)
+    notify_schedule_change()
     return campaign.to_dict()
 
 
@@ -129,6 +132,7 @@ async def delete_campaign(
     
     await db.delete(campaign)
     await db.commit()
+    notify_schedule_change()
     return {"message": "Campaign deleted"}
 
 
@@ -144,22 +148,15 @@ async def trigger_campaign(
     if not campaign:
         raise HTTPException(status_code=404, detail="Campaign not found")
     
-    from app.services.pipeline_service import pipeline_service
+    from app.services.campaign_service import campaign_service
     from datetime import datetime
-    
-    categories = campaign.categories or ["General"]
-    results = []
-    for cat in categories:
-        res = await pipeline_service.run_full_pipeline(
-            db=db,
-            category=cat,
-            profile_id=campaign.profile_id,
-            generate_short=True,
-            generate_presenter=True,
-        )
-        results.append(res)
-    
+
+    task = campaign_service.start(campaign_id, trigger="manual", generate_presenter=True)
+    if task is None:
+        raise HTTPException(status_code=409, detail="Campaign is already running")
+
     campaign.last_run_at = datetime.utcnow()
     await db.commit()
-    
-    return {"message": "Campaign triggered successfully", "results": results}
+
+    run = await task
+    return {"message": "Campaign triggered successfully", "run": run}
@@ -1,6 +1,6 @@
 """
 Pipeline Orchestration API
-Full automation: Data → Report → Audio → Video in one call.
+Full automation: Data → Report → Audio → Video as a background run.
 """
 import logging
 import uuid
@@ -10,6 +10,8 @@ from typing import Optional, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 
@@ -19,12 +21,13 @@ from app.models.script import Script, ScriptStatus
 from app.api.v1.endpoints.auth import get_current_active_user, require_role
 from app.models.user import UserRole
 from app.models.profile import Profile
+from app.models.pipeline import PipelineRun
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-@router.post("/run-full")
+@router.post("/run-full", status_code=202)
 async def run_full_pipeline(
     category: str,
     region: str = "Global",
@@ -33,16 +36,20 @@ async def run_full_pipeline(
     generate_short: bool = True,
     generate_presenter: bool = True,
     distribute_to: Optional[List[str]] = None,
+    preview: bool = False,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_active_user),
 ):
     """
-    Run the complete pipeline for a category.
+    Start the complete pipeline for a category in the background.
+    Poll `status_url` or subscribe to `events_url` (Server-Sent Events) for progress.
+    `preview` renders a low-resolution draft short and skips distribution; promote the run
+    with POST /runs/{run_id}/promote once it has been reviewed.
     """
-    from app.services.pipeline_service import pipeline_service
-    
-    result = await pipeline_service.run_full_pipeline(
-        db=db,
+    from app.services.pipeline_run_service import pipeline_run_service
+
+    run = await pipeline_run_service.create_run(
+        db,
         category=category,
         region=region,
         profile_id=profile_id,
@@ -50,12 +57,217 @@ async def run_full_pipeline(
         generate_short=generate_short,
         generate_presenter=generate_presenter,
         distribute_to=distribute_to,
+        preview=preview,
+        created_by=current_user.id,
+    )
+    pipeline_run_service.start(run.id)
+
+    return {
+        "run_id": str(run.id),
+        "status": run.status,
+        "status_url": f"/api/v1/pipeline/runs/{run.id}",
+        "events_url": f"/api/v1/pipeline/runs/{run.id}/events",
+    }
+
+
+class PipelineTarget(BaseModel):
+    category: str
+    region: str = "Global"
+
+
+class PipelineBatchRequest(BaseModel):
+    targets: List[PipelineTarget]
+    profile_id: Optional[UUID] = None
+    voice_id: str = "default"
+    generate_short: bool = True
+    generate_presenter: bool = True
+    distribute_to: Optional[List[str]] = None
+    preview: bool = False
+
+
+@router.post("/run-batch", status_code=202)
+async def run_batch_pipeline(
+    batch: PipelineBatchRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """
+    Start the pipeline for several (category, region) targets of one profile.
+    The profile and articles are loaded once (articles shared between categories are
+    deduplicated), reports are generated concurrently and renders share one pool.
+    Each target gets its own run with the usual status and event URLs.
+    """
+    from app.services.pipeline_run_service import pipeline_run_service
+
+    if not batch.targets:
+        raise HTTPException(status_code=400, detail="At least one target is required")
+
+    runs = []
+    for target in batch.targets:
+        runs.append(await pipeline_run_service.create_run(
+            db,
+            category=target.category,
+            region=target.region,
+            profile_id=batch.profile_id,
+            voice_id=batch.voice_id,
+            generate_short=batch.generate_short,
+            generate_presenter=batch.generate_presenter,
+            distribute_to=batch.distribute_to,
+            preview=batch.preview,
+            created_by=current_user.id,
+        ))
+    pipeline_run_service.start_batch([run.id for run in runs])
+
+    return {
+        "runs": [
+            {
+                "run_id": str(run.id),
+                "category": run.category,
+                "region": run.region,
+                "status": run.status,
+                "status_url": f"/api/v1/pipeline/runs/{run.id}",
+                "events_url": f"/api/v1/pipeline/runs/{run.id}/events",
+            }
+            for run in runs
+        ]
+    }
+
+
+@router.get("/runs")
+async def list_pipeline_runs(
+    status: Optional[str] = None,
+    limit: int = 20,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """List recent pipeline runs."""
+    query = select(PipelineRun)
+    if status:
+        query = query.where(PipelineRun.status == status)
+    query = query.order_by(desc(PipelineRun.created_at)).limit(min(limit, 100))
+
+    result = await db.execute(query)
+    return [run.to_dict() for run in result.scalars().all()]
+
+
+@router.get("/runs/{run_id}")
+async def get_pipeline_run(
+    run_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Get a pipeline run with its per-step progress."""
+    run = await db.get(PipelineRun, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Pipeline run not found")
+    return run.to_dict()
+
+
+@router.get("/runs/{run_id}/trace")
+async def get_pipeline_run_trace(
+    run_id: UUID,
+    format: str = "flame",
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """
+    Timing spans of a run's latest attempt.
+    `format=flame` returns spans with depth and start offset for a flame chart;
+    `format=otlp` returns an OTLP/JSON payload importable by OpenTelemetry tooling.
+    """
+    from app.core.tracing import flame_view, to_otlp
+
+    run = await db.get(PipelineRun, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Pipeline run not found")
+    if not run.trace_id:
+        raise HTTPException(status_code=404, detail="No trace recorded for this run yet")
+
+    if format == "otlp":
+        return to_otlp(run.trace_id, run.spans or [])
+    return {"traceId": run.trace_id, "spans": flame_view(run.spans or [])}
+
+
+@router.post("/runs/{run_id}/retry", status_code=202)
+async def retry_pipeline_run(
+    run_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Re-run a finished pipeline, resuming from the first stage without a valid checkpoint."""
+    from app.services.pipeline_run_service import pipeline_run_service, TERMINAL_STATUSES
+
+    run = await db.get(PipelineRun, run_id, with_for_update=True)
+    if not run:
+        raise HTTPException(status_code=404, detail="Pipeline run not found")
+    if run.status not in TERMINAL_STATUSES:
+        raise HTTPException(status_code=409, detail=f"Pipeline run is {run.status}")
+
+    run = await pipeline_run_service.retry_run(db, run)
+    pipeline_run_service.start(run.id)
+
+    return {
+        "run_id": str(run.id),
+        "status": run.status,
+        "attempts": run.attempts,
+        "status_url": f"/api/v1/pipeline/runs/{run.id}",
+        "events_url": f"/api/v1/pipeline/runs/{run.id}/events",
+    }
+
+
+@router.post("/runs/{run_id}/promote", status_code=202)
+async def promote_pipeline_run(
+    run_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Render a reviewed preview run at full quality, reusing everything upstream of the short clip."""
+    from app.services.pipeline_run_service import pipeline_run_service, TERMINAL_STATUSES
+
+    run = await db.get(PipelineRun, run_id, with_for_update=True)
+    if not run:
+        raise HTTPException(status_code=404, detail="Pipeline run not found")
+    if run.status not in TERMINAL_STATUSES:
+        raise HTTPException(status_code=409, detail=f"Pipeline run is {run.status}")
+    if not (run.params or {}).get("preview"):
+        raise HTTPException(status_code=409, detail="Pipeline run is not a preview")
+
+    run = await pipeline_run_service.promote_run(db, run)
+    pipeline_run_service.start(run.id)
+
+    return {
+        "run_id": str(run.id),
+        "status": run.status,
+        "attempts": run.attempts,
+        "status_url": f"/api/v1/pipeline/runs/{run.id}",
+        "events_url": f"/api/v1/pipeline/runs/{run.id}/events",
+    }
+
+
+@router.get("/runs/{run_id}/events")
+async def stream_pipeline_run_events(
+    run_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Stream per-step progress events for a pipeline run as Server-Sent Events."""
+    from app.services.pipeline_run_service import pipeline_run_service
+
+    if not await db.get(PipelineRun, run_id):
+        raise HTTPException(status_code=404, detail="Pipeline run not found")
+
+    async def event_source():
+        async for event in pipeline_run_service.stream_events(run_id):
+            if event is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"event: {event['event']}\ndata: {json.dumps(event['data'], default=str)}\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    
-    if "error" in result and not result.get("steps"):
-        raise HTTPException(status_code=400, detail=result["error"])
-        
-    return result
 
 
 @router.get("/status")
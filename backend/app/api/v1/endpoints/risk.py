@@ -1,21 +1,57 @@
 """
 Risk Assessment API Endpoints
 """
-from typing import List, Optional
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, func, update
 
-from app.db.base import get_db
-from app.models.risk import RiskScore
+from app.db.base import get_db, AsyncSessionLocal
+from app.models.risk import RiskScore, RiskRuleSet
 from app.models.user import User, UserRole
 from app.api.v1.endpoints.auth import get_current_active_user, require_role
 from app.core.config import settings
 from app.services.risk_service import risk_service
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Keep references to background re-score tasks so they are not garbage collected
+_rescore_tasks = set()
+
+
+class RiskRuleSetCreate(BaseModel):
+    name: str
+    description: Optional[str] = None
+    factor_weights: Optional[Dict[str, Dict[str, int]]] = None
+    dimension_weights: Optional[Dict[str, float]] = None
+    classification_thresholds: Optional[List[List]] = None
+    review_threshold: Optional[int] = None
+    lexicon: Optional[Dict[str, List[str]]] = None
+
+
+async def _rescore_in_background(version: int, reanalyze: bool):
+    """Run a full re-score against the given rule set version with its own session."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(RiskRuleSet).where(RiskRuleSet.version == version))
+        rule_set = result.scalar_one_or_none()
+        rules = rule_set.to_rules() if rule_set else None
+        try:
+            await risk_service.rescore_all(db, rules=rules, reanalyze=reanalyze)
+        except Exception as e:
+            logger.error(f"Risk re-score to v{version} failed: {e}")
+
+
+def _schedule_rescore(version: int, reanalyze: bool):
+    task = asyncio.create_task(_rescore_in_background(version, reanalyze))
+    _rescore_tasks.add(task)
+    task.add_done_callback(_rescore_tasks.discard)
 
 
 @router.get("/")
@@ -41,6 +77,93 @@ async def list_risk_assessments(
     return [assessment.to_dict() for assessment in assessments]
 
 
+@router.get("/config/rules")
+async def list_rule_sets(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """List versioned risk rule sets."""
+    result = await db.execute(select(RiskRuleSet).order_by(desc(RiskRuleSet.version)))
+    return [rule_set.to_dict() for rule_set in result.scalars().all()]
+
+
+@router.post("/config/rules")
+async def create_rule_set(
+    rule_set_in: RiskRuleSetCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.EDITOR_IN_CHIEF))
+):
+    """Create a new rule set version. Omitted fields inherit the built-in defaults."""
+    rules = risk_service.build_rules(rule_set_in.model_dump(exclude={"name", "description"}))
+    rules["classification_thresholds"] = sorted(
+        rules["classification_thresholds"], key=lambda band: band[0], reverse=True
+    )
+
+    latest_version = await db.scalar(select(func.max(RiskRuleSet.version))) or 0
+    rule_set = RiskRuleSet(
+        version=latest_version + 1,
+        name=rule_set_in.name,
+        description=rule_set_in.description,
+        factor_weights=rules["factor_weights"],
+        dimension_weights=rules["dimension_weights"],
+        classification_thresholds=rules["classification_thresholds"],
+        review_threshold=rules["review_threshold"],
+        lexicon=rules["lexicon"],
+        created_by=current_user.id,
+    )
+    db.add(rule_set)
+    await db.commit()
+    await db.refresh(rule_set)
+    return rule_set.to_dict()
+
+
+@router.post("/config/rules/{version}/activate")
+async def activate_rule_set(
+    version: int,
+    rescore: bool = True,
+    reanalyze: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.EDITOR_IN_CHIEF))
+):
+    """
+    Activate a rule set version and (by default) re-score stored assessments in the background.
+    Set reanalyze=true when the lexicon changed so factors are re-detected from article text.
+    """
+    result = await db.execute(select(RiskRuleSet).where(RiskRuleSet.version == version))
+    rule_set = result.scalar_one_or_none()
+    if not rule_set:
+        raise HTTPException(status_code=404, detail="Rule set not found")
+
+    await db.execute(update(RiskRuleSet).where(RiskRuleSet.is_active == True).values(is_active=False))
+    rule_set.is_active = True
+    rule_set.activated_at = datetime.utcnow()
+    await db.commit()
+    risk_service.invalidate_rules_cache()
+
+    if rescore:
+        _schedule_rescore(version, reanalyze)
+
+    return {**rule_set.to_dict(), "rescoreScheduled": rescore}
+
+
+@router.post("/rescore")
+async def rescore_assessments(
+    reanalyze: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.EDITOR_IN_CHIEF))
+):
+    """Re-score stale assessments against the active rule set in the background."""
+    risk_service.invalidate_rules_cache()
+    rules = await risk_service.get_active_rules(db)
+    stale = await db.scalar(
+        select(func.count(RiskScore.id)).where(
+            (RiskScore.rule_set_version != rules["version"]) | (RiskScore.rule_set_version == None)
+        )
+    ) or 0
+    _schedule_rescore(rules["version"], reanalyze)
+    return {"version": rules["version"], "stale_assessments": stale, "status": "scheduled"}
+
+
 @router.get("/{assessment_id}")
 async def get_risk_assessment(
     assessment_id: UUID,
@@ -10,6 +10,7 @@ from sqlalchemy import select, desc
 
 from app.db.base import get_db
 from app.core.config import settings
+from app.core.scheduler import notify_schedule_change
 from app.models.source import Source, SourceType, SourceTier
 from app.models.user import User, UserRole
 from app.api.v1.endpoints.auth import get_current_active_user, require_role
@@ -85,6 +86,7 @@ async def create_source(
     db.add(source)
     await db.commit()
     await db.refresh(source)
+    notify_schedule_change()
     
     return source.to_dict()
 
@@ -118,6 +120,7 @@ async def update_source(
     
     await db.commit()
     await db.refresh(source)
+    notify_schedule_change()
     
     return source.to_dict()
 
@@ -137,6 +140,7 @@ async def delete_source(
     
     await db.delete(source)
     await db.commit()
+    notify_schedule_change()
     
     return {"message": "Source deleted successfully"}
 
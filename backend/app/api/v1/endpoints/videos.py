@@ -10,6 +10,7 @@ from sqlalchemy import select, desc
 
 from app.db.base import get_db
 from app.models.video import VideoJob, VideoJobStatus
+from app.services.video_job_service import ACTIVE_STATUSES
 from app.api.v1.endpoints.auth import get_current_active_user, require_role
 from app.models.user import UserRole
 
@@ -58,6 +59,7 @@ async def get_video_job(
         **job.to_dict(),
         "stage_progress": job.stage_progress,
         "error_message": job.error_message,
+        "max_retries": job.max_retries,
     }
 
 
@@ -121,6 +123,17 @@ async def cancel_video_job(
     return {"message": "Job cancelled", "job": job.to_dict()}
 
 
+@router.get("/render-farm")
+async def get_render_farm_status(
+    window_minutes: int = 60,
+    current_user = Depends(get_current_active_user)
+):
+    """Render worker capacity, queue depth and queue latency (p50/p95) over the window."""
+    from app.services.render_farm import render_farm
+
+    return await render_farm.status(window_minutes=min(window_minutes, 1440))
+
+
 @router.get("/pipeline/status")
 async def get_pipeline_status(
     db: AsyncSession = Depends(get_db),
@@ -133,7 +146,8 @@ async def get_pipeline_status(
     return {
         "total_jobs": len(jobs),
         "queued": sum(1 for j in jobs if j.status == VideoJobStatus.QUEUED),
-        "processing": sum(1 for j in jobs if j.status == VideoJobStatus.PROCESSING),
+        "processing": sum(1 for j in jobs if j.status in ACTIVE_STATUSES),
+        "retrying": sum(1 for j in jobs if j.status == VideoJobStatus.QUEUED and j.next_attempt_at),
         "completed": sum(1 for j in jobs if j.status == VideoJobStatus.COMPLETED),
         "failed": sum(1 for j in jobs if j.status == VideoJobStatus.FAILED),
     }
@@ -63,6 +63,43 @@ class Settings(BaseSettings):
     MAX_ARTICLES_PER_FETCH: int = 50
     REQUEST_TIMEOUT_SECONDS: int = 30
     
+    # Scheduler
+    SCHEDULER_RESYNC_SECONDS: int = 300  # Reload schedules to pick up edits from other replicas
+    SCHEDULER_LOCK_RETRY_SECONDS: int = 30  # Retry delay when another replica holds a row lease
+    CAMPAIGN_MAX_CONCURRENCY: int = 2  # Campaigns run concurrently per replica
+    CAMPAIGN_TIMEOUT_SECONDS: int = 1800  # Per-run limit before a campaign is abandoned
+    CAMPAIGN_HISTORY_LIMIT: int = 50  # Run records kept in Campaign.history
+
+    # Video Render Workers
+    VIDEO_WORKER_EMBEDDED: bool = True  # Run a render worker inside the API process; disable when using app.workers.video_worker
+    VIDEO_WORKER_CONCURRENCY: int = 1  # Jobs rendered at once per worker process
+    VIDEO_WORKER_POLL_SECONDS: int = 5  # Idle wait between queue polls
+    VIDEO_WORKER_HEARTBEAT_SECONDS: int = 15  # Lease refresh interval while a job is running
+    VIDEO_JOB_STALE_SECONDS: int = 120  # Leases older than this are considered abandoned and requeued
+    VIDEO_JOB_RETRY_BASE_SECONDS: int = 30  # Backoff base; doubles with each retry
+
+    # Render Farm (short clip renders offloaded to app.workers.render_worker processes)
+    RENDER_FARM_ENABLED: bool = False  # Requires VIDEO_OUTPUT_DIR on storage shared with every render worker
+    RENDER_WORKER_CONCURRENCY: int = 0  # Renders in flight per worker process; 0 = CPU count
+    RENDER_WORKER_POLL_SECONDS: int = 2  # Idle wait between queue polls, also the waiter's poll interval
+    RENDER_WORKER_HEARTBEAT_SECONDS: int = 15
+    RENDER_TASK_STALE_SECONDS: int = 120  # Tasks/workers silent for longer are considered dead
+    RENDER_TASK_WAIT_SECONDS: int = 1800  # Give up waiting for a farm render after this long
+
+    # Pipeline Runs
+    PIPELINE_EVENT_POLL_SECONDS: int = 2  # Event stream poll interval for runs executing on other replicas
+    PIPELINE_CPU_RENDER_CONCURRENCY: int = 2  # FFmpeg renders / local SadTalker at once per process
+    PIPELINE_LLM_CONCURRENCY: int = 4  # Concurrent report and script generations
+    PIPELINE_NETWORK_CONCURRENCY: int = 8  # Concurrent TTS, image and upload requests
+
+    # Tracing (pipeline timing spans; exported as OTLP/HTTP JSON when an endpoint is set)
+    OTEL_EXPORTER_OTLP_ENDPOINT: Optional[str] = None  # e.g. http://otel-collector:4318
+    OTEL_SERVICE_NAME: str = "geopolitical-backend"
+
+    # Artifact Store
+    ARTIFACT_STORE_MAX_BYTES: int = 20 * 1024 ** 3  # Unpinned media is evicted LRU-first above this size
+    ARTIFACT_GC_INTERVAL_SECONDS: int = 3600
+    
     # Risk Governance
     SAFE_MODE_ENABLED: bool = False
     RISK_THRESHOLD: int = 40
@@ -91,10 +128,20 @@ class Settings(BaseSettings):
     
     # Video Production
     VIDEO_OUTPUT_DIR: str = "./output/videos"
+    FFMPEG_MAX_CONCURRENCY: int = 0  # Concurrent FFmpeg renders per process; 0 = CPU count
+    VIDEO_RENDER_MODE: str = "segmented"  # "segmented" (scenes in parallel + concat) or "single" (one filter graph)
+    AUDIO_LOUDNESS_TARGET: float = -14.0  # Integrated loudness of mastered narration (LUFS)
+    AUDIO_TRUE_PEAK: float = -1.0  # Mastered true-peak ceiling (dBTP)
+    AUDIO_MUSIC_LOUDNESS: float = -32.0  # Music bed level before ducking under narration (LUFS)
     TTS_ENGINE: str = "edge_tts"  # "elevenlabs", "edge_tts", "piper", or "gtts"
     ELEVENLABS_API_KEY: Optional[str] = None
     EDGE_TTS_VOICE: str = "en-US-GuyNeural"
     PIPER_TTS_MODEL: str = "en_US-lessac-medium"
+    PIPER_WORKERS: int = 1  # Persistent Piper processes, each holding the voice model in memory
+    PIPER_DATA_DIR: str = "."  # Where Piper voices are looked up and downloaded
+    TTS_CONCURRENCY: int = 4  # Scene clips synthesized at once per narration
+    TTS_SENTENCE_CACHE: bool = True  # Synthesize (and cache) narration sentence by sentence
+    TTS_CACHE_MAX_BYTES: int = 2 * 1024 ** 3  # Unpinned audio is evicted LRU-first above this size
     
     # Avatar / Lip-Sync
     AVATAR_ENGINE: str = "local"  # "local" (SadTalker), "did", or "heygen"
@@ -2,13 +2,14 @@
 Background Task Scheduler for Source Polling
 """
 import asyncio
+import heapq
+import itertools
 import logging
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, List, Optional, Tuple
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 try:
     from croniter import croniter
@@ -28,40 +29,193 @@ from app.services.risk_service import risk_service
 
 logger = logging.getLogger(__name__)
 
+# Scheduled item kinds tracked by the heap
+SOURCE = "source"
+AUTOMATION = "automation"
+CAMPAIGN = "campaign"
+
+CAMPAIGN_INTERVALS = {
+    "hourly": timedelta(hours=1),
+    "6h": timedelta(hours=6),
+    "12h": timedelta(hours=12),
+    "daily": timedelta(hours=24),
+}
+
+# Set whenever a schedule row changes so the loop rebuilds its heap immediately
+_schedule_changed = asyncio.Event()
+
+
+def notify_schedule_change():
+    """Wake the scheduler after a source, automation schedule or campaign was edited."""
+    _schedule_changed.set()
+
+
+class ScheduleHeap:
+    """Min-heap of (due_at, kind, id) entries; one entry per scheduled row."""
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int, str, Any]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def clear(self):
+        self._heap.clear()
+
+    def push(self, due_at: datetime, kind: str, item_id: Any):
+        heapq.heappush(self._heap, (due_at, next(self._counter), kind, item_id))
+
+    def pop_due(self, now: datetime) -> List[Tuple[str, Any]]:
+        """Remove and return every entry due at or before now, earliest first."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, kind, item_id = heapq.heappop(self._heap)
+            due.append((kind, item_id))
+        return due
+
+    def seconds_until_next(self, now: datetime) -> Optional[float]:
+        if not self._heap:
+            return None
+        return max(0.0, (self._heap[0][0] - now).total_seconds())
+
+
+def _campaign_interval(campaign) -> timedelta:
+    return CAMPAIGN_INTERVALS.get(campaign.schedule_type, timedelta(hours=24))
+
+
+def _next_due_at(kind: str, row, now: datetime) -> Optional[datetime]:
+    """Next time a row is due, computed from its last run; None means never."""
+    if kind == SOURCE:
+        if not row.last_fetch_at:
+            return now
+        return row.last_fetch_at + timedelta(minutes=row.fetch_interval_minutes or settings.RSS_FETCH_INTERVAL_MINUTES)
+    if kind == AUTOMATION:
+        if not row.last_run_at:
+            return now
+        return _compute_next_run(row, row.last_run_at)
+    if kind == CAMPAIGN:
+        if not row.last_run_at:
+            return now
+        return row.last_run_at + _campaign_interval(row)
+    return None
+
+
+def _scheduled_models():
+    from app.models.automation import AutomationSchedule
+
+    return {
+        SOURCE: (Source, Source.is_enabled),
+        AUTOMATION: (AutomationSchedule, AutomationSchedule.is_enabled),
+        CAMPAIGN: (Campaign, Campaign.is_active),
+    }
+
+
+async def _load_schedule_heap(heap: ScheduleHeap):
+    """Rebuild the heap with one query per scheduled table."""
+    heap.clear()
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        for kind, (model, enabled_column) in _scheduled_models().items():
+            result = await db.execute(select(model).where(enabled_column == True))
+            for row in result.scalars().all():
+                due_at = _next_due_at(kind, row, now)
+                if due_at is not None:
+                    heap.push(due_at, kind, row.id)
+    logger.info(f"Scheduler loaded {len(heap)} scheduled items")
+
+
+async def _claim_lease(kind: str, item_id, now: datetime) -> Tuple[bool, Optional[datetime]]:
+    """
+    Claim one due run of a row across replicas.
+    The row is locked with SELECT ... FOR UPDATE SKIP LOCKED and its last-run marker is advanced
+    before the lock is released, so any other replica that reaches the row afterwards sees it as
+    not due. Returns (claimed, next_due_at).
+    """
+    model, enabled_column = _scheduled_models()[kind]
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(model)
+            .where(model.id == item_id, enabled_column == True)
+            .with_for_update(skip_locked=True)
+        )
+        row = result.scalar_one_or_none()
+        if row is None:
+            # Either disabled/deleted or another replica holds the lease right now
+            exists = await db.scalar(select(model.id).where(model.id == item_id, enabled_column == True))
+            retry_at = now + timedelta(seconds=settings.SCHEDULER_LOCK_RETRY_SECONDS) if exists else None
+            return False, retry_at
+
+        due_at = _next_due_at(kind, row, now)
+        if due_at is None or due_at > now:
+            await db.rollback()
+            return False, due_at
+
+        if kind == SOURCE:
+            row.last_fetch_at = now
+        else:
+            row.last_run_at = now
+            if kind == AUTOMATION:
+                row.run_count = (row.run_count or 0) + 1
+                row.next_run_at = _compute_next_run(row, now)
+            else:
+                row.next_run_at = now + _campaign_interval(row)
+        next_due = _next_due_at(kind, row, now)
+        await db.commit()
+        return True, next_due
+
+
+async def _run_scheduled_item(kind: str, item_id):
+    """Execute a claimed run in its own session."""
+    async with AsyncSessionLocal() as db:
+        if kind == SOURCE:
+            from app.services.source_service import source_service
+            await source_service.fetch_from_source(item_id, db)
+        elif kind == AUTOMATION:
+            await _run_automation_schedule(item_id, db)
+        elif kind == CAMPAIGN:
+            await _run_campaign(item_id, db)
+
+
 async def poll_sources_task():
-    """Periodically check and poll enabled sources and automation schedules."""
+    """
+    Scheduler loop: sleeps until the earliest due source, automation schedule or campaign,
+    claims it with a row lease and runs it. Wakes early when schedules change and
+    periodically resyncs to pick up edits made on other replicas.
+    """
+    heap = ScheduleHeap()
+    next_resync = datetime.min
+
     while True:
         try:
-            async with AsyncSessionLocal() as db:
-                # Keep legacy polling for now
-                await poll_active_sources(db)
-                # Process dynamic automation schedules
-                await process_automation_schedules(db)
-                # Process autonomous content campaigns
-                await process_campaign_schedules(db)
+            now = datetime.utcnow()
+            if _schedule_changed.is_set() or now >= next_resync:
+                _schedule_changed.clear()
+                await _load_schedule_heap(heap)
+                next_resync = now + timedelta(seconds=settings.SCHEDULER_RESYNC_SECONDS)
+
+            for kind, item_id in heap.pop_due(now):
+                claimed, next_due = await _claim_lease(kind, item_id, now)
+                if claimed:
+                    try:
+                        await _run_scheduled_item(kind, item_id)
+                    except Exception as e:
+                        logger.error(f"Scheduled {kind} {item_id} failed: {e}")
+                if next_due is not None:
+                    heap.push(next_due, kind, item_id)
         except Exception as e:
             logger.error(f"Error in poll_sources_task: {e}")
-        
-        # Check every minute
-        await asyncio.sleep(60)
-
-async def poll_active_sources(db: AsyncSession):
-    """Business logic for legacy polling of active sources."""
-    result = await db.execute(
-        select(Source).where(Source.is_enabled == True)
-    )
-    sources = result.scalars().all()
-    
-    now = datetime.utcnow()
-    from app.services.source_service import source_service
-    
-    for source in sources:
-        if not source.last_fetch_at or (now - source.last_fetch_at) >= timedelta(minutes=source.fetch_interval_minutes):
-            logger.info(f"Legacy auto-polling source: {source.name}")
-            try:
-                await source_service.fetch_from_source(source.id, db)
-            except Exception as e:
-                logger.error(f"Failed to legacy auto-poll source {source.name}: {e}")
+
+        now = datetime.utcnow()
+        sleep_for = (next_resync - now).total_seconds()
+        until_next = heap.seconds_until_next(now)
+        if until_next is not None:
+            sleep_for = min(sleep_for, until_next)
+        try:
+            await asyncio.wait_for(_schedule_changed.wait(), timeout=max(sleep_for, 0.5))
+        except asyncio.TimeoutError:
+            pass
+
 
 def _compute_next_run(schedule, reference: datetime) -> Optional[datetime]:
     if schedule.interval_minutes:
@@ -101,38 +255,28 @@ def _should_run(schedule, now: datetime) -> bool:
     return False
 
 
-async def process_automation_schedules(db: AsyncSession):
-    """Dynamically process automation schedules based on database configuration."""
-    from app.models.automation import AutomationSchedule, AutomationTaskType
+async def _run_automation_schedule(schedule_id, db: AsyncSession):
+    """Execute a claimed automation schedule and record the outcome."""
+    from app.models.automation import AutomationSchedule
     from app.services.source_service import source_service
-    
-    result = await db.execute(
-        select(AutomationSchedule).where(AutomationSchedule.is_enabled == True)
-    )
-    schedules = result.scalars().all()
-    
-    now = datetime.utcnow()
-    
-    for schedule in schedules:
-        if not _should_run(schedule, now):
-            continue
 
-        logger.info(f"Executing automation schedule: {schedule.name} (Type: {schedule.task_type})")
-        schedule.run_count += 1
-        schedule.last_run_at = now
-        schedule.next_run_at = _compute_next_run(schedule, now)
+    result = await db.execute(select(AutomationSchedule).where(AutomationSchedule.id == schedule_id))
+    schedule = result.scalar_one_or_none()
+    if not schedule:
+        return
 
-        try:
-            await _execute_automation_task(schedule, db, source_service)
-            schedule.success_count += 1
-            await db.commit()
-        except Exception as e:
-            logger.error(f"Failed to execute schedule {schedule.name}: {e}")
+    logger.info(f"Executing automation schedule: {schedule.name} (Type: {schedule.task_type})")
+    try:
+        await _execute_automation_task(schedule, db, source_service)
+        schedule.success_count += 1
+        await db.commit()
+    except Exception as e:
+        logger.error(f"Failed to execute schedule {schedule.name}: {e}")
+        await db.rollback()
+        schedule = await db.get(AutomationSchedule, schedule_id)
+        if schedule:
             schedule.failure_count += 1
-            try:
-                await db.commit()
-            except Exception:
-                await db.rollback()
+            await db.commit()
 
 
 async def _execute_automation_task(schedule, db: AsyncSession, source_service):
@@ -160,55 +304,11 @@ async def _execute_automation_task(schedule, db: AsyncSession, source_service):
         raise ValueError(f"Unknown automation task type: {schedule.task_type}")
 
 
-async def process_campaign_schedules(db: AsyncSession):
-    """Dynamically process autonomous content campaigns."""
-    from app.services.pipeline_service import pipeline_service
-    
-    result = await db.execute(
-        select(Campaign).where(Campaign.is_active == True)
-    )
-    campaigns = result.scalars().all()
-    
-    now = datetime.utcnow()
-    
-    for campaign in campaigns:
-        should_run = False
-        if not campaign.last_run_at:
-            should_run = True
-        else:
-            # Simple interval check based on schedule_type
-            interval = timedelta(hours=24) # Default daily
-            if campaign.schedule_type == "hourly":
-                interval = timedelta(hours=1)
-            elif campaign.schedule_type == "6h":
-                interval = timedelta(hours=6)
-            elif campaign.schedule_type == "12h":
-                interval = timedelta(hours=12)
-            
-            if (now - campaign.last_run_at) >= interval:
-                should_run = True
-                
-        if should_run:
-            logger.info(f"Campaign Triggered: {campaign.name} (Profile: {campaign.profile_id})")
-            try:
-                # Process each category in the campaign
-                categories = campaign.categories or ["General"]
-                for cat in categories:
-                    logger.info(f"Running autonomous pipeline for Campaign {campaign.name}: Category={cat}")
-                    await pipeline_service.run_full_pipeline(
-                        db=db,
-                        category=cat,
-                        profile_id=campaign.profile_id,
-                        generate_short=True,
-                        generate_presenter=False, # Focus on rapid short clips for autonomous mode
-                    )
-                
-                campaign.last_run_at = now
-                await db.commit()
-                logger.info(f"Campaign {campaign.name} completed successfully.")
-            except Exception as e:
-                logger.error(f"Failed to execute Campaign {campaign.name}: {e}")
-                await db.rollback()
+async def _run_campaign(campaign_id, db: AsyncSession):
+    """Hand a claimed campaign to the campaign worker pool without blocking the loop."""
+    from app.services.campaign_service import campaign_service
+
+    campaign_service.dispatch(campaign_id, trigger="schedule")
 
 
 async def _get_system_user_id(db: AsyncSession) -> Optional[str]:
@@ -222,27 +322,35 @@ async def _get_system_user_id(db: AsyncSession) -> Optional[str]:
     return str(fallback.id) if fallback else None
 
 
-async def _run_risk_assessment_automation(db: AsyncSession):
-    """Schedule risk assessments for any articles lacking a score."""
+async def _run_risk_assessment_automation(db: AsyncSession, batch_size: int = 500):
+    """Score any articles that slipped past the ingestion-time risk pass."""
+    from app.models.risk import RiskScore
+
     user_id = await _get_system_user_id(db)
     if not user_id:
         logger.warning("Risk automation skipped because no system user exists.")
         return
 
-    result = await db.execute(
-        select(NormalizedArticle).options(selectinload(NormalizedArticle.risk_score))
-    )
-    articles = result.scalars().all()
     created = 0
-
-    for article in articles:
-        if article.risk_score is not None:
-            continue
+    while True:
+        result = await db.execute(
+            select(NormalizedArticle)
+            .outerjoin(RiskScore, NormalizedArticle.id == RiskScore.article_id)
+            .where(RiskScore.id == None)
+            .limit(batch_size)
+        )
+        articles = result.scalars().all()
+        if not articles:
+            break
         try:
-            await risk_service.assess_article(article, user_id, db, settings.SAFE_MODE_ENABLED)
-            created += 1
+            risk_scores = await risk_service.score_ingested_articles(articles, db, assessed_by=user_id)
+            await db.commit()
+            risk_service.enqueue_deep_checks(risk_scores)
+            created += len(risk_scores)
         except Exception as exc:
-            logger.error(f"Automated risk assessment failed for article {article.id}: {exc}")
+            logger.error(f"Automated risk assessment batch failed: {exc}")
+            await db.rollback()
+            break
 
     logger.info(f"Risk automation created {created} new assessments.")
 
@@ -0,0 +1,182 @@
+"""
+Lightweight Tracing
+Hierarchical timing spans for pipeline runs. A trace is bound to the current asyncio
+context, so spans opened in tasks spawned by a stage (gather, create_task) nest under
+that stage automatically. Outside of a trace, `span()` is a no-op.
+
+Finished traces are plain lists of span dicts (stored on PipelineRun.spans) and can be
+converted to OTLP/JSON and pushed to any OpenTelemetry collector.
+"""
+import contextvars
+import logging
+import math
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_current_trace: contextvars.ContextVar[Optional["Trace"]] = contextvars.ContextVar("current_trace", default=None)
+_current_span: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar("current_span", default=None)
+
+
+class Trace:
+    """Collects the spans of one pipeline run."""
+
+    def __init__(self, name: str, trace_id: Optional[str] = None):
+        self.name = name
+        self.trace_id = trace_id or os.urandom(16).hex()
+        self.spans: List[Dict[str, Any]] = []
+
+    @staticmethod
+    def new_span_id() -> str:
+        return os.urandom(8).hex()
+
+
+@contextmanager
+def start_trace(name: str, trace_id: Optional[str] = None) -> Iterator[Trace]:
+    """Bind a new trace to the current context; the body runs inside its root span."""
+    trace = Trace(name, trace_id)
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(None)
+    try:
+        with span(name):
+            yield trace
+    finally:
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Dict[str, Any]]]:
+    """
+    Time a block as a child of the current span. Yields the span dict (or None when no
+    trace is active) so callers can attach attributes discovered while it runs.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    record: Dict[str, Any] = {
+        "span_id": trace.new_span_id(),
+        "parent_id": parent["span_id"] if parent else None,
+        "name": name,
+        "start": time.time(),
+        "duration_ms": None,
+        "status": "ok",
+        "attributes": {k: v for k, v in attributes.items() if v is not None},
+    }
+    token = _current_span.set(record)
+    started = time.perf_counter()
+    try:
+        yield record
+    except BaseException as e:
+        record["status"] = "error"
+        record["attributes"]["error"] = str(e) or e.__class__.__name__
+        raise
+    finally:
+        record["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        _current_span.reset(token)
+        trace.spans.append(record)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def annotate(**attributes: Any):
+    """Attach attributes (e.g. cache_hit=True) to the innermost open span, if any."""
+    record = _current_span.get()
+    if record is not None:
+        record["attributes"].update({k: v for k, v in attributes.items() if v is not None})
+
+
+def flame_view(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Spans ordered by start time with their depth and offset from the trace start, for flame charts."""
+    if not spans:
+        return []
+    by_id = {s["span_id"]: s for s in spans}
+    origin = min(s["start"] for s in spans)
+
+    def depth(s: Dict[str, Any]) -> int:
+        level = 0
+        while s.get("parent_id") in by_id:
+            s = by_id[s["parent_id"]]
+            level += 1
+        return level
+
+    return [
+        {**s, "depth": depth(s), "offset_ms": round((s["start"] - origin) * 1000, 2)}
+        for s in sorted(spans, key=lambda s: s["start"])
+    ]
+
+
+# ─── Export ───────────────────────────────────────────────────────────────
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(trace_id: str, spans: List[Dict[str, Any]], service_name: Optional[str] = None) -> Dict[str, Any]:
+    """Convert stored spans to an OTLP/JSON ExportTraceServiceRequest."""
+    otlp_spans = []
+    for s in spans:
+        start_ns = int(s["start"] * 1e9)
+        end_ns = start_ns + int((s.get("duration_ms") or 0) * 1e6)
+        otlp_span = {
+            "traceId": trace_id,
+            "spanId": s["span_id"],
+            "name": s["name"],
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(start_ns),
+            "endTimeUnixNano": str(end_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in (s.get("attributes") or {}).items()],
+            "status": {"code": 2 if s.get("status") == "error" else 1},
+        }
+        if s.get("parent_id"):
+            otlp_span["parentSpanId"] = s["parent_id"]
+        otlp_spans.append(otlp_span)
+
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [
+                {"key": "service.name", "value": {"stringValue": service_name or settings.OTEL_SERVICE_NAME}},
+            ]},
+            "scopeSpans": [{"scope": {"name": "app.pipeline"}, "spans": otlp_spans}],
+        }]
+    }
+
+
+async def export_trace(trace_id: str, spans: List[Dict[str, Any]]):
+    """Push a finished trace to OTEL_EXPORTER_OTLP_ENDPOINT (OTLP/HTTP JSON), if configured."""
+    endpoint = settings.OTEL_EXPORTER_OTLP_ENDPOINT
+    if not endpoint or not spans:
+        return
+    try:
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            response = await client.post(f"{endpoint.rstrip('/')}/v1/traces", json=to_otlp(trace_id, spans))
+            response.raise_for_status()
+    except Exception as e:
+        logger.warning(f"Failed to export trace {trace_id}: {e}")
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile; None for an empty list."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[min(index, len(ordered) - 1)]
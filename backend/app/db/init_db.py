@@ -37,6 +37,40 @@ async def init_db():
     logger.info("Database tables created")
 
 
+async def load_platform_settings(db: AsyncSession):
+    """Load API keys and provider settings stored in the database into the in-memory settings."""
+    from sqlalchemy import select
+    from app.models.setting import PlatformSetting
+
+    result = await db.execute(select(PlatformSetting).where(PlatformSetting.category == "security"))
+    for setting in result.scalars().all():
+        if setting.key == "ai_provider":
+            settings.AI_PROVIDER = setting.value
+        elif setting.key == "ollama_base_url":
+            settings.OLLAMA_BASE_URL = setting.value
+        elif setting.key == "ollama_model":
+            settings.OLLAMA_MODEL = setting.value
+        elif setting.key == "gemini_api_key":
+            settings.GEMINI_API_KEY = setting.value
+        elif setting.key == "llm_model":
+            settings.LLM_MODEL = setting.value
+        elif setting.key == "elevenlabs_api_key":
+            settings.ELEVENLABS_API_KEY = setting.value
+        elif setting.key == "did_api_key":
+            settings.DID_API_KEY = setting.value
+        elif setting.key == "heygen_api_key":
+            settings.HEYGEN_API_KEY = setting.value
+
+    if settings.AI_PROVIDER == "gemini" and settings.GEMINI_API_KEY:
+        try:
+            import google.generativeai as genai
+            genai.configure(api_key=settings.GEMINI_API_KEY)
+            from app.services.ai_service import ai_service
+            ai_service.model = genai.GenerativeModel(settings.LLM_MODEL)
+        except Exception as e:
+            logger.error(f"Failed to configure Gemini generated model on startup: {e}")
+
+
 async def create_initial_data(db: AsyncSession):
     """Create initial seed data."""
     # Create default roles
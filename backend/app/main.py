@@ -25,7 +25,7 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
     logger.info("Starting up Geopolitical Intelligence Platform...")
-    from app.db.init_db import create_initial_data
+    from app.db.init_db import create_initial_data, load_platform_settings
     from app.db.base import AsyncSessionLocal
     
     await init_db()
@@ -34,38 +34,10 @@ async def lifespan(app: FastAPI):
     async with AsyncSessionLocal() as db:
         from sqlalchemy import select
         from app.models.user import User
-        from app.models.setting import PlatformSetting
-        from app.core.config import settings as app_settings
         
         # Load API keys from database into in-memory settings
-        result = await db.execute(select(PlatformSetting).where(PlatformSetting.category == "security"))
-        for setting in result.scalars().all():
-            if setting.key == "ai_provider":
-                app_settings.AI_PROVIDER = setting.value
-            elif setting.key == "ollama_base_url":
-                app_settings.OLLAMA_BASE_URL = setting.value
-            elif setting.key == "ollama_model":
-                app_settings.OLLAMA_MODEL = setting.value
-            elif setting.key == "gemini_api_key":
-                app_settings.GEMINI_API_KEY = setting.value
-            elif setting.key == "llm_model":
-                app_settings.LLM_MODEL = setting.value
-            elif setting.key == "elevenlabs_api_key":
-                app_settings.ELEVENLABS_API_KEY = setting.value
-            elif setting.key == "did_api_key":
-                app_settings.DID_API_KEY = setting.value
-            elif setting.key == "heygen_api_key":
-                app_settings.HEYGEN_API_KEY = setting.value
-
-        if app_settings.AI_PROVIDER == "gemini" and app_settings.GEMINI_API_KEY:
-            try:
-                import google.generativeai as genai
-                genai.configure(api_key=app_settings.GEMINI_API_KEY)
-                from app.services.ai_service import ai_service
-                ai_service.model = genai.GenerativeModel(app_settings.LLM_MODEL)
-            except Exception as e:
-                logger.error(f"Failed to configure Gemini generated model on startup: {e}")
-                
+        await load_platform_settings(db)
+
         result = await db.execute(select(User).limit(1))
         if not result.scalar_one_or_none():
             logger.info("Seeding initial data...")
@@ -80,10 +52,36 @@ async def lifespan(app: FastAPI):
     from app.core.scheduler import poll_sources_task
     asyncio.create_task(poll_sources_task())
     logger.info("Background scheduler started")
+
+    # Start deferred risk deep-check consumer
+    from app.services.risk_service import risk_service
+    asyncio.create_task(risk_service.run_deep_check_worker())
+    logger.info("Risk deep-check worker started")
+
+    # Detect FFmpeg version, encoders and filters once instead of on every render
+    from app.services.media_probe import media_probe
+    await media_probe.capabilities()
+
+    # Keep cached media under its size budget
+    from app.services.artifact_store import artifact_store
+    asyncio.create_task(artifact_store.run_gc_loop())
+    logger.info("Artifact garbage collector started")
+
+    # Render queued video jobs in-process unless dedicated workers are deployed
+    if settings.VIDEO_WORKER_EMBEDDED:
+        from app.workers.video_worker import run_worker
+        asyncio.create_task(run_worker())
+        logger.info("Embedded video render worker started")
+
+    # Load the offline voice before the first narration needs it
+    from app.services.piper_pool import piper_pool
+    if settings.TTS_ENGINE == "piper":
+        asyncio.create_task(piper_pool.warm(settings.PIPER_TTS_MODEL))
     
     yield
     # Shutdown
     logger.info("Shutting down...")
+    await piper_pool.shutdown()
 
 
 app = FastAPI(
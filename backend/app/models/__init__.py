@@ -9,7 +9,7 @@ from app.models.entity import Entity, EntityType, ArticleEntity
 
 from app.models.claim import Claim, ClaimStatus
 from app.models.contradiction import Contradiction, ContradictionStatus
-from app.models.risk import RiskScore, RiskDimension
+from app.models.risk import RiskScore, RiskDimension, RiskRuleSet
 from app.models.eri import ERIAssessment, ERIDimension, ERIClassification
 
 from app.models.script import Script, ScriptSegment, ScriptStatus, ScriptLayer
@@ -20,6 +20,9 @@ from app.models.brief import WeeklyBrief
 from app.models.automation import AutomationSchedule, AutomationTaskType
 from app.models.profile import Profile
 from app.models.campaign import Campaign
+from app.models.pipeline import PipelineRun
+from app.models.artifact import Artifact
+from app.models.render import RenderTask, RenderWorker
 
 __all__ = [
     "User",
@@ -43,6 +46,7 @@ __all__ = [
     "ContradictionStatus",
     "RiskScore",
     "RiskDimension",
+    "RiskRuleSet",
     "ERIAssessment",
     "ERIDimension",
     "ERIClassification",
@@ -60,4 +64,8 @@ __all__ = [
     "AutomationTaskType",
     "Profile",
     "Campaign",
+    "PipelineRun",
+    "Artifact",
+    "RenderTask",
+    "RenderWorker",
 ]
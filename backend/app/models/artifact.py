@@ -0,0 +1,47 @@
+"""
+Artifact model: index of generated media in the content-addressed artifact store.
+"""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Column, String, Text, DateTime, Integer, BigInteger
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+from app.db.base import Base
+
+
+class Artifact(Base):
+    """
+    A generated file (TTS audio, scene image, avatar video, render, thumbnail)
+    keyed by a hash of the inputs that produced it.
+    """
+    __tablename__ = "artifacts"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    key = Column(String(64), unique=True, nullable=False, index=True)  # sha256 of kind + inputs
+    kind = Column(String(20), nullable=False, index=True)  # audio, image, avatar, short_clip, presenter_video, thumbnail
+
+    path = Column(Text, nullable=False)
+    url = Column(Text)
+    size_bytes = Column(BigInteger, default=0)
+    meta = Column(JSONB, default={})  # Result fields to return on a hit (duration, engine, ...)
+
+    # Pinned while > 0 (e.g. referenced by a resumable pipeline run); never garbage collected
+    ref_count = Column(Integer, default=0)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_accessed_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": str(self.id),
+            "key": self.key,
+            "kind": self.kind,
+            "path": self.path,
+            "url": self.url,
+            "sizeBytes": self.size_bytes,
+            "meta": self.meta or {},
+            "refCount": self.ref_count,
+            "createdAt": self.created_at.isoformat() if self.created_at else None,
+            "lastAccessedAt": self.last_accessed_at.isoformat() if self.last_accessed_at else None,
+        }
@@ -59,5 +59,6 @@ class Campaign(Base):
             "scheduleConfig": self.schedule_config,
             "lastRunAt": self.last_run_at.isoformat() if self.last_run_at else None,
             "nextRunAt": self.next_run_at.isoformat() if self.next_run_at else None,
+            "history": self.history or [],
             "createdAt": self.created_at.isoformat() if self.created_at else None,
         }
@@ -0,0 +1,69 @@
+"""
+Pipeline run model: one record per background execution of the content pipeline.
+"""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+from app.db.base import Base
+
+
+class PipelineRun(Base):
+    """
+    Tracks a pipeline execution started from the API or a campaign.
+    `steps` mirrors the pipeline_result["steps"] structure and is updated as each step finishes.
+    """
+    __tablename__ = "pipeline_runs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # queued, running, completed, failed
+    status = Column(String(20), default="queued", index=True)
+
+    # Request parameters
+    category = Column(String(100), nullable=False)
+    region = Column(String(100), default="Global")
+    profile_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"))
+    params = Column(JSONB, default={})  # voice_id, generate_short, generate_presenter, distribute_to, preview
+
+    # Progress and outcome
+    current_step = Column(String(50))
+    steps = Column(JSONB, default={})
+    errors = Column(JSONB, default=[])
+    result = Column(JSONB)
+
+    # Resumption: {stage: {"outputs": {...}, "step": {...}}} for every stage that completed
+    checkpoints = Column(JSONB, default={})
+    attempts = Column(Integer, default=1)
+
+    # Timing spans of the latest attempt (see app.core.tracing)
+    trace_id = Column(String(32))
+    spans = Column(JSONB, default=[])
+
+    # Metadata
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+
+    def to_dict(self) -> dict:
+        return {
+            "id": str(self.id),
+            "status": self.status,
+            "category": self.category,
+            "region": self.region,
+            "profileId": str(self.profile_id) if self.profile_id else None,
+            "params": self.params or {},
+            "currentStep": self.current_step,
+            "steps": self.steps or {},
+            "errors": self.errors or [],
+            "result": self.result,
+            "attempts": self.attempts or 1,
+            "checkpointedStages": list((self.checkpoints or {}).keys()),
+            "traceId": self.trace_id,
+            "createdAt": self.created_at.isoformat() if self.created_at else None,
+            "startedAt": self.started_at.isoformat() if self.started_at else None,
+            "finishedAt": self.finished_at.isoformat() if self.finished_at else None,
+        }
@@ -0,0 +1,82 @@
+"""
+Render farm models: queued FFmpeg render tasks and the workers that execute them.
+"""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Column, String, Text, DateTime, Integer, Float
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+from app.db.base import Base
+
+
+class RenderTask(Base):
+    """
+    A single render (short clip, presenter composite) described by the keyword arguments
+    of the matching VideoRenderService method. Any render worker with a free slot may claim it.
+    """
+    __tablename__ = "render_tasks"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind = Column(String(30), nullable=False)  # short_clip, presenter_video
+    spec = Column(JSONB, nullable=False, default={})
+
+    # queued, running, completed, failed, cancelled
+    status = Column(String(20), default="queued", index=True)
+    priority = Column(Integer, default=0)
+
+    # Lease
+    worker_id = Column(String(100))
+    heartbeat_at = Column(DateTime, index=True)
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=3)
+
+    # Outcome
+    progress = Column(Float, default=0.0)  # 0.0 - 1.0
+    result = Column(JSONB)
+    error = Column(Text)
+
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+    def to_dict(self) -> dict:
+        latency = (self.started_at - self.created_at).total_seconds() if self.started_at and self.created_at else None
+        return {
+            "id": str(self.id),
+            "kind": self.kind,
+            "status": self.status,
+            "priority": self.priority,
+            "workerId": self.worker_id,
+            "attempts": self.attempts or 0,
+            "progress": self.progress or 0.0,
+            "result": self.result,
+            "error": self.error,
+            "queueLatencySeconds": latency,
+            "createdAt": self.created_at.isoformat() if self.created_at else None,
+            "startedAt": self.started_at.isoformat() if self.started_at else None,
+            "finishedAt": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class RenderWorker(Base):
+    """A running render worker process and its advertised capacity, refreshed every poll."""
+    __tablename__ = "render_workers"
+
+    worker_id = Column(String(100), primary_key=True)  # hostname-pid
+    hostname = Column(String(255))
+    slots = Column(Integer, default=1)
+    busy = Column(Integer, default=0)
+
+    started_at = Column(DateTime, default=datetime.utcnow)
+    heartbeat_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+    def to_dict(self) -> dict:
+        return {
+            "workerId": self.worker_id,
+            "hostname": self.hostname,
+            "slots": self.slots or 0,
+            "busy": self.busy or 0,
+            "startedAt": self.started_at.isoformat() if self.started_at else None,
+            "heartbeatAt": self.heartbeat_at.isoformat() if self.heartbeat_at else None,
+        }
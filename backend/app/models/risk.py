@@ -59,6 +59,8 @@ class RiskScore(Base):
     # Assessment metadata
     assessed_by = Column(UUID(as_uuid=True), ForeignKey("users.id"))
     assessed_at = Column(DateTime, default=datetime.utcnow)
+    rule_set_version = Column(Integer, default=0, index=True)  # RiskRuleSet.version used for scoring
+    deep_checked_at = Column(DateTime, index=True)  # Set once the deferred full-text check has run
     
     # Relationships
     article = relationship("NormalizedArticle", back_populates="risk_score")
@@ -136,6 +138,59 @@ class RiskScore(Base):
             "mitigationSuggestions": self.mitigation_suggestions or [],
             "assessedBy": str(self.assessed_by) if self.assessed_by else None,
             "assessedAt": self.assessed_at.isoformat() if self.assessed_at else None,
+            "ruleSetVersion": self.rule_set_version,
+            "deepCheckedAt": self.deep_checked_at.isoformat() if self.deep_checked_at else None,
             "createdAt": self.created_at.isoformat() if self.created_at else None,
             "updatedAt": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+
+class RiskRuleSet(Base):
+    """Versioned weights, thresholds and lexicon used by the risk scorer."""
+    __tablename__ = "risk_rule_sets"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    version = Column(Integer, nullable=False, unique=True, index=True)
+    name = Column(String(100), nullable=False)
+    description = Column(Text)
+
+    # Scoring rules
+    factor_weights = Column(JSONB, nullable=False)  # {factor: {dimension: points}}
+    dimension_weights = Column(JSONB, nullable=False)  # {dimension: weight} for the overall score
+    classification_thresholds = Column(JSONB, nullable=False)  # [[lower_bound, label], ...] descending
+    review_threshold = Column(Integer, default=40)
+    lexicon = Column(JSONB)  # {factor: [keywords]}
+
+    is_active = Column(Boolean, default=False)
+    activated_at = Column(DateTime)
+
+    # Metadata
+    created_at = Column(DateTime, default=datetime.utcnow)
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+
+    def to_rules(self) -> dict:
+        """Return the plain-dict rule set consumed by RiskService."""
+        return {
+            "version": self.version,
+            "factor_weights": self.factor_weights,
+            "dimension_weights": self.dimension_weights,
+            "classification_thresholds": self.classification_thresholds,
+            "review_threshold": self.review_threshold,
+            "lexicon": self.lexicon,
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "id": str(self.id),
+            "version": self.version,
+            "name": self.name,
+            "description": self.description,
+            "factorWeights": self.factor_weights,
+            "dimensionWeights": self.dimension_weights,
+            "classificationThresholds": self.classification_thresholds,
+            "reviewThreshold": self.review_threshold,
+            "lexicon": self.lexicon or {},
+            "isActive": self.is_active,
+            "activatedAt": self.activated_at.isoformat() if self.activated_at else None,
+            "createdAt": self.created_at.isoformat() if self.created_at else None,
+        }
@@ -57,6 +57,7 @@ class VideoJob(Base):
     
     # Processing metadata
     worker_id = Column(String(100))
+    heartbeat_at = Column(DateTime, index=True)  # Refreshed by the owning worker; stale leases are requeued
     processing_started_at = Column(DateTime)
     processing_completed_at = Column(DateTime)
     
@@ -64,6 +65,7 @@ class VideoJob(Base):
     error_message = Column(Text)
     retry_count = Column(Integer, default=0)
     max_retries = Column(Integer, default=3)
+    next_attempt_at = Column(DateTime, index=True)  # Backoff: not claimable before this time
     
     # Output metadata
     file_size_bytes = Column(Integer)
@@ -91,6 +93,10 @@ class VideoJob(Base):
             "current_stage": self.current_stage,
             "priority": self.priority,
             "output_url": self.final_video_url,
+            "worker_id": self.worker_id,
+            "retry_count": self.retry_count,
+            "heartbeat_at": self.heartbeat_at.isoformat() if self.heartbeat_at else None,
+            "next_attempt_at": self.next_attempt_at.isoformat() if self.next_attempt_at else None,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
     
@@ -3,9 +3,11 @@ AI Service - Geopolitical Intelligence Platform
 Provides journalist-quality summarization, report generation, and script creation
 using Google Gemini API.
 """
+import os
 import google.generativeai as genai
 from typing import List, Optional, Dict, Any
 from app.core.config import settings
+from app.core.tracing import span
 import structlog
 import httpx
 from bs4 import BeautifulSoup
@@ -47,7 +49,8 @@ class AIService:
         # generate_content is synchronous in the current SDK, wrapping in thread if needed
         # but for now we'll call it directly as it's usually fast enough for low concurrency
         try:
-            response = self.model.generate_content(prompt)
+            with span("llm.gemini", model=settings.LLM_MODEL, prompt_chars=len(prompt)):
+                response = self.model.generate_content(prompt)
             return response.text
         except Exception as e:
             logger.error(f"Gemini generation failed: {e}")
@@ -74,10 +77,11 @@ class AIService:
         for attempt in range(max_retries):
             try:
                 logger.info(f"Ollama Call {attempt+1}/{max_retries}: {model_name}")
-                async with httpx.AsyncClient(timeout=180.0) as client:
-                    response = await client.post(url, json=payload)
-                    response.raise_for_status()
-                    return response.json().get("response", "")
+                with span("llm.ollama", model=model_name, attempt=attempt + 1, prompt_chars=len(prompt)):
+                    async with httpx.AsyncClient(timeout=180.0) as client:
+                        response = await client.post(url, json=payload)
+                        response.raise_for_status()
+                        return response.json().get("response", "")
             except Exception as e:
                 logger.warning(f"Ollama attempt {attempt+1} failed: {e}")
                 if attempt == max_retries - 1:
@@ -482,10 +486,16 @@ REQUIRED JSON STRUCTURE:
         Fetch an image. Priority:
         1. Local Stable Diffusion API (SD.Next / A1111) if configured
         2. Free Cloud API (Pollinations.ai) as fallback
+        Results are content-addressed by prompt + provider params; the returned path is
+        in the directory of `output_path` but named after that key.
         """
         import httpx
         from urllib.parse import quote
-        
+        from app.services.artifact_store import artifact_store
+
+        output_dir = os.path.dirname(output_path) or "."
+        ext = os.path.splitext(output_path)[1] or ".png"
+
         # 1. Try Local Stable Diffusion (DirectML/CUDA) with Retry Logic
         if settings.STABLE_DIFFUSION_URL:
             import asyncio
@@ -499,23 +509,30 @@ REQUIRED JSON STRUCTURE:
                 "cfg_scale": 7,
                 "sampler_name": "Euler a"
             }
+            sd_key = artifact_store.make_key("image", provider="stable_diffusion", params=payload)
+            cached = await artifact_store.lookup(sd_key)
+            if cached:
+                return cached["path"]
+            output_path = os.path.join(output_dir, f"img_{sd_key[:32]}{ext}")
             
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    async with httpx.AsyncClient(timeout=60.0) as client:
-                        response = await client.post(sd_api_url, json=payload)
-                        if response.status_code == 200:
-                            import base64
-                            data = response.json()
-                            if "images" in data and len(data["images"]) > 0:
-                                image_data = base64.b64decode(data["images"][0])
-                                with open(output_path, "wb") as f:
-                                    f.write(image_data)
-                                logger.info(f"Generated local image via DirectML SD for: {prompt[:50]}...")
-                                return output_path
-                        else:
-                            logger.warning(f"SD.Next returned status {response.status_code} on attempt {attempt+1}")
+                    with span("image.stable_diffusion", attempt=attempt + 1):
+                        async with httpx.AsyncClient(timeout=60.0) as client:
+                            response = await client.post(sd_api_url, json=payload)
+                    if response.status_code == 200:
+                        import base64
+                        data = response.json()
+                        if "images" in data and len(data["images"]) > 0:
+                            image_data = base64.b64decode(data["images"][0])
+                            with open(output_path, "wb") as f:
+                                f.write(image_data)
+                            logger.info(f"Generated local image via DirectML SD for: {prompt[:50]}...")
+                            await artifact_store.store(sd_key, "image", output_path, meta={"provider": "stable_diffusion"})
+                            return output_path
+                    else:
+                        logger.warning(f"SD.Next returned status {response.status_code} on attempt {attempt+1}")
                 except Exception as e:
                     logger.debug(f"Local Stable Diffusion attempt {attempt+1} failed: {e}")
                     if attempt < max_retries - 1:
@@ -534,15 +551,23 @@ REQUIRED JSON STRUCTURE:
         # Use hash as random seed to avoid caching identical images
         seed = hashlib.md5(prompt.encode()).hexdigest()[:8]
         url = f"https://loremflickr.com/1080/1920/{keyword_str}?lock={int(seed, 16) % 10000}"
+
+        flickr_key = artifact_store.make_key("image", provider="loremflickr", url=url)
+        cached = await artifact_store.lookup(flickr_key)
+        if cached:
+            return cached["path"]
+        output_path = os.path.join(output_dir, f"img_{flickr_key[:32]}{ext}")
         
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(url)
-                if response.status_code == 200 and len(response.content) > 5000:
-                    with open(output_path, "wb") as f:
-                        f.write(response.content)
-                    logger.info(f"Generated fallback image via LoremFlickr for keywords: {keyword_str}")
-                    return output_path
+            with span("image.loremflickr"):
+                async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+                    response = await client.get(url)
+            if response.status_code == 200 and len(response.content) > 5000:
+                with open(output_path, "wb") as f:
+                    f.write(response.content)
+                logger.info(f"Generated fallback image via LoremFlickr for keywords: {keyword_str}")
+                await artifact_store.store(flickr_key, "image", output_path, meta={"provider": "loremflickr"})
+                return output_path
             return None
         except Exception as e:
             logger.error(f"LoremFlickr image generation failed: {e}")
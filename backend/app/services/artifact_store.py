@@ -0,0 +1,214 @@
+"""
+Artifact Store
+Content-addressed index of generated media. Services hash the inputs of an expensive
+operation (narration + voice + engine, image prompt + params, render inputs), look the
+key up before doing any work, and register what they produce. Unpinned artifacts are
+evicted least-recently-used first once the store exceeds ARTIFACT_STORE_MAX_BYTES.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.config import settings
+from app.core.tracing import annotate
+from app.db.base import AsyncSessionLocal
+from app.models.artifact import Artifact
+
+logger = logging.getLogger(__name__)
+
+GC_BATCH_SIZE = 200
+
+
+class ArtifactStore:
+    """Lookup, registration, reference counting and LRU eviction of generated files."""
+
+    def __init__(self):
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._lock_users: Dict[str, int] = {}
+
+    # ─── Keys ────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def make_key(kind: str, **inputs: Any) -> str:
+        """Stable sha256 over the artifact kind and its (JSON-serialisable) inputs."""
+        payload = json.dumps({"kind": kind, **inputs}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def file_fingerprint(path: Optional[str]) -> Optional[str]:
+        """Cheap identity for an input file: path, size and mtime."""
+        if not path or not os.path.exists(path):
+            return None
+        stat = os.stat(path)
+        return f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    @asynccontextmanager
+    async def lock(self, key: str):
+        """Serialise producers of the same key so identical concurrent requests render once."""
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._lock_users[key] -= 1
+            if not self._lock_users[key]:
+                self._lock_users.pop(key, None)
+                self._locks.pop(key, None)
+
+    # ─── Lookup / registration ───────────────────────────────────────────
+
+    async def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored result for `key` if its file still exists, else None."""
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(select(Artifact).where(Artifact.key == key))
+                artifact = result.scalar_one_or_none()
+                if not artifact:
+                    return None
+                if not os.path.exists(artifact.path):
+                    await db.delete(artifact)
+                    await db.commit()
+                    return None
+                artifact.last_accessed_at = datetime.utcnow()
+                await db.commit()
+                logger.debug(f"Artifact hit ({artifact.kind}): {artifact.path}")
+                annotate(cache_hit=True)
+                return {**(artifact.meta or {}), "path": artifact.path, "url": artifact.url, "cached": True}
+        except Exception as e:
+            logger.warning(f"Artifact lookup failed for {key[:12]}: {e}")
+            return None
+
+    async def store(
+        self,
+        key: str,
+        kind: str,
+        path: str,
+        url: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ):
+        """Register (or refresh) the file produced for `key`."""
+        try:
+            size = os.path.getsize(path)
+            meta = {k: v for k, v in (meta or {}).items() if k not in ("path", "url", "cached")}
+            meta = json.loads(json.dumps(meta, default=str))
+            now = datetime.utcnow()
+            async with AsyncSessionLocal() as db:
+                stmt = insert(Artifact).values(
+                    key=key, kind=kind, path=path, url=url, size_bytes=size, meta=meta,
+                    ref_count=0, created_at=now, last_accessed_at=now,
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Artifact.key],
+                    set_={"path": path, "url": url, "size_bytes": size, "meta": meta, "last_accessed_at": now},
+                )
+                await db.execute(stmt)
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Failed to register artifact {path}: {e}")
+
+    # ─── Reference counting ──────────────────────────────────────────────
+
+    async def retain_paths(self, paths: Iterable[str]):
+        """Pin the artifacts stored at these paths so garbage collection skips them."""
+        await self._adjust_refs(paths, 1)
+
+    async def release_paths(self, paths: Iterable[str]):
+        await self._adjust_refs(paths, -1)
+
+    async def _adjust_refs(self, paths: Iterable[str], delta: int):
+        paths = [p for p in paths if p]
+        if not paths:
+            return
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(Artifact)
+                    .where(Artifact.path.in_(paths))
+                    .values(ref_count=func.greatest(Artifact.ref_count + delta, 0))
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Failed to update artifact references: {e}")
+
+    # ─── Garbage collection ──────────────────────────────────────────────
+
+    async def usage(self) -> Dict[str, Any]:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Artifact.kind, func.count(Artifact.id), func.coalesce(func.sum(Artifact.size_bytes), 0))
+                .group_by(Artifact.kind)
+            )
+            by_kind = {kind: {"count": count, "bytes": int(size)} for kind, count, size in result.all()}
+        return {
+            "total_bytes": sum(v["bytes"] for v in by_kind.values()),
+            "max_bytes": settings.ARTIFACT_STORE_MAX_BYTES,
+            "by_kind": by_kind,
+        }
+
+    async def collect_garbage(self, max_bytes: Optional[int] = None, kind: Optional[str] = None) -> Dict[str, int]:
+        """
+        Delete unpinned artifacts, least recently used first, until the store (or just its
+        artifacts of `kind`) fits in max_bytes.
+        """
+        max_bytes = settings.ARTIFACT_STORE_MAX_BYTES if max_bytes is None else max_bytes
+        scope = [Artifact.kind == kind] if kind else []
+        removed = freed = 0
+        async with AsyncSessionLocal() as db:
+            total = (await db.execute(
+                select(func.coalesce(func.sum(Artifact.size_bytes), 0)).where(*scope)
+            )).scalar()
+            while total > max_bytes:
+                result = await db.execute(
+                    select(Artifact)
+                    .where(Artifact.ref_count <= 0, *scope)
+                    .order_by(Artifact.last_accessed_at)
+                    .limit(GC_BATCH_SIZE)
+                    .with_for_update(skip_locked=True)
+                )
+                victims = result.scalars().all()
+                if not victims:
+                    break
+                removed_before = removed
+                for artifact in victims:
+                    if total <= max_bytes:
+                        break
+                    try:
+                        if os.path.exists(artifact.path):
+                            os.remove(artifact.path)
+                    except OSError as e:
+                        logger.warning(f"Could not delete artifact {artifact.path}: {e}")
+                        continue
+                    total -= artifact.size_bytes or 0
+                    freed += artifact.size_bytes or 0
+                    removed += 1
+                    await db.delete(artifact)
+                await db.commit()
+                if removed == removed_before:
+                    break
+
+        if removed:
+            logger.info(f"Artifact GC removed {removed} {kind or 'artifact'} files ({freed / 1024 / 1024:.1f} MB)")
+        return {"removed": removed, "freed_bytes": freed}
+
+    async def run_gc_loop(self):
+        """Background task: keep the store under its size budget."""
+        while True:
+            await asyncio.sleep(settings.ARTIFACT_GC_INTERVAL_SECONDS)
+            try:
+                # The TTS cache has its own, smaller budget inside the store's
+                await self.collect_garbage(settings.TTS_CACHE_MAX_BYTES, kind="audio")
+                await self.collect_garbage()
+            except Exception as e:
+                logger.error(f"Artifact garbage collection failed: {e}")
+
+
+artifact_store = ArtifactStore()
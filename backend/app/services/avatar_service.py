@@ -16,6 +16,7 @@ from typing import Optional, Dict, Any
 
 from app.core.config import settings
 from app.core.http_client import http_client
+from app.core.tracing import span
 from app.utils.path_utils import resolve_sadtalker_dir, running_in_docker
 
 logger = logging.getLogger(__name__)
@@ -44,8 +45,26 @@ class AvatarService:
         Generate a lip-synced presenter video.
         Returns: { "path": str, "url": str, "duration_seconds": float }
         """
-        image = presenter_image or self.default_presenter
+        from app.services.artifact_store import artifact_store
 
+        image = presenter_image or self.default_presenter
+        key = artifact_store.make_key(
+            "avatar",
+            audio=artifact_store.file_fingerprint(audio_url) or audio_url,
+            image=artifact_store.file_fingerprint(image) or image,
+            engine=self.engine,
+        )
+        with span("avatar", engine=self.engine):
+            async with artifact_store.lock(key):
+                cached = await artifact_store.lookup(key)
+                if cached:
+                    return cached
+                result = await self._generate_lipsync(audio_url, image)
+                if result.get("path") and not result.get("error"):
+                    await artifact_store.store(key, "avatar", result["path"], result.get("url"), result)
+                return result
+
+    async def _generate_lipsync(self, audio_url: str, image: str) -> Dict[str, Any]:
         # --- Local SadTalker (Free, Open-Source) ---
         if self.engine == "local":
             return await self._local_generate(audio_url, image)
@@ -0,0 +1,159 @@
+"""
+Campaign Execution Service
+Runs autonomous campaigns in a bounded worker pool, each with its own session and timeout.
+"""
+import asyncio
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.base import AsyncSessionLocal
+from app.models.campaign import Campaign
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignService:
+    """Dispatches campaign runs concurrently and records them in Campaign.history."""
+
+    def __init__(self):
+        self._slots = asyncio.Semaphore(settings.CAMPAIGN_MAX_CONCURRENCY)
+        self._running: Dict[str, asyncio.Task] = {}
+
+    def is_running(self, campaign_id) -> bool:
+        return str(campaign_id) in self._running
+
+    def start(self, campaign_id, trigger: str = "schedule", generate_presenter: bool = False) -> Optional[asyncio.Task]:
+        """Start a campaign run in the background; returns None if one is already in flight."""
+        key = str(campaign_id)
+        if key in self._running:
+            logger.info(f"Campaign {key} is still running; skipping {trigger} run.")
+            return None
+
+        task = asyncio.create_task(
+            self.run_campaign(campaign_id, trigger=trigger, generate_presenter=generate_presenter)
+        )
+        self._running[key] = task
+        task.add_done_callback(lambda _: self._running.pop(key, None))
+        return task
+
+    def dispatch(self, campaign_id, trigger: str = "schedule") -> bool:
+        """Fire-and-forget variant used by the scheduler loop."""
+        return self.start(campaign_id, trigger=trigger) is not None
+
+    async def run_campaign(
+        self,
+        campaign_id,
+        trigger: str = "schedule",
+        generate_presenter: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run every category of a campaign once a worker slot is free.
+        Returns the run record that is appended to Campaign.history.
+        """
+        async with self._slots:
+            record: Dict[str, Any] = {
+                "run_id": uuid.uuid4().hex,
+                "trigger": trigger,
+                "status": "running",
+                "started_at": datetime.utcnow().isoformat(),
+                "finished_at": None,
+                "categories": [],
+            }
+
+            async with AsyncSessionLocal() as db:
+                campaign = await db.get(Campaign, campaign_id)
+                if not campaign:
+                    logger.warning(f"Campaign {campaign_id} not found; nothing to run.")
+                    return None
+                name = campaign.name
+                profile_id = campaign.profile_id
+                categories = list(campaign.categories or ["General"])
+
+                logger.info(f"Campaign Triggered: {name} (Profile: {profile_id})")
+                try:
+                    await asyncio.wait_for(
+                        self._run_categories(db, name, profile_id, categories, generate_presenter, record),
+                        timeout=settings.CAMPAIGN_TIMEOUT_SECONDS,
+                    )
+                    failed = [c for c in record["categories"] if c["status"] != "success"]
+                    record["status"] = "success" if not failed else ("failed" if len(failed) == len(categories) else "partial")
+                except asyncio.TimeoutError:
+                    logger.error(f"Campaign {name} timed out after {settings.CAMPAIGN_TIMEOUT_SECONDS}s")
+                    record["status"] = "timeout"
+                    for category in record["categories"]:
+                        if category["status"] == "running":
+                            category["status"] = "timeout"
+                            category["finished_at"] = datetime.utcnow().isoformat()
+                except Exception as e:
+                    logger.error(f"Failed to execute Campaign {name}: {e}")
+                    record["status"] = "failed"
+                    record["error"] = str(e)
+
+            record["finished_at"] = datetime.utcnow().isoformat()
+            await self._append_history(campaign_id, record)
+            logger.info(f"Campaign {name} finished with status {record['status']}.")
+            return record
+
+    async def _run_categories(self, db, name, profile_id, categories, generate_presenter, record):
+        """Run all categories as one batch: shared profile/articles, concurrent reports, one render pool."""
+        from app.services.pipeline_service import pipeline_service
+
+        outcomes = []
+        for category in categories:
+            outcome = {
+                "category": category,
+                "status": "running",
+                "started_at": datetime.utcnow().isoformat(),
+                "finished_at": None,
+                "errors": [],
+            }
+            record["categories"].append(outcome)
+            outcomes.append(outcome)
+        logger.info(f"Running autonomous batch pipeline for Campaign {name}: Categories={categories}")
+
+        try:
+            batch = await pipeline_service.run_batch_pipeline(
+                db=db,
+                targets=[(category, "Global") for category in categories],
+                profile_id=profile_id,
+                generate_short=True,
+                generate_presenter=generate_presenter,
+            )
+            record["duplicates_removed"] = batch["duplicates_removed"]
+            results = batch["results"]
+        except Exception as e:
+            logger.error(f"Campaign {name} batch failed: {e}")
+            await db.rollback()
+            results = [{"error": str(e)}] * len(categories)
+
+        for outcome, result in zip(outcomes, results):
+            short_clip = result.get("steps", {}).get("short_clip", {})
+            outcome["errors"] = ([result["error"]] if "error" in result else []) + result.get("errors", [])
+            outcome["status"] = "success" if short_clip.get("status") == "success" else "failed"
+            if short_clip.get("url"):
+                outcome["short_clip_url"] = short_clip["url"]
+            outcome["finished_at"] = datetime.utcnow().isoformat()
+
+    async def _append_history(self, campaign_id, record: Dict[str, Any]):
+        """Append a run record in a fresh session, keeping the newest CAMPAIGN_HISTORY_LIMIT entries."""
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(Campaign).where(Campaign.id == campaign_id).with_for_update()
+                )
+                campaign = result.scalar_one_or_none()
+                if not campaign:
+                    return
+                history = list(campaign.history or []) + [record]
+                campaign.history = history[-settings.CAMPAIGN_HISTORY_LIMIT:]
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Failed to record history for campaign {campaign_id}: {e}")
+
+
+campaign_service = CampaignService()
@@ -0,0 +1,169 @@
+"""
+Media Probe Service
+Process-wide caches for the facts renders keep asking about: ffprobe results (keyed on
+path + size + mtime), FFmpeg capabilities (version, encoders, filters — detected once at
+startup) and the TrueType font used for overlays (discovered once per process).
+"""
+import asyncio
+import json
+import logging
+import os
+import re
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.tracing import span
+
+logger = logging.getLogger(__name__)
+
+PROBE_CACHE_SIZE = 1024
+
+# Font file candidates and the family name libass should ask for
+FONT_CANDIDATES = {
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf": "DejaVu Sans",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf": "DejaVu Sans",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf": "Liberation Sans",
+    "/usr/share/fonts/truetype/freefont/FreeSans.ttf": "FreeSans",
+    "C:/Windows/Fonts/arial.ttf": "Arial",
+}
+
+# " V....D libx264   ..." (encoders) / " TSC zoompan  V->V  ..." (filters); legend lines use "="
+_LISTING_LINE = re.compile(r"^\s*[A-Z.|]{3,6}\s+([\w-]+)\s")
+
+
+async def _run_process(cmd: List[str], timeout: float) -> Tuple[int, str, str]:
+    """Run a short command; the process is killed on timeout or cancellation."""
+    process = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except BaseException:
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+        raise
+    return process.returncode, stdout.decode("utf-8", errors="replace"), stderr.decode("utf-8", errors="replace")
+
+
+class MediaProbeService:
+    """Cached ffprobe, FFmpeg capability detection and font discovery."""
+
+    def __init__(self):
+        self._probes: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+        self._capabilities: Optional[Dict[str, Any]] = None
+        self._capabilities_lock = asyncio.Lock()
+        self._font: Optional[str] = None
+
+    # ─── ffprobe ─────────────────────────────────────────────────────────
+
+    async def probe(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Duration, container and per-stream codec details of a media file, or None if it is
+        missing or unreadable. Results are reused until the file's size or mtime changes.
+        """
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError):
+            return None
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        cached = self._probes.get(key)
+        if cached is not None:
+            self._probes.move_to_end(key)
+            return cached
+
+        cmd = ["ffprobe", "-v", "quiet", "-print_format", "json", "-show_format", "-show_streams", path]
+        try:
+            with span("ffprobe"):
+                _, stdout, _ = await _run_process(cmd, timeout=10)
+            data = json.loads(stdout)
+        except Exception as e:
+            logger.debug(f"ffprobe failed for {path}: {e}")
+            return None
+
+        fmt = data.get("format", {})
+        result = {
+            "duration": float(fmt.get("duration") or 0),
+            "format_name": fmt.get("format_name"),
+            "bit_rate": int(fmt["bit_rate"]) if str(fmt.get("bit_rate", "")).isdigit() else None,
+            "streams": [
+                {
+                    "index": s.get("index"),
+                    "codec_type": s.get("codec_type"),
+                    "codec_name": s.get("codec_name"),
+                    "width": s.get("width"),
+                    "height": s.get("height"),
+                    "sample_rate": int(s["sample_rate"]) if str(s.get("sample_rate", "")).isdigit() else None,
+                    "channels": s.get("channels"),
+                    "duration": float(s["duration"]) if s.get("duration") else None,
+                }
+                for s in data.get("streams", [])
+            ],
+        }
+        self._probes[key] = result
+        while len(self._probes) > PROBE_CACHE_SIZE:
+            self._probes.popitem(last=False)
+        return result
+
+    async def duration(self, path: str) -> float:
+        """Media duration in seconds (0.0 when unknown)."""
+        info = await self.probe(path)
+        return info["duration"] if info else 0.0
+
+    def forget(self, path: str):
+        """Drop cached probes of a path (e.g. after rewriting it in place within the same mtime tick)."""
+        path = os.path.abspath(path)
+        for key in [k for k in self._probes if k[0] == path]:
+            del self._probes[key]
+
+    # ─── FFmpeg capabilities ─────────────────────────────────────────────
+
+    async def capabilities(self, refresh: bool = False) -> Dict[str, Any]:
+        """FFmpeg availability, version, encoders and filters; detected once per process."""
+        async with self._capabilities_lock:
+            if self._capabilities is None or refresh:
+                self._capabilities = await self._detect_capabilities()
+            return self._capabilities
+
+    async def _detect_capabilities(self) -> Dict[str, Any]:
+        capabilities: Dict[str, Any] = {"available": False, "version": None, "encoders": [], "filters": []}
+        try:
+            returncode, stdout, _ = await _run_process(["ffmpeg", "-version"], timeout=10)
+            if returncode != 0:
+                raise RuntimeError(f"ffmpeg -version exited with {returncode}")
+            first_line = stdout.split("\n")[0]
+            capabilities["available"] = True
+            capabilities["version"] = first_line.split("version")[-1].split("Copyright")[0].strip() or None
+            for listing in ("encoders", "filters"):
+                _, stdout, _ = await _run_process(["ffmpeg", "-hide_banner", f"-{listing}"], timeout=10)
+                capabilities[listing] = sorted({m.group(1) for m in map(_LISTING_LINE.match, stdout.splitlines()) if m})
+        except (FileNotFoundError, asyncio.TimeoutError, RuntimeError) as e:
+            logger.error(f"FFmpeg not found. Install it: apt-get install ffmpeg ({e})")
+            return capabilities
+        logger.info(
+            f"FFmpeg {capabilities['version']}: {len(capabilities['encoders'])} encoders, "
+            f"{len(capabilities['filters'])} filters"
+        )
+        return capabilities
+
+    async def has_encoder(self, name: str) -> bool:
+        return name in (await self.capabilities())["encoders"]
+
+    async def has_filter(self, name: str) -> bool:
+        return name in (await self.capabilities())["filters"]
+
+    # ─── Fonts ───────────────────────────────────────────────────────────
+
+    def find_font(self) -> str:
+        """Find a usable TrueType font once per process. Returns path or empty string."""
+        if self._font is None:
+            self._font = next((font for font in FONT_CANDIDATES if os.path.exists(font)), "")
+            if not self._font:
+                logger.warning("No TrueType font found, captions will use FFmpeg default")
+        return self._font
+
+
+media_probe = MediaProbeService()
@@ -0,0 +1,222 @@
+"""
+Pipeline DAG Executor
+Runs pipeline stages as soon as their declared inputs are available, so independent
+stages overlap, while per-resource semaphores cap concurrent CPU renders, LLM calls
+and network requests across every pipeline running in the process.
+"""
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from app.core.config import settings
+from app.core.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Resource classes stages can declare
+CPU_RENDER = "cpu_render"
+LLM = "llm"
+NETWORK = "network"
+
+_resource_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+def _resource_limit(resource: str) -> int:
+    return {
+        CPU_RENDER: settings.PIPELINE_CPU_RENDER_CONCURRENCY,
+        LLM: settings.PIPELINE_LLM_CONCURRENCY,
+        NETWORK: settings.PIPELINE_NETWORK_CONCURRENCY,
+    }.get(resource, 1)
+
+
+@asynccontextmanager
+async def resource_slot(resource: Optional[str]):
+    """Hold one slot of a resource class (no-op for None)."""
+    if resource is None:
+        yield
+        return
+    semaphore = _resource_semaphores.get(resource)
+    if semaphore is None:
+        semaphore = _resource_semaphores[resource] = asyncio.Semaphore(_resource_limit(resource))
+    async with semaphore:
+        yield
+
+
+@dataclass
+class Stage:
+    """
+    A pipeline stage. `run` receives the shared context and returns a dict of outputs;
+    a declared output that is missing from the result counts as not produced, and
+    stages that need it are skipped.
+    """
+    name: str
+    run: Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+    inputs: Sequence[str] = ()
+    outputs: Sequence[str] = ()
+    resource: Optional[str] = None
+    enabled: bool = True
+    # Files a checkpoint of this stage depends on; the checkpoint is discarded if any are gone
+    artifacts: Optional[Callable[[Dict[str, Any]], List[str]]] = None
+
+
+# Called with (stage_name, state, detail); state is running, resumed, failed or skipped
+StageEventCallback = Callable[[str, str, Optional[str]], Awaitable[None]]
+
+# Called with (stage_name, outputs) after a stage produced all of its outputs
+CheckpointCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+class DagExecutor:
+    """Executes a set of stages in dependency order with maximal overlap."""
+
+    def __init__(self, stages: List[Stage], on_event: Optional[StageEventCallback] = None):
+        self.stages = [s for s in stages if s.enabled]
+        self.on_event = on_event
+        self.producers: Dict[str, str] = {}
+        for stage in self.stages:
+            for key in stage.outputs:
+                if key in self.producers:
+                    raise ValueError(f"Output '{key}' is produced by both {self.producers[key]} and {stage.name}")
+                self.producers[key] = stage.name
+        self._check_acyclic()
+
+    def _check_acyclic(self):
+        """Validate the graph and record a topological order in self.order."""
+        deps = {s.name: {self.producers[k] for k in s.inputs if k in self.producers} for s in self.stages}
+        visiting, done = set(), set()
+        self.order: List[str] = []
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Pipeline stages form a cycle through {name}")
+            visiting.add(name)
+            for dep in deps[name]:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+            self.order.append(name)
+
+        for stage in self.stages:
+            visit(stage.name)
+
+    async def _emit(self, name: str, state: str, detail: Optional[str] = None):
+        if self.on_event:
+            try:
+                await self.on_event(name, state, detail)
+            except Exception as e:
+                logger.warning(f"Stage event callback failed for {name}: {e}")
+
+    async def _run_stage(self, stage: Stage, ctx: Dict[str, Any]) -> Dict[str, Any]:
+        queued = time.perf_counter()
+        async with resource_slot(stage.resource):
+            wait_ms = round((time.perf_counter() - queued) * 1000, 2)
+            with span(f"stage.{stage.name}", resource=stage.resource, slot_wait_ms=wait_ms):
+                await self._emit(stage.name, "running")
+                outputs = await stage.run(ctx) or {}
+        return {k: v for k, v in outputs.items() if k in stage.outputs}
+
+    def _resume(self, ctx: Dict[str, Any], checkpoints: Dict[str, Dict[str, Any]]) -> List[str]:
+        """
+        Load checkpointed outputs into ctx. A checkpoint is reused only if it is complete,
+        its artifacts still exist on disk and every upstream stage was resumed too
+        (a re-run upstream stage invalidates everything built from its old outputs).
+        """
+        by_name = {s.name: s for s in self.stages}
+        resumed: List[str] = []
+        for name in self.order:
+            stage = by_name[name]
+            outputs = (checkpoints.get(name) or {}).get("outputs")
+            if not outputs or not all(k in outputs for k in stage.outputs):
+                continue
+            upstream = {self.producers[k] for k in stage.inputs if k in self.producers}
+            if not upstream.issubset(resumed):
+                continue
+            if stage.artifacts:
+                try:
+                    paths = stage.artifacts(outputs)
+                except Exception:
+                    continue
+                missing = [p for p in paths if not p or not os.path.exists(p)]
+                if missing:
+                    logger.info(f"Checkpoint for stage {name} is stale; missing {missing}")
+                    continue
+            ctx.update({k: outputs[k] for k in stage.outputs})
+            resumed.append(name)
+        return resumed
+
+    async def run(
+        self,
+        ctx: Dict[str, Any],
+        checkpoints: Optional[Dict[str, Dict[str, Any]]] = None,
+        on_checkpoint: Optional[CheckpointCallback] = None,
+    ) -> Dict[str, str]:
+        """
+        Run every enabled stage. Keys already present in `ctx` count as available inputs.
+        Stages with a valid entry in `checkpoints` ({stage: {"outputs": {...}}}) are not re-run.
+        Returns the final state of each stage.
+        """
+        states: Dict[str, str] = {}
+        pending = {s.name: s for s in self.stages}
+        running: Dict[asyncio.Task, Stage] = {}
+
+        for name in self._resume(ctx, checkpoints or {}):
+            del pending[name]
+            states[name] = "resumed"
+            await self._emit(name, "resumed")
+
+        def missing_inputs(stage: Stage) -> List[str]:
+            """Inputs that can no longer be produced (absent and their producer already finished)."""
+            return [
+                k for k in stage.inputs
+                if k not in ctx and (k not in self.producers or self.producers[k] in states)
+            ]
+
+        try:
+            while pending or running:
+                progressed = False
+                for name, stage in list(pending.items()):
+                    lost = missing_inputs(stage)
+                    if lost:
+                        del pending[name]
+                        states[name] = "skipped"
+                        await self._emit(name, "skipped", f"missing input: {', '.join(lost)}")
+                        progressed = True
+                    elif all(k in ctx for k in stage.inputs):
+                        del pending[name]
+                        running[asyncio.create_task(self._run_stage(stage, ctx))] = stage
+                        progressed = True
+                if progressed:
+                    continue
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    stage = running.pop(task)
+                    try:
+                        outputs = task.result()
+                        ctx.update(outputs)
+                        produced = all(k in outputs for k in stage.outputs)
+                        states[stage.name] = "success" if produced else "failed"
+                        if produced and on_checkpoint:
+                            try:
+                                await on_checkpoint(stage.name, outputs)
+                            except Exception as e:
+                                logger.warning(f"Failed to checkpoint stage {stage.name}: {e}")
+                    except Exception as e:
+                        logger.error(f"Pipeline stage {stage.name} raised: {e}")
+                        states[stage.name] = "failed"
+                        await self._emit(stage.name, "failed", str(e))
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        return states
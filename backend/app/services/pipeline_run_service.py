@@ -0,0 +1,281 @@
+"""
+Pipeline Run Service
+Executes content pipelines in the background, persists per-step progress on a
+PipelineRun record and exposes it as a stream of step events.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.tracing import annotate, export_trace, start_trace
+from app.db.base import AsyncSessionLocal
+from app.models.pipeline import PipelineRun
+from app.services.artifact_store import artifact_store
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+class PipelineRunService:
+    """Starts pipeline runs as background tasks and tracks their progress."""
+
+    def __init__(self):
+        self._tasks: set = set()
+        self._changed: Dict[str, asyncio.Event] = {}
+
+    async def create_run(
+        self,
+        db: AsyncSession,
+        category: str,
+        region: str = "Global",
+        profile_id: Optional[UUID] = None,
+        voice_id: str = "default",
+        generate_short: bool = True,
+        generate_presenter: bool = True,
+        distribute_to: Optional[List[str]] = None,
+        preview: bool = False,
+        created_by: Optional[UUID] = None,
+    ) -> PipelineRun:
+        run = PipelineRun(
+            category=category,
+            region=region,
+            profile_id=profile_id,
+            params={
+                "voice_id": voice_id,
+                "generate_short": generate_short,
+                "generate_presenter": generate_presenter,
+                "distribute_to": distribute_to,
+                "preview": preview,
+            },
+            status="queued",
+            steps={},
+            errors=[],
+            created_by=created_by,
+        )
+        db.add(run)
+        await db.commit()
+        await db.refresh(run)
+        return run
+
+    async def retry_run(self, db: AsyncSession, run: PipelineRun) -> PipelineRun:
+        """Re-queue a finished run; completed stages are reused from their checkpoints."""
+        run.status = "queued"
+        run.attempts = (run.attempts or 1) + 1
+        run.steps = {}
+        run.errors = []
+        run.result = None
+        run.current_step = None
+        run.finished_at = None
+        await db.commit()
+        await db.refresh(run)
+        return run
+
+    async def promote_run(self, db: AsyncSession, run: PipelineRun) -> PipelineRun:
+        """
+        Re-queue a finished preview run for a full-quality render. Only the short clip (and the
+        distribution it gates) is redone; articles, report, script, audio and images resume from
+        their checkpoints and the pre-scaled stills come from the artifact cache.
+        """
+        checkpoints = dict(run.checkpoints or {})
+        for name in ("short_clip", "distribution"):
+            dropped = checkpoints.pop(name, None)
+            if dropped:
+                await artifact_store.release_paths(dropped.get("artifacts") or [])
+        run.checkpoints = checkpoints
+        run.params = {**(run.params or {}), "preview": False}
+        return await self.retry_run(db, run)
+
+    def start(self, run_id) -> asyncio.Task:
+        """Execute a queued run in the background."""
+        task = asyncio.create_task(self._execute(run_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def start_batch(self, run_ids: List) -> asyncio.Task:
+        """Execute queued runs of one profile together, sharing profile and article loading."""
+        task = asyncio.create_task(self._execute_batch(list(run_ids)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _execute_batch(self, run_ids: List):
+        from app.services.pipeline_service import pipeline_service
+
+        async with AsyncSessionLocal() as db:
+            runs = [run for run in [await db.get(PipelineRun, run_id) for run_id in run_ids] if run]
+            if not runs:
+                return
+            try:
+                profile, articles_by_category, _ = await pipeline_service.prepare_batch(
+                    db, [run.category for run in runs], runs[0].profile_id
+                )
+            except Exception as e:
+                logger.error(f"Failed to prepare pipeline batch: {e}")
+                profile, articles_by_category = None, None
+
+        if articles_by_category is None:
+            # Fall back to independent runs that load their own inputs
+            await asyncio.gather(*(self._execute(run.id) for run in runs))
+            return
+        await asyncio.gather(*(
+            self._execute(run.id, preloaded={"profile": profile, "articles": articles_by_category[run.category]})
+            for run in runs
+        ))
+
+    async def _execute(self, run_id, preloaded: Optional[Dict[str, Any]] = None):
+        """Run one pipeline; `preloaded` passes shared profile/articles from a batch."""
+        from app.services.pipeline_service import pipeline_service
+
+        async with AsyncSessionLocal() as db:
+            run = await db.get(PipelineRun, run_id)
+            if not run:
+                return
+            run.status = "running"
+            run.started_at = datetime.utcnow()
+            await db.commit()
+            self._notify(run_id)
+
+            params = dict(run.params or {})
+            category, region, profile_id = run.category, run.region, run.profile_id
+            checkpoints: Dict[str, Any] = dict(run.checkpoints or {})
+
+            async def on_step(name: str, data: Dict[str, Any], pipeline_result: Dict[str, Any]):
+                await self._save_progress(run_id, name, pipeline_result)
+
+            async def on_checkpoint(name: str, checkpoint: Dict[str, Any]):
+                # Pin the stage's files so artifact GC cannot evict what a retry would resume from
+                await artifact_store.retain_paths(checkpoint.get("artifacts") or [])
+                previous = checkpoints.get(name)
+                if previous:
+                    await artifact_store.release_paths(previous.get("artifacts") or [])
+                checkpoints[name] = checkpoint
+                await self._save_checkpoints(run_id, dict(checkpoints))
+
+            with start_trace("pipeline.run") as trace:
+                annotate(run_id=str(run_id), category=category, region=region, attempt=run.attempts or 1)
+                try:
+                    result = await pipeline_service.run_full_pipeline(
+                        db=db,
+                        category=category,
+                        region=region,
+                        profile_id=profile_id,
+                        voice_id=params.get("voice_id", "default"),
+                        generate_short=params.get("generate_short", True),
+                        generate_presenter=params.get("generate_presenter", True),
+                        distribute_to=params.get("distribute_to"),
+                        preview=params.get("preview", False),
+                        on_step=on_step,
+                        checkpoints=checkpoints,
+                        on_checkpoint=on_checkpoint,
+                        **(preloaded or {}),
+                    )
+                except Exception as e:
+                    logger.error(f"Pipeline run {run_id} crashed: {e}")
+                    await db.rollback()
+                    result = {"error": str(e)}
+
+        failed = "error" in result or result.get("steps", {}).get("report", {}).get("status") == "failed"
+        errors = list(result.get("errors", []))
+        if "error" in result:
+            errors.insert(0, result["error"])
+
+        async with AsyncSessionLocal() as db:
+            values = {
+                "status": "failed" if failed else "completed",
+                "result": result,
+                "errors": errors,
+                "current_step": None,
+                "finished_at": datetime.utcnow(),
+                "trace_id": trace.trace_id,
+                "spans": trace.spans,
+            }
+            if result.get("steps"):
+                values["steps"] = result["steps"]
+            await db.execute(update(PipelineRun).where(PipelineRun.id == run_id).values(**values))
+            await db.commit()
+        self._notify(run_id)
+        logger.info(f"Pipeline run {run_id} {values['status']} ({len(errors)} errors)")
+        await export_trace(trace.trace_id, trace.spans)
+
+        if not failed:
+            # Completed runs no longer need their checkpoints pinned; failed ones keep them for retries
+            await artifact_store.release_paths(
+                path for checkpoint in checkpoints.values() for path in checkpoint.get("artifacts") or []
+            )
+
+    async def _save_progress(self, run_id, step: str, pipeline_result: Dict[str, Any]):
+        """Persist the current steps snapshot in its own session so pollers on any replica see it."""
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(PipelineRun)
+                .where(PipelineRun.id == run_id)
+                .values(
+                    current_step=step,
+                    steps=dict(pipeline_result["steps"]),
+                    errors=list(pipeline_result["errors"]),
+                )
+            )
+            await db.commit()
+        self._notify(run_id)
+
+    async def _save_checkpoints(self, run_id, checkpoints: Dict[str, Any]):
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(PipelineRun).where(PipelineRun.id == run_id).values(checkpoints=checkpoints)
+            )
+            await db.commit()
+
+    # ─── Change notification for event streams ──────────────────────────
+
+    def _change_event(self, run_id) -> asyncio.Event:
+        return self._changed.setdefault(str(run_id), asyncio.Event())
+
+    def _notify(self, run_id):
+        event = self._changed.pop(str(run_id), None)
+        if event:
+            event.set()
+
+    async def stream_events(self, run_id) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Yield {"event", "data"} dicts as steps change, ending with a "done" event.
+        Yields None when nothing changed within the poll interval (use it for keep-alives).
+        Local runs wake the stream immediately; runs on other replicas are picked up by polling.
+        """
+        sent: Dict[str, Any] = {}
+        while True:
+            changed = self._change_event(run_id)
+            async with AsyncSessionLocal() as db:
+                run = await db.get(PipelineRun, run_id)
+                if not run:
+                    yield {"event": "error", "data": {"detail": "Pipeline run not found"}}
+                    return
+                snapshot = run.to_dict()
+
+            emitted = False
+            for name, data in snapshot["steps"].items():
+                if sent.get(name) != data:
+                    sent[name] = data
+                    emitted = True
+                    yield {"event": "step", "data": {"run_id": snapshot["id"], "step": name, **data}}
+
+            if snapshot["status"] in TERMINAL_STATUSES:
+                yield {"event": "done", "data": snapshot}
+                return
+            if not emitted:
+                yield None
+
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=settings.PIPELINE_EVENT_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+
+pipeline_run_service = PipelineRunService()
@@ -2,10 +2,12 @@
 Pipeline Orchestration Service
 Handles the end-to-end flow: Articles → Report → Audio → Video.
 """
+import asyncio
+import json
 import logging
 import uuid
 import os
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Awaitable, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,12 +19,95 @@ from app.models.profile import Profile
 from app.services.ai_service import ai_service
 from app.services.tts_service import tts_service
 from app.services.video_service import video_render_service
+from app.services.render_farm import render_farm
 from app.services.avatar_service import avatar_service
 from app.services.social_distributor import social_distributor
+from app.services.pipeline_dag import CPU_RENDER, LLM, NETWORK, DagExecutor, Stage, resource_slot
+from app.core.tracing import span
 
 logger = logging.getLogger(__name__)
 
+# Called with (step_name, step_data, pipeline_result) whenever a step changes state
+StepCallback = Callable[[str, Dict[str, Any], Dict[str, Any]], Awaitable[None]]
+
+# Called with (stage_name, {"outputs": ..., "step": ...}) when a stage can be reused on retry
+PipelineCheckpointCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+# Sentinel for "load it yourself" so a preloaded profile of None (no profile) is distinguishable
+_NOT_LOADED: Any = object()
+
+
 class PipelineService:
+    async def load_profile(self, db: AsyncSession, profile_id: Optional[UUID]) -> Optional[Dict[str, Any]]:
+        if not profile_id:
+            return None
+        result = await db.execute(select(Profile).where(Profile.id == profile_id))
+        profile = result.scalar_one_or_none()
+        if not profile:
+            return None
+        logger.info(f"Using profile: {profile.name}")
+        return profile.to_dict()
+
+    async def load_articles(self, db: AsyncSession, category: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Latest raw articles for a category, falling back to normalized ones."""
+        query = (
+            select(RawArticle)
+            .where(RawArticle.category == category)
+            .order_by(desc(RawArticle.fetched_at))
+            .limit(limit)
+        )
+        result = await db.execute(query)
+        articles = result.scalars().all()
+
+        if not articles:
+            query = (
+                select(NormalizedArticle)
+                .where(NormalizedArticle.category == category)
+                .order_by(desc(NormalizedArticle.created_at))
+                .limit(limit)
+            )
+            result = await db.execute(query)
+            articles = result.scalars().all()
+
+        return [a.to_dict() for a in articles]
+
+    @staticmethod
+    def dedupe_articles(articles_by_category: Dict[str, List[Dict[str, Any]]]) -> int:
+        """
+        Keep each story (same URL or headline) only in the first category that has it,
+        unless removing it would leave a later category empty. Mutates the lists in place
+        and returns the number of duplicates removed.
+        """
+        seen = set()
+        removed = 0
+        for category, articles in articles_by_category.items():
+            fresh, duplicates = [], []
+            for article in articles:
+                ident = article.get("url") or (article.get("title") or article.get("headline") or "").strip().lower()
+                (duplicates if ident and ident in seen else fresh).append(article)
+                if ident:
+                    seen.add(ident)
+            if fresh:
+                articles[:] = fresh
+                removed += len(duplicates)
+        return removed
+
+    async def _set_step(
+        self,
+        pipeline_result: Dict[str, Any],
+        name: str,
+        data: Dict[str, Any],
+        on_step: Optional[StepCallback] = None,
+    ):
+        """Record a step in pipeline_result["steps"] and notify the progress listener."""
+        pipeline_result["steps"][name] = data
+        if on_step:
+            try:
+                await on_step(name, data, pipeline_result)
+            except Exception as e:
+                logger.warning(f"Pipeline progress callback failed for step {name}: {e}")
+
     async def run_full_pipeline(
         self,
         db: AsyncSession,
@@ -33,10 +118,22 @@ class PipelineService:
         generate_short: bool = True,
         generate_presenter: bool = True,
         distribute_to: Optional[List[str]] = None,
+        on_step: Optional[StepCallback] = None,
+        checkpoints: Optional[Dict[str, Dict[str, Any]]] = None,
+        on_checkpoint: Optional[PipelineCheckpointCallback] = None,
+        profile: Optional[Dict[str, Any]] = _NOT_LOADED,
+        articles: Optional[List[Dict[str, Any]]] = None,
+        preview: bool = False,
     ) -> Dict[str, Any]:
         """
-        Executes the full content production pipeline.
+        Executes the full content production pipeline as a DAG of stages:
+        TTS overlaps image generation, and the short render overlaps the presenter avatar.
+        `on_step` receives every step transition (running → success/failed/skipped).
+        Stages saved in `checkpoints` by an earlier attempt are reused when their files still exist.
+        A preloaded `profile` dict and `articles` list skip the corresponding database queries.
+        `preview` renders the short at the draft tier for editorial review and never distributes it.
         """
+        checkpoints = checkpoints or {}
         pipeline_result = {
             "category": category,
             "region": region,
@@ -45,183 +142,305 @@ class PipelineService:
             "errors": [],
         }
 
-        # ── Step 0: Get Profile ──
-        profile_dict = None
-        if profile_id:
-            result = await db.execute(select(Profile).where(Profile.id == profile_id))
-            profile = result.scalar_one_or_none()
-            if profile:
-                profile_dict = profile.to_dict()
-                logger.info(f"Using profile: {profile.name}")
-
-        # ── Step 1: Get articles ──
-        query = (
-            select(RawArticle)
-            .where(RawArticle.category == category)
-            .order_by(desc(RawArticle.fetched_at))
-            .limit(10)
-        )
-        result = await db.execute(query)
-        articles = result.scalars().all()
+        async def set_step(name: str, data: Dict[str, Any]):
+            await self._set_step(pipeline_result, name, data, on_step)
 
-        if not articles:
-            query = (
-                select(NormalizedArticle)
-                .where(NormalizedArticle.category == category)
-                .order_by(desc(NormalizedArticle.created_at))
-                .limit(10)
-            )
-            result = await db.execute(query)
-            articles = result.scalars().all()
+        # ── Stage: Profile + articles ──
+        async def load_articles(ctx):
+            profile_dict = await self.load_profile(db, profile_id) if profile is _NOT_LOADED else profile
+            article_dicts = articles if articles is not None else await self.load_articles(db, category)
 
-        if not articles:
-            return {"error": f"No articles found for category {category}"}
+            if not article_dicts:
+                await set_step("articles", {"status": "failed", "count": 0})
+                return {"profile": profile_dict}
 
-        article_dicts = [a.to_dict() for a in articles]
-        pipeline_result["steps"]["articles"] = {"count": len(article_dicts), "status": "success"}
+            await set_step("articles", {"count": len(article_dicts), "status": "success"})
+            return {"profile": profile_dict, "article_dicts": article_dicts}
 
-        # ── Step 2: Generate report ──
-        try:
+        # ── Stage: Report ──
+        async def generate_report(ctx):
             report = await ai_service.generate_journalist_report(
-                article_dicts, category, region, profile=profile_dict
+                ctx["article_dicts"], category, region, profile=ctx["profile"]
             )
             if "error" in report:
                 pipeline_result["errors"].append(f"Report: {report['error']}")
-                pipeline_result["steps"]["report"] = {"status": "failed", "error": report["error"]}
-                return pipeline_result
-            pipeline_result["steps"]["report"] = {
-                "status": "success",
-                "headline": report.get("headline", ""),
-            }
-        except Exception as e:
-            pipeline_result["errors"].append(f"Report: {str(e)}")
-            return pipeline_result
-
-        # ── Step 3: Generate Structured Script ──
-        try:
-            script_result = await ai_service.generate_script(
-                article_data={"headline": report.get("headline", category), "content": report.get("executive_summary", "")},
-                layers=["narration", "visuals"],
-                profile=profile_dict
-            )
-            if "error" in script_result:
-                logger.warning(f"Script generation failed, falling back: {script_result['error']}")
-                scenes = [{"voiceover": report.get("executive_summary", ""), "duration_seconds": 30}]
-            else:
-                scenes = script_result.get("scenes", [])
-                pipeline_result["steps"]["report"]["headline"] = script_result.get("title", report.get("headline"))
-        except Exception as e:
-            logger.error(f"Script generation error: {e}")
-            scenes = [{"voiceover": report.get("executive_summary", ""), "duration_seconds": 30}]
-
-        # ── Step 4: Generate audio ──
-        narration_text = " ".join([s.get("voiceover", "") for s in scenes])
-        if not narration_text:
-            narration_text = report.get("executive_summary", "")
-
-        try:
-            audio_result = await tts_service.generate_audio(
-                narration_text, voice_id, profile=profile_dict
-            )
-            if "error" in audio_result:
-                pipeline_result["errors"].append(f"Audio: {audio_result['error']}")
-                pipeline_result["steps"]["audio"] = {"status": "failed"}
-            else:
-                pipeline_result["steps"]["audio"] = {
-                    "status": "success",
-                    "url": audio_result["url"],
-                    "duration": audio_result["duration_seconds"],
-                }
-        except Exception as e:
-            pipeline_result["errors"].append(f"Audio: {str(e)}")
-
-        # ── Step 5: Generate short clip ──
-        if generate_short and pipeline_result["steps"].get("audio", {}).get("status") == "success":
-            image_paths = []
-            try:
-                # Use scene keywords for more relevant images
-                for scene in scenes[:5]: # Cap at 5 for now
-                    keywords = scene.get("visual_keywords", "geopolitics, news, cinematic")
-                    img_filename = f"scene_{uuid.uuid4().hex[:8]}.png"
-                    img_path = os.path.join(settings.VIDEO_OUTPUT_DIR, "shorts", "assets", img_filename)
-                    # Ensure directory exists
-                    os.makedirs(os.path.dirname(img_path), exist_ok=True)
-                    
-                    path = await ai_service.generate_image(f"Cinematic {keywords}, 8k, realistic news photography", img_path)
-                    if path:
-                        image_paths.append(path)
-            except Exception as e:
-                logger.error(f"Image generation failed: {e}")
+                await set_step("report", {"status": "failed", "error": report["error"]})
+                return None
+            await set_step("report", {"status": "success", "headline": report.get("headline", "")})
+            return {"report": report}
 
+        # ── Stage: Structured script ──
+        async def generate_script(ctx):
+            report = ctx["report"]
+            headline = report.get("headline", "")
+            fallback = [{"voiceover": report.get("executive_summary", ""), "duration_seconds": 30}]
             try:
-                # Find default music track
-                music_path = os.path.join(os.path.dirname(settings.VIDEO_OUTPUT_DIR), "assets", "music", "cinematic_news.mp3")
-                if not os.path.exists(music_path):
-                    music_path = None
-
-                short_result = await video_render_service.render_short_clip(
-                    audio_path=audio_result["path"],
-                    headline=pipeline_result["steps"]["report"].get("headline", category),
-                    script_text=narration_text,
-                    image_paths=image_paths,
-                    music_path=music_path,
-                    profile=profile_dict,
-                    scenes=scenes # PASS SCENES HERE
+                script_result = await ai_service.generate_script(
+                    article_data={"headline": report.get("headline", category), "content": report.get("executive_summary", "")},
+                    layers=["narration", "visuals"],
+                    profile=ctx["profile"]
                 )
-                if "error" in short_result:
-                    pipeline_result["errors"].append(f"Short clip: {short_result['error']}")
+                if "error" in script_result:
+                    logger.warning(f"Script generation failed, falling back: {script_result['error']}")
+                    scenes = fallback
                 else:
-                    pipeline_result["steps"]["short_clip"] = {
-                        "status": "success",
-                        "url": short_result["url"],
-                    }
+                    scenes = script_result.get("scenes", [])
+                    headline = script_result.get("title", report.get("headline"))
+                    pipeline_result["steps"]["report"]["headline"] = headline
             except Exception as e:
-                pipeline_result["errors"].append(f"Short clip: {str(e)}")
+                logger.error(f"Script generation error: {e}")
+                scenes = fallback
 
-        # ── Step 5: Generate presenter avatar ──
-        if generate_presenter and pipeline_result["steps"].get("audio", {}).get("status") == "success":
-            try:
-                # Extract avatar settings from video_style (if available)
-                avatar_config = profile_dict.get("videoStyle", {}).get("avatar", {}) if profile_dict else {}
-                presenter_image = avatar_config.get("presenter_image")
-                
-                # generate_lipsync takes local path or URL, handled by avatar_service
-                avatar_result = await avatar_service.generate_lipsync(
-                    audio_url=audio_result["path"],  # Use local path for local engines
-                    presenter_image=presenter_image
+            narration_text = " ".join([s.get("voiceover", "") for s in scenes])
+            if not narration_text:
+                narration_text = report.get("executive_summary", "")
+
+            await set_step("script", {"status": "success", "scenes": len(scenes)})
+            return {"scenes": scenes, "narration_text": narration_text, "headline": headline or category}
+
+        # ── Stage: Audio ──
+        async def generate_audio(ctx):
+            # One clip per scene, synthesized concurrently, so renders get exact scene timings
+            voiceovers = [s.get("voiceover", "") for s in ctx["scenes"]]
+            if voiceovers and all(voiceovers):
+                audio_result = await tts_service.generate_narration(voiceovers, voice_id, profile=ctx["profile"])
+            else:
+                audio_result = await tts_service.generate_audio(
+                    ctx["narration_text"], voice_id, profile=ctx["profile"]
                 )
-                
-                if avatar_result.get("skipped"):
-                    logger.info(f"Avatar generation skipped: {avatar_result.get('reason', 'Engine not available')}")
-                    pipeline_result["steps"]["avatar"] = {"status": "skipped", "reason": avatar_result.get("reason", "")}
-                elif "error" in avatar_result:
-                    logger.warning(f"Avatar generation failed: {avatar_result['error']}")
-                    pipeline_result["errors"].append(f"Avatar: {avatar_result['error']}")
-                    pipeline_result["steps"]["avatar"] = {"status": "failed"}
-                else:
-                    pipeline_result["steps"]["avatar"] = {
-                        "status": "success",
-                        "url": avatar_result["url"],
-                        "path": avatar_result["path"]
-                    }
-            except Exception as e:
-                logger.error(f"Avatar step exception: {e}")
-                pipeline_result["errors"].append(f"Avatar: {str(e)}")
+            if "error" in audio_result:
+                pipeline_result["errors"].append(f"Audio: {audio_result['error']}")
+                await set_step("audio", {"status": "failed"})
+                return None
+            await set_step("audio", {
+                "status": "success",
+                "url": audio_result["url"],
+                "duration": audio_result["duration_seconds"],
+            })
+            return {"audio": audio_result}
+
+        # ── Stage: Scene images (independent of audio) ──
+        async def generate_images(ctx):
+            async def one_image(index, scene):
+                keywords = scene.get("visual_keywords", "geopolitics, news, cinematic")
+                img_filename = f"scene_{uuid.uuid4().hex[:8]}.png"
+                img_path = os.path.join(settings.VIDEO_OUTPUT_DIR, "shorts", "assets", img_filename)
+                os.makedirs(os.path.dirname(img_path), exist_ok=True)
+                with span("image", scene=index):
+                    try:
+                        async with resource_slot(NETWORK):
+                            return await ai_service.generate_image(f"Cinematic {keywords}, 8k, realistic news photography", img_path)
+                    except Exception as e:
+                        logger.error(f"Image generation failed: {e}")
+                        return None
+
+            # Use scene keywords for more relevant images, capped at 5
+            paths = await asyncio.gather(*(one_image(i, scene) for i, scene in enumerate(ctx["scenes"][:5])))
+            image_paths = [p for p in paths if p]
+            await set_step("images", {"status": "success", "count": len(image_paths)})
+            return {"image_paths": image_paths}
 
-        # ── Step 6: Distribution ──
-        if distribute_to and pipeline_result["steps"].get("short_clip", {}).get("status") == "success":
-            video_url = pipeline_result["steps"]["short_clip"]["url"]
+        # ── Stage: Short clip render ──
+        async def render_short(ctx):
+            # Find default music track
+            music_path = os.path.join(os.path.dirname(settings.VIDEO_OUTPUT_DIR), "assets", "music", "cinematic_news.mp3")
+            if not os.path.exists(music_path):
+                music_path = None
+
+            async def on_render_progress(fraction: float):
+                await set_step("short_clip", {"status": "running", "percent": round(fraction * 100)})
+
+            spec = {
+                "audio_path": ctx["audio"]["path"],
+                "loudness": ctx["audio"].get("loudness"),
+                "scene_durations": ctx["audio"].get("scene_durations"),
+                "headline": ctx["headline"],
+                "script_text": ctx["narration_text"],
+                "image_paths": ctx["image_paths"],
+                "music_path": music_path,
+                "profile": ctx["profile"],
+                "scenes": ctx["scenes"],
+            }
+            if preview:
+                spec["quality"] = "preview"
+            if settings.RENDER_FARM_ENABLED:
+                short_result = await render_farm.render("short_clip", spec, on_progress=on_render_progress)
+            else:
+                short_result = await video_render_service.render_short_clip(**spec, on_progress=on_render_progress)
+            if "error" in short_result:
+                pipeline_result["errors"].append(f"Short clip: {short_result['error']}")
+                await set_step("short_clip", {"status": "failed"})
+                return None
+            await set_step("short_clip", {"status": "success", "url": short_result["url"]})
+            return {"short_clip": short_result}
+
+        # ── Stage: Presenter avatar (independent of the short render) ──
+        async def generate_avatar(ctx):
+            profile_dict = ctx["profile"]
+            # Extract avatar settings from video_style (if available)
+            avatar_config = profile_dict.get("videoStyle", {}).get("avatar", {}) if profile_dict else {}
+            presenter_image = avatar_config.get("presenter_image")
+
+            # generate_lipsync takes local path or URL, handled by avatar_service
+            avatar_result = await avatar_service.generate_lipsync(
+                audio_url=ctx["audio"]["path"],  # Use local path for local engines
+                presenter_image=presenter_image
+            )
+
+            if avatar_result.get("skipped"):
+                logger.info(f"Avatar generation skipped: {avatar_result.get('reason', 'Engine not available')}")
+                await set_step("avatar", {"status": "skipped", "reason": avatar_result.get("reason", "")})
+                return None
+            if "error" in avatar_result:
+                logger.warning(f"Avatar generation failed: {avatar_result['error']}")
+                pipeline_result["errors"].append(f"Avatar: {avatar_result['error']}")
+                await set_step("avatar", {"status": "failed"})
+                return None
+            await set_step("avatar", {
+                "status": "success",
+                "url": avatar_result["url"],
+                "path": avatar_result["path"]
+            })
+            return {"avatar": avatar_result}
+
+        # ── Stage: Distribution ──
+        async def distribute(ctx):
+            video_url = ctx["short_clip"]["url"]
             video_path = video_url.replace("/output/", settings.VIDEO_OUTPUT_DIR + os.sep)
+            profile_dict = ctx["profile"]
+            dist_results = await social_distributor.distribute("video", distribute_to, {
+                "video_path": video_path,
+                "title": ctx["report"].get("headline", category),
+                "description": ctx["narration_text"][:1000],
+                "thumbnail_paths": {
+                    platform: thumb["path"] for platform, thumb in (ctx["short_clip"].get("thumbnails") or {}).items()
+                },
+            }, profile_configs=profile_dict.get("platformConfigs") if profile_dict else None)
+            await set_step("distribution", {"status": "success", "results": dist_results})
+            return {"distribution": dist_results}
+
+        stages = [
+            Stage("articles", load_articles, outputs=("profile", "article_dicts")),
+            Stage("report", generate_report, inputs=("article_dicts", "profile"), outputs=("report",), resource=LLM),
+            Stage("script", generate_script, inputs=("report", "profile"),
+                  outputs=("scenes", "narration_text", "headline"), resource=LLM),
+            Stage("audio", generate_audio, inputs=("scenes", "narration_text", "profile"), outputs=("audio",), resource=NETWORK,
+                  artifacts=lambda o: [o["audio"]["path"]]),
+            Stage("images", generate_images, inputs=("scenes",), outputs=("image_paths",), enabled=generate_short,
+                  artifacts=lambda o: o["image_paths"]),
+            Stage("short_clip", render_short,
+                  inputs=("audio", "image_paths", "scenes", "narration_text", "headline", "profile"),
+                  outputs=("short_clip",), enabled=generate_short,
+                  # Farm renders only wait here; local renders hold a CPU slot
+                  resource=None if settings.RENDER_FARM_ENABLED else CPU_RENDER,
+                  artifacts=lambda o: [o["short_clip"]["path"]]
+                  + [t["path"] for t in (o["short_clip"].get("thumbnails") or {}).values()]),
+            Stage("avatar", generate_avatar, inputs=("audio", "profile"), outputs=("avatar",),
+                  resource=CPU_RENDER if avatar_service.engine == "local" else NETWORK, enabled=generate_presenter,
+                  artifacts=lambda o: [o["avatar"]["path"]]),
+            Stage("distribution", distribute, inputs=("short_clip", "report", "narration_text", "profile"),
+                  outputs=("distribution",), resource=NETWORK, enabled=bool(distribute_to) and not preview),
+        ]
+
+        async def on_stage_event(name: str, state: str, detail: Optional[str]):
+            if state == "running":
+                await set_step(name, {"status": "running"})
+            elif state == "resumed":
+                saved_step = checkpoints.get(name, {}).get("step") or {"status": "success"}
+                await set_step(name, {**saved_step, "resumed": True})
+            elif state == "skipped":
+                await set_step(name, {"status": "skipped", "reason": detail})
+            elif state == "failed":
+                # Stage raised instead of reporting its own failure
+                pipeline_result["errors"].append(f"{name.replace('_', ' ').capitalize()}: {detail}")
+                await set_step(name, {"status": "failed"})
+
+        async def save_checkpoint(name: str, outputs: Dict[str, Any]):
+            if on_checkpoint:
+                # Round-trip through JSON so the checkpoint can be stored in a JSONB column
+                stage = next(s for s in stages if s.name == name)
+                checkpoint = {
+                    "outputs": outputs,
+                    "step": pipeline_result["steps"].get(name),
+                    "artifacts": stage.artifacts(outputs) if stage.artifacts else [],
+                }
+                await on_checkpoint(name, json.loads(json.dumps(checkpoint, default=str)))
+
+        ctx: Dict[str, Any] = {}
+        await DagExecutor(stages, on_event=on_stage_event).run(
+            ctx, checkpoints=checkpoints, on_checkpoint=save_checkpoint
+        )
+
+        if "article_dicts" not in ctx:
+            return {"error": f"No articles found for category {category}"}
+        return pipeline_result
+
+    async def prepare_batch(
+        self,
+        db: AsyncSession,
+        categories: List[str],
+        profile_id: Optional[UUID] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, List[Dict[str, Any]]], int]:
+        """
+        Load what a multi-category batch shares: the profile once, and each category's
+        articles once with cross-category duplicates removed.
+        Returns (profile, articles_by_category, duplicates_removed).
+        """
+        profile = await self.load_profile(db, profile_id)
+        articles_by_category: Dict[str, List[Dict[str, Any]]] = {}
+        for category in categories:
+            if category not in articles_by_category:
+                articles_by_category[category] = await self.load_articles(db, category)
+        duplicates = self.dedupe_articles(articles_by_category)
+        if duplicates:
+            logger.info(f"Batch pipeline dropped {duplicates} articles shared between categories")
+        return profile, articles_by_category, duplicates
+
+    async def run_batch_pipeline(
+        self,
+        db: AsyncSession,
+        targets: List[Tuple[str, str]],
+        profile_id: Optional[UUID] = None,
+        voice_id: str = "default",
+        generate_short: bool = True,
+        generate_presenter: bool = True,
+        distribute_to: Optional[List[str]] = None,
+        preview: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Run the pipeline for several (category, region) targets of one profile.
+        Profile and articles are loaded once; the per-target pipelines then run concurrently,
+        so report generation fans out under the LLM cap and every render queues on the
+        shared CPU render pool. Results are returned in target order.
+        """
+        profile, articles_by_category, duplicates = await self.prepare_batch(
+            db, [category for category, _ in targets], profile_id
+        )
+
+        async def run_target(category: str, region: str) -> Dict[str, Any]:
             try:
-                dist_results = await social_distributor.distribute("video", distribute_to, {
-                    "video_path": video_path,
-                    "title": report.get("headline", category),
-                    "description": narration_text[:1000]
-                }, profile_configs=profile_dict.get("platformConfigs") if profile_dict else None)
-                pipeline_result["steps"]["distribution"] = {"status": "success", "results": dist_results}
+                return await self.run_full_pipeline(
+                    db=db,
+                    category=category,
+                    region=region,
+                    profile_id=profile_id,
+                    voice_id=voice_id,
+                    generate_short=generate_short,
+                    generate_presenter=generate_presenter,
+                    distribute_to=distribute_to,
+                    preview=preview,
+                    profile=profile,
+                    articles=articles_by_category[category],
+                )
             except Exception as e:
-                pipeline_result["errors"].append(f"Distribution: {str(e)}")
+                logger.error(f"Batch pipeline target {category}/{region} failed: {e}")
+                return {"category": category, "region": region, "error": str(e)}
 
-        return pipeline_result
+        results = await asyncio.gather(*(run_target(category, region) for category, region in targets))
+        return {
+            "profile_id": str(profile_id) if profile_id else None,
+            "duplicates_removed": duplicates,
+            "results": list(results),
+        }
 
 pipeline_service = PipelineService()
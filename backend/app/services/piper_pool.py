@@ -0,0 +1,169 @@
+"""
+Piper Worker Pool
+Keeps up to PIPER_WORKERS Piper processes (app.workers.piper_worker) alive with their voice
+model loaded and pipes the raw PCM they stream straight into an FFmpeg MP3 encoder, so an
+offline TTS request costs synthesis time only — no model load, no blocking subprocess calls.
+"""
+import asyncio
+import itertools
+import json
+import logging
+import sys
+from typing import Awaitable, Callable, List, Optional
+
+from app.core.config import settings
+from app.core.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Loading the model (and downloading the voice on first use) happens before "ready"
+WORKER_START_TIMEOUT = 300
+SYNTHESIS_TIMEOUT = 120
+
+
+async def _kill(process: asyncio.subprocess.Process):
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+class PiperWorker:
+    """One worker process speaking the JSON-lines + raw PCM protocol."""
+
+    def __init__(self, process: asyncio.subprocess.Process, model: str, sample_rate: int):
+        self.process = process
+        self.model = model
+        self.sample_rate = sample_rate
+
+    @classmethod
+    async def start(cls, command: List[str], model: str) -> "PiperWorker":
+        process = await asyncio.create_subprocess_exec(
+            *command, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE
+        )
+        try:
+            line = await asyncio.wait_for(process.stdout.readline(), timeout=WORKER_START_TIMEOUT)
+            ready = json.loads(line) if line else {}
+            if not ready.get("ready"):
+                raise RuntimeError(f"Piper worker for {model} exited during startup")
+        except BaseException:
+            await _kill(process)
+            raise
+        logger.info(f"Piper worker {process.pid} ready ({model}, {ready['sample_rate']} Hz)")
+        return cls(process, model, ready["sample_rate"])
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    async def synthesize(self, request_id: int, text: str, sink: Callable[[bytes], Awaitable[None]]):
+        """Send one request and hand every PCM chunk to `sink` as it arrives."""
+        request = json.dumps({"id": request_id, "text": text}).encode("utf-8") + b"\n"
+        self.process.stdin.write(request)
+        await self.process.stdin.drain()
+        while True:
+            line = await self.process.stdout.readline()
+            if not line:
+                raise RuntimeError(f"Piper worker {self.process.pid} exited")
+            message = json.loads(line)
+            if "pcm" in message:
+                await sink(await self.process.stdout.readexactly(message["pcm"]))
+            elif message.get("done"):
+                return
+            else:
+                raise RuntimeError(f"Piper synthesis failed: {message.get('error')}")
+
+    async def stop(self):
+        if self.process.stdin and not self.process.stdin.is_closing():
+            self.process.stdin.close()
+        await _kill(self.process)
+
+
+class PiperPool:
+    """Checks workers out one request at a time; a worker that misbehaves is replaced."""
+
+    def __init__(self):
+        self._idle: List[PiperWorker] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._ids = itertools.count()
+
+    def _command(self, model: str) -> List[str]:
+        return [
+            sys.executable, "-m", "app.workers.piper_worker",
+            "--model", model, "--data-dir", settings.PIPER_DATA_DIR,
+        ]
+
+    async def _acquire(self, model: str) -> PiperWorker:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(max(1, settings.PIPER_WORKERS))
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive and worker.model == model:
+                    return worker
+                # Dead, or loaded with a voice the admin has since replaced
+                await worker.stop()
+            return await PiperWorker.start(self._command(model), model)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def _release(self, worker: PiperWorker, healthy: bool):
+        if healthy and worker.alive:
+            self._idle.append(worker)
+        else:
+            await worker.stop()
+        self._slots.release()
+
+    async def warm(self, model: str):
+        """Start a worker ahead of the first request."""
+        try:
+            worker = await self._acquire(model)
+        except Exception as e:
+            logger.warning(f"Could not start a Piper worker for {model}: {e}")
+            return
+        await self._release(worker, healthy=True)
+
+    async def synthesize(self, text: str, output_path: str, model: str):
+        """Synthesize `text` with `model` into an MP3 at `output_path`."""
+        worker = await self._acquire(model)
+        healthy = False
+        encoder = None
+        try:
+            with span("piper", chars=len(text)):
+                encoder = await asyncio.create_subprocess_exec(
+                    "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+                    "-f", "s16le", "-ar", str(worker.sample_rate), "-ac", "1", "-i", "pipe:0",
+                    "-codec:a", "libmp3lame", "-b:a", "192k",
+                    output_path,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+
+                async def encode(pcm: bytes):
+                    encoder.stdin.write(pcm)
+                    await encoder.stdin.drain()
+
+                await asyncio.wait_for(worker.synthesize(next(self._ids), text, encode), timeout=SYNTHESIS_TIMEOUT)
+                healthy = True
+                _, stderr = await asyncio.wait_for(encoder.communicate(), timeout=SYNTHESIS_TIMEOUT)
+            if encoder.returncode != 0:
+                raise RuntimeError(f"FFmpeg encode failed: {stderr.decode('utf-8', errors='replace')[-200:]}")
+        except BaseException:
+            if encoder:
+                await _kill(encoder)
+            raise
+        finally:
+            await self._release(worker, healthy)
+
+    async def shutdown(self):
+        workers, self._idle = self._idle, []
+        for worker in workers:
+            await worker.stop()
+
+
+piper_pool = PiperPool()
@@ -0,0 +1,332 @@
+"""
+Render Farm Service
+DB-backed queue of FFmpeg renders. API and pipeline processes submit render specs and
+wait for the result; render workers on any machine claim tasks with SKIP LOCKED, run
+them through VideoRenderService and write outputs to the shared output directory.
+"""
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.config import settings
+from app.core.tracing import span
+from app.db.base import AsyncSessionLocal
+from app.models.render import RenderTask, RenderWorker
+from app.services.video_service import ProgressCallback, video_render_service
+
+logger = logging.getLogger(__name__)
+
+# Task kind → VideoRenderService method; the spec holds that method's keyword arguments
+RENDERERS = {
+    "short_clip": "render_short_clip",
+    "presenter_video": "render_presenter_video",
+}
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+class RenderLeaseLost(Exception):
+    """The task was cancelled or reassigned while this worker was rendering it."""
+
+
+def worker_slots() -> int:
+    return settings.RENDER_WORKER_CONCURRENCY or os.cpu_count() or 1
+
+
+class RenderFarmService:
+    """Submission, leasing and capacity reporting for farm renders."""
+
+    def __init__(self):
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+
+    # ─── Submitting side ─────────────────────────────────────────────────
+
+    async def submit(self, kind: str, spec: Dict[str, Any], priority: int = 0):
+        if kind not in RENDERERS:
+            raise ValueError(f"Unknown render kind: {kind}")
+        async with AsyncSessionLocal() as db:
+            task = RenderTask(kind=kind, spec=spec, priority=priority, status="queued")
+            db.add(task)
+            await db.commit()
+            return task.id
+
+    async def live_capacity(self) -> int:
+        """Slots advertised by workers that heartbeated recently."""
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.RENDER_TASK_STALE_SECONDS)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(func.coalesce(func.sum(RenderWorker.slots), 0)).where(RenderWorker.heartbeat_at >= cutoff)
+            )
+            return int(result.scalar() or 0)
+
+    async def render(
+        self,
+        kind: str,
+        spec: Dict[str, Any],
+        on_progress: Optional[ProgressCallback] = None,
+        priority: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Render on the farm and wait for the result (same shape as the local render).
+        Falls back to rendering in this process when no worker is alive. Cancelling the
+        caller cancels the task so the worker stops rendering.
+        """
+        if not await self.live_capacity():
+            logger.warning(f"No live render workers; rendering {kind} locally")
+            return await getattr(video_render_service, RENDERERS[kind])(**spec, on_progress=on_progress)
+
+        task_id = await self.submit(kind, spec, priority)
+        deadline = asyncio.get_running_loop().time() + settings.RENDER_TASK_WAIT_SECONDS
+        reported = 0.0
+        try:
+            with span("render_farm.wait", kind=kind):
+                while True:
+                    async with AsyncSessionLocal() as db:
+                        task = await db.get(RenderTask, task_id)
+                        status, progress, result, error = task.status, task.progress or 0.0, task.result, task.error
+
+                    if status == "completed":
+                        return result or {"error": "Render worker returned no result"}
+                    if status in ("failed", "cancelled"):
+                        return {"error": error or f"Render {status}"}
+                    if on_progress and progress > reported:
+                        reported = progress
+                        await on_progress(progress)
+                    if asyncio.get_running_loop().time() > deadline:
+                        await self.cancel(task_id, "Timed out waiting for a render worker")
+                        return {"error": f"Render farm timed out after {settings.RENDER_TASK_WAIT_SECONDS}s"}
+                    await asyncio.sleep(settings.RENDER_WORKER_POLL_SECONDS)
+        except asyncio.CancelledError:
+            await self.cancel(task_id, "Cancelled by requester")
+            raise
+
+    async def cancel(self, task_id, reason: str):
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(RenderTask)
+                .where(RenderTask.id == task_id, RenderTask.status.in_(("queued", "running")))
+                .values(status="cancelled", error=reason, finished_at=datetime.utcnow())
+            )
+            await db.commit()
+
+    # ─── Worker side ─────────────────────────────────────────────────────
+
+    async def register_worker(self, slots: int, busy: int = 0):
+        """Upsert this worker's capacity row; called on every poll as its heartbeat."""
+        now = datetime.utcnow()
+        async with AsyncSessionLocal() as db:
+            stmt = insert(RenderWorker).values(
+                worker_id=self.worker_id, hostname=socket.gethostname(), slots=slots, busy=busy,
+                started_at=now, heartbeat_at=now,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[RenderWorker.worker_id],
+                set_={"slots": slots, "busy": busy, "heartbeat_at": now},
+            )
+            await db.execute(stmt)
+            await db.commit()
+
+    async def unregister_worker(self):
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(RenderWorker).where(RenderWorker.worker_id == self.worker_id))
+            await db.commit()
+
+    async def claim_next(self) -> Optional[Any]:
+        """Lease the highest-priority queued task; returns its id or None."""
+        now = datetime.utcnow()
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(RenderTask)
+                .where(RenderTask.status == "queued")
+                .order_by(RenderTask.priority.desc(), RenderTask.created_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            task = result.scalar_one_or_none()
+            if not task:
+                return None
+            task.status = "running"
+            task.worker_id = self.worker_id
+            task.heartbeat_at = now
+            task.started_at = now
+            task.attempts = (task.attempts or 0) + 1
+            await db.commit()
+            logger.info(f"Render worker {self.worker_id} claimed {task.kind} task {task.id}")
+            return task.id
+
+    async def heartbeat(self, task_id, progress: Optional[float] = None) -> bool:
+        """Refresh the lease (and progress). False means the task was cancelled or reassigned."""
+        values: Dict[str, Any] = {"heartbeat_at": datetime.utcnow()}
+        if progress is not None:
+            values["progress"] = progress
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                update(RenderTask)
+                .where(
+                    RenderTask.id == task_id,
+                    RenderTask.worker_id == self.worker_id,
+                    RenderTask.status == "running",
+                )
+                .values(**values)
+            )
+            await db.commit()
+            return result.rowcount > 0
+
+    async def requeue_stale(self) -> int:
+        """Requeue tasks whose worker stopped heartbeating, or fail them once out of attempts."""
+        now = datetime.utcnow()
+        cutoff = now - timedelta(seconds=settings.RENDER_TASK_STALE_SECONDS)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(RenderTask)
+                .where(RenderTask.status == "running", RenderTask.heartbeat_at < cutoff)
+                .with_for_update(skip_locked=True)
+            )
+            tasks = result.scalars().all()
+            for task in tasks:
+                logger.warning(f"Render task {task.id} lost its worker ({task.worker_id}); requeueing")
+                self._record_failure(task, f"Worker {task.worker_id} stopped heartbeating", now)
+            await db.execute(delete(RenderWorker).where(RenderWorker.heartbeat_at < cutoff))
+            await db.commit()
+            return len(tasks)
+
+    async def _finish(self, task_id, **values):
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(RenderTask)
+                .where(
+                    RenderTask.id == task_id,
+                    RenderTask.worker_id == self.worker_id,
+                    RenderTask.status == "running",
+                )
+                .values(finished_at=datetime.utcnow(), **values)
+            )
+            await db.commit()
+
+    async def release(self, task_id):
+        """Return a task to the queue without spending an attempt (worker shutdown)."""
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(RenderTask)
+                .where(
+                    RenderTask.id == task_id,
+                    RenderTask.worker_id == self.worker_id,
+                    RenderTask.status == "running",
+                )
+                .values(
+                    status="queued", worker_id=None, heartbeat_at=None, progress=0.0,
+                    attempts=RenderTask.attempts - 1,
+                )
+            )
+            await db.commit()
+
+    async def fail(self, task_id, message: str):
+        async with AsyncSessionLocal() as db:
+            task = await db.get(RenderTask, task_id, with_for_update=True)
+            if not task or task.worker_id != self.worker_id or task.status != "running":
+                return
+            self._record_failure(task, message, datetime.utcnow())
+            await db.commit()
+
+    def _record_failure(self, task: RenderTask, message: str, now: datetime):
+        task.error = message[:2000]
+        task.worker_id = None
+        task.heartbeat_at = None
+        task.progress = 0.0
+        max_attempts = task.max_attempts if task.max_attempts is not None else 3
+        if (task.attempts or 0) < max_attempts:
+            task.status = "queued"
+        else:
+            task.status = "failed"
+            task.finished_at = now
+            logger.error(f"Render task {task.id} failed permanently: {message}")
+
+    async def process(self, task_id):
+        """Run a claimed task, heartbeating until it finishes or the lease is lost."""
+        async with AsyncSessionLocal() as db:
+            task = await db.get(RenderTask, task_id)
+            kind, spec = task.kind, dict(task.spec or {})
+
+        async def on_progress(fraction: float):
+            if not await self.heartbeat(task_id, progress=fraction):
+                raise RenderLeaseLost()
+
+        render = asyncio.create_task(getattr(video_render_service, RENDERERS[kind])(**spec, on_progress=on_progress))
+        try:
+            while True:
+                done, _ = await asyncio.wait({render}, timeout=settings.RENDER_WORKER_HEARTBEAT_SECONDS)
+                if done:
+                    break
+                if not await self.heartbeat(task_id):
+                    logger.warning(f"Render task {task_id} was cancelled or reassigned; stopping render")
+                    render.cancel()
+                    await asyncio.gather(render, return_exceptions=True)
+                    return
+            result = render.result()
+            if "error" in result:
+                await self.fail(task_id, result["error"])
+            else:
+                await self._finish(task_id, status="completed", progress=1.0, result=result)
+        except RenderLeaseLost:
+            logger.warning(f"Render task {task_id} was cancelled or reassigned; dropping result")
+        except asyncio.CancelledError:
+            render.cancel()
+            await asyncio.gather(render, return_exceptions=True)
+            await self.release(task_id)
+            raise
+        except Exception as e:
+            logger.error(f"Render task {task_id} failed: {e}")
+            await self.fail(task_id, str(e))
+
+    # ─── Reporting ───────────────────────────────────────────────────────
+
+    async def status(self, window_minutes: int = 60) -> Dict[str, Any]:
+        """Live worker capacity, queue depth and queue latency over the recent window."""
+        from app.core.tracing import percentile
+
+        now = datetime.utcnow()
+        live_cutoff = now - timedelta(seconds=settings.RENDER_TASK_STALE_SECONDS)
+        since = now - timedelta(minutes=window_minutes)
+        async with AsyncSessionLocal() as db:
+            workers = (await db.execute(
+                select(RenderWorker).where(RenderWorker.heartbeat_at >= live_cutoff).order_by(RenderWorker.worker_id)
+            )).scalars().all()
+            counts = dict((await db.execute(
+                select(RenderTask.status, func.count(RenderTask.id))
+                .where(RenderTask.status.in_(("queued", "running")))
+                .group_by(RenderTask.status)
+            )).all())
+            oldest_queued = (await db.execute(
+                select(func.min(RenderTask.created_at)).where(RenderTask.status == "queued")
+            )).scalar()
+            started = (await db.execute(
+                select(RenderTask.created_at, RenderTask.started_at, RenderTask.status)
+                .where(RenderTask.started_at >= since)
+            )).all()
+
+        latencies = [(s - c).total_seconds() for c, s, _ in started if c and s]
+        return {
+            "enabled": settings.RENDER_FARM_ENABLED,
+            "workers": [w.to_dict() for w in workers],
+            "capacity": sum(w.slots or 0 for w in workers),
+            "busy": sum(w.busy or 0 for w in workers),
+            "queued": counts.get("queued", 0),
+            "running": counts.get("running", 0),
+            "oldest_queued_seconds": (now - oldest_queued).total_seconds() if oldest_queued else None,
+            "queue_latency": {
+                "window_minutes": window_minutes,
+                "samples": len(latencies),
+                "p50_seconds": percentile(latencies, 50),
+                "p95_seconds": percentile(latencies, 95),
+            },
+            "completed_in_window": sum(1 for _, _, status in started if status == "completed"),
+        }
+
+
+render_farm = RenderFarmService()
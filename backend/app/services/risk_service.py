@@ -2,76 +2,175 @@
 Risk Governance Service
 Shared logic for risk scoring used by APIs and background automation.
 """
+import asyncio
+import copy
 import logging
+import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 
+import numpy as np
+from sqlalchemy import select, update, or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.models.article import NormalizedArticle
-from app.models.risk import RiskScore
+from app.models.risk import RiskScore, RiskRuleSet
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Order of the boolean factors persisted in RiskScore.risk_factors
+FACTOR_NAMES = [
+    "named_individual",
+    "criminal_allegation",
+    "single_anonymous_source",
+    "war_topic",
+    "religious_framing",
+    "israel_mentioned",
+    "iran_mentioned",
+    "palestine_mentioned",
+]
+
+# Factors that are computed from other factors rather than from the text
+DERIVED_FACTORS = {
+    "region_mentioned": ["israel_mentioned", "iran_mentioned", "palestine_mentioned"],
+}
+
+# Factors that also match against article tags
+TAG_FACTORS = {"israel_mentioned", "iran_mentioned", "palestine_mentioned"}
+
+DIMENSIONS = ["legal", "defamation", "platform", "political"]
+
+# Built-in rule set (version 0), used until a RiskRuleSet is activated
+DEFAULT_RISK_RULES: Dict[str, Any] = {
+    "version": 0,
+    "factor_weights": {
+        "named_individual": {"legal": 15, "defamation": 20, "platform": 10, "political": 10},
+        "criminal_allegation": {"legal": 25, "defamation": 30, "platform": 20, "political": 15},
+        "single_anonymous_source": {"legal": 20, "defamation": 25, "platform": 15},
+        "war_topic": {"platform": 25, "political": 20},
+        "religious_framing": {"platform": 30, "political": 20},
+        "region_mentioned": {"political": 15},
+    },
+    "dimension_weights": {"legal": 0.30, "defamation": 0.30, "platform": 0.20, "political": 0.20},
+    "classification_thresholds": [[80, "Critical"], [60, "High"], [40, "Elevated"], [20, "Moderate"]],
+    "review_threshold": 40,
+    "lexicon": {
+        "named_individual": ["president", "minister", "leader", "mr.", "dr."],
+        "criminal_allegation": ["guilty", "crime", "corruption", "fraud"],
+        "single_anonymous_source": ["anonymous", "unnamed"],
+        "war_topic": ["war", "attack", "strike", "military"],
+        "religious_framing": ["muslim", "islamic", "christian", "jewish"],
+        "israel_mentioned": ["israel"],
+        "iran_mentioned": ["iran"],
+        "palestine_mentioned": ["palestine"],
+    },
+}
+
+# How long the active rule set is cached before re-reading it from the database
+RULES_CACHE_SECONDS = 60
+
+# Unchecked scores re-queued for the deep check when the worker starts
+DEEP_CHECK_BACKFILL_LIMIT = 1000
+
+# Editorial guidance attached by the deep check, keyed by (derived) factor
+MITIGATION_SUGGESTIONS = {
+    "named_individual": "Attribute statements about named individuals to on-record sources.",
+    "criminal_allegation": "Frame criminal claims as allegations and cite the court or charging record.",
+    "single_anonymous_source": "Corroborate the anonymous claim with a second independent source.",
+    "war_topic": "Source casualty and strike figures explicitly and avoid graphic descriptions.",
+    "religious_framing": "Remove religious identifiers unless they are essential to the story.",
+    "region_mentioned": "Check regional terminology against the editorial style guide.",
+}
+
 
 class RiskService:
     """Encapsulates risk scoring logic."""
 
-    def analyze_content(self, article: NormalizedArticle) -> Dict[str, bool]:
+    def __init__(self):
+        self._rules_cache: Optional[Dict[str, Any]] = None
+        self._rules_loaded_at = 0.0
+        self._deep_check_queue: asyncio.Queue = asyncio.Queue()
+
+    # ──────────────────────────────────────────────
+    # RULE SETS
+    # ──────────────────────────────────────────────
+
+    async def get_active_rules(self, db: AsyncSession) -> Dict[str, Any]:
+        """Return the active rule set, falling back to the built-in defaults."""
+        if self._rules_cache and time.monotonic() - self._rules_loaded_at < RULES_CACHE_SECONDS:
+            return self._rules_cache
+
+        result = await db.execute(
+            select(RiskRuleSet).where(RiskRuleSet.is_active == True).limit(1)
+        )
+        rule_set = result.scalar_one_or_none()
+        self._rules_cache = rule_set.to_rules() if rule_set else DEFAULT_RISK_RULES
+        self._rules_loaded_at = time.monotonic()
+        return self._rules_cache
+
+    def invalidate_rules_cache(self):
+        """Force the next scoring call to reload the active rule set."""
+        self._rules_cache = None
+        self._rules_loaded_at = 0.0
+
+    def build_rules(self, overrides: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge partial rule overrides on top of the built-in defaults."""
+        rules = copy.deepcopy(DEFAULT_RISK_RULES)
+        for key, value in overrides.items():
+            if value is not None and key in rules:
+                rules[key] = value
+        return rules
+
+    # ──────────────────────────────────────────────
+    # PER-ARTICLE SCORING
+    # ──────────────────────────────────────────────
+
+    def analyze_content(self, article: NormalizedArticle, rules: Optional[Dict[str, Any]] = None) -> Dict[str, bool]:
         """Analyze raw text to detect risk factors."""
+        lexicon = (rules or DEFAULT_RISK_RULES).get("lexicon") or DEFAULT_RISK_RULES["lexicon"]
         headline = (article.headline or "").lower()
         summary = (article.summary or "").lower()
         content = f"{headline} {summary}".strip()
         tags = [t.lower() for t in (article.tags or [])]
 
-        return {
-            "named_individual": any(keyword in content for keyword in ["president", "minister", "leader", "mr.", "dr."]),
-            "criminal_allegation": any(keyword in content for keyword in ["guilty", "crime", "corruption", "fraud"]),
-            "single_anonymous_source": "anonymous" in content or "unnamed" in content,
-            "war_topic": any(keyword in content for keyword in ["war", "attack", "strike", "military"]),
-            "religious_framing": any(keyword in content for keyword in ["muslim", "islamic", "christian", "jewish"]),
-            "israel_mentioned": "israel" in content or "israel" in tags,
-            "iran_mentioned": "iran" in content or "iran" in tags,
-            "palestine_mentioned": "palestine" in content or "palestine" in tags,
-        }
+        factors = {}
+        for factor in FACTOR_NAMES:
+            keywords = lexicon.get(factor, [])
+            detected = any(keyword in content for keyword in keywords)
+            if factor in TAG_FACTORS and not detected:
+                detected = any(keyword in tags for keyword in keywords)
+            factors[factor] = detected
+        return factors
 
-    def calculate_scores(self, factors: Dict[str, bool]) -> Dict[str, int]:
+    def _expand_factors(self, factors: Dict[str, bool]) -> Dict[str, bool]:
+        """Add derived factors (e.g. any region mentioned) to a factor dict."""
+        expanded = {name: bool(factors.get(name)) for name in FACTOR_NAMES}
+        for derived, sources in DERIVED_FACTORS.items():
+            expanded[derived] = any(expanded.get(source) for source in sources)
+        return expanded
+
+    def calculate_scores(self, factors: Dict[str, bool], rules: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
         """Compute weighted scores for each dimension."""
-        legal = 0
-        defamation = 0
-        platform = 0
-        political = 0
-
-        if factors["named_individual"]:
-            legal += 15
-            defamation += 20
-            platform += 10
-            political += 10
-        if factors["criminal_allegation"]:
-            legal += 25
-            defamation += 30
-            platform += 20
-            political += 15
-        if factors["single_anonymous_source"]:
-            legal += 20
-            defamation += 25
-            platform += 15
-        if factors["war_topic"]:
-            platform += 25
-            political += 20
-        if factors["religious_framing"]:
-            platform += 30
-            political += 20
-        if factors["israel_mentioned"] or factors["iran_mentioned"] or factors["palestine_mentioned"]:
-            political += 15
+        rules = rules or DEFAULT_RISK_RULES
+        expanded = self._expand_factors(factors)
+        scores = {dimension: 0 for dimension in DIMENSIONS}
 
-        return {
-            "legal": min(legal, 100),
-            "defamation": min(defamation, 100),
-            "platform": min(platform, 100),
-            "political": min(political, 100),
-        }
+        for factor, weights in rules["factor_weights"].items():
+            if expanded.get(factor):
+                for dimension, points in weights.items():
+                    scores[dimension] += points
+
+        return {dimension: min(score, 100) for dimension, score in scores.items()}
+
+    def calculate_overall(self, scores: Dict[str, int], rules: Optional[Dict[str, Any]] = None) -> int:
+        """Combine dimension scores into the weighted overall score."""
+        weights = (rules or DEFAULT_RISK_RULES)["dimension_weights"]
+        overall = 0.0
+        for dimension in DIMENSIONS:
+            overall = overall + scores[dimension] * weights.get(dimension, 0.0)
+        return round(overall)
 
     def determine_safe_mode(self, factors: Dict[str, bool], safe_mode_enabled: bool) -> Dict[str, List[str]]:
         """Determine if safe mode blocks the content."""
@@ -88,33 +187,30 @@ class RiskService:
 
         return {"blocked": blocked, "violations": violations}
 
-    def classify_overall(self, overall: int) -> str:
+    def classify_overall(self, overall: int, rules: Optional[Dict[str, Any]] = None) -> str:
         """Map overall score to classification."""
-        if overall > 80:
-            return "Critical"
-        if overall > 60:
-            return "High"
-        if overall > 40:
-            return "Elevated"
-        if overall > 20:
-            return "Moderate"
+        thresholds = (rules or DEFAULT_RISK_RULES)["classification_thresholds"]
+        for lower_bound, label in thresholds:
+            if overall > lower_bound:
+                return label
         return "Low"
 
-    async def assess_article(self, article: NormalizedArticle, assessed_by: str, db: AsyncSession, safe_mode_enabled: bool) -> RiskScore:
-        """Create a risk score for the supplied article."""
-        factors = self.analyze_content(article)
-        scores = self.calculate_scores(factors)
-        overall = round(
-            scores["legal"] * 0.30 +
-            scores["defamation"] * 0.30 +
-            scores["platform"] * 0.20 +
-            scores["political"] * 0.20
-        )
+    def _build_score(
+        self,
+        article: NormalizedArticle,
+        rules: Dict[str, Any],
+        assessed_by: Optional[str],
+        safe_mode_enabled: bool,
+    ) -> RiskScore:
+        """Run the lexical pass and return an unsaved RiskScore for the article."""
+        factors = self.analyze_content(article, rules)
+        scores = self.calculate_scores(factors, rules)
+        overall = self.calculate_overall(scores, rules)
 
         safe_mode = self.determine_safe_mode(factors, safe_mode_enabled)
-        classification = self.classify_overall(overall)
+        classification = self.classify_overall(overall, rules)
 
-        risk_score = RiskScore(
+        return RiskScore(
             article_id=article.id,
             legal_risk=scores["legal"],
             defamation_risk=scores["defamation"],
@@ -125,17 +221,265 @@ class RiskService:
             risk_factors=factors,
             safe_mode_blocked=safe_mode["blocked"],
             safe_mode_violations=safe_mode["violations"] or None,
-            requires_senior_review=overall > 40,
+            requires_senior_review=overall > rules["review_threshold"],
             assessed_by=assessed_by,
             assessed_at=datetime.utcnow(),
+            rule_set_version=rules["version"],
         )
 
+    async def assess_article(self, article: NormalizedArticle, assessed_by: str, db: AsyncSession, safe_mode_enabled: bool) -> RiskScore:
+        """Create a risk score for the supplied article."""
+        rules = await self.get_active_rules(db)
+        risk_score = self._build_score(article, rules, assessed_by, safe_mode_enabled)
+
         db.add(risk_score)
         await db.commit()
         await db.refresh(risk_score)
 
-        logger.info(f"Created risk score {risk_score.id} for article {article.id} ({classification})")
+        logger.info(f"Created risk score {risk_score.id} for article {article.id} ({risk_score.classification})")
+        self.enqueue_deep_checks([risk_score])
+        return risk_score
+
+    # ──────────────────────────────────────────────
+    # INGESTION HOOK
+    # ──────────────────────────────────────────────
+
+    async def score_ingested_articles(
+        self,
+        articles: Sequence[NormalizedArticle],
+        db: AsyncSession,
+        assessed_by: Optional[str] = None,
+    ) -> List[RiskScore]:
+        """
+        Cheap lexical risk pass for newly created (unscored) articles.
+        Scores are added to the caller's session so they commit in the same batch as the articles;
+        call enqueue_deep_checks() with the result after the commit.
+        """
+        rules = await self.get_active_rules(db)
+        # Assign primary keys to the new articles without ending the transaction
+        await db.flush()
+        risk_scores = []
+        for article in articles:
+            risk_score = self._build_score(article, rules, assessed_by, settings.SAFE_MODE_ENABLED)
+            db.add(risk_score)
+            risk_scores.append(risk_score)
+        return risk_scores
+
+    # ──────────────────────────────────────────────
+    # DEFERRED DEEP CHECKS
+    # ──────────────────────────────────────────────
+
+    def enqueue_deep_checks(self, risk_scores: Sequence[RiskScore]):
+        """Queue committed scores for the full-text check."""
+        for risk_score in risk_scores:
+            if risk_score.id is not None:
+                self._deep_check_queue.put_nowait(risk_score.id)
+
+    async def deep_check(self, risk_score_id, db: AsyncSession) -> Optional[RiskScore]:
+        """
+        Expensive pass: scan the full article body (not just headline/summary),
+        re-score if it surfaces new factors and attach mitigation suggestions.
+        """
+        result = await db.execute(
+            select(RiskScore)
+            .options(selectinload(RiskScore.article))
+            .where(RiskScore.id == risk_score_id)
+        )
+        risk_score = result.scalar_one_or_none()
+        if not risk_score or risk_score.deep_checked_at is not None or not risk_score.article:
+            return risk_score
+
+        rules = await self.get_active_rules(db)
+        article = risk_score.article
+        body_factors = self.analyze_content(
+            NormalizedArticle(
+                headline=article.headline,
+                summary=f"{article.summary or ''} {article.content or ''}",
+                tags=article.tags,
+            ),
+            rules,
+        )
+        factors = {name: bool((risk_score.risk_factors or {}).get(name)) or body_factors[name] for name in FACTOR_NAMES}
+
+        if factors != (risk_score.risk_factors or {}):
+            scores = self.calculate_scores(factors, rules)
+            overall = self.calculate_overall(scores, rules)
+            safe_mode = self.determine_safe_mode(factors, settings.SAFE_MODE_ENABLED)
+            risk_score.legal_risk = scores["legal"]
+            risk_score.defamation_risk = scores["defamation"]
+            risk_score.platform_risk = scores["platform"]
+            risk_score.political_risk = scores["political"]
+            risk_score.overall_score = overall
+            risk_score.classification = self.classify_overall(overall, rules)
+            risk_score.risk_factors = factors
+            risk_score.safe_mode_blocked = safe_mode["blocked"]
+            risk_score.safe_mode_violations = safe_mode["violations"] or None
+            risk_score.requires_senior_review = overall > rules["review_threshold"]
+            risk_score.rule_set_version = rules["version"]
+
+        expanded = self._expand_factors(factors)
+        risk_score.mitigation_suggestions = [
+            suggestion for factor, suggestion in MITIGATION_SUGGESTIONS.items() if expanded.get(factor)
+        ] or None
+        risk_score.deep_checked_at = datetime.utcnow()
+
+        await db.commit()
         return risk_score
 
+    async def run_deep_check_worker(self):
+        """Consume the deep-check queue; picks up unchecked scores left over from a restart first."""
+        from app.db.base import AsyncSessionLocal
+
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(RiskScore.id)
+                    .where(RiskScore.deep_checked_at == None)
+                    .order_by(RiskScore.created_at)
+                    .limit(DEEP_CHECK_BACKFILL_LIMIT)
+                )
+                for risk_score_id in result.scalars().all():
+                    self._deep_check_queue.put_nowait(risk_score_id)
+        except Exception as e:
+            logger.error(f"Failed to backfill risk deep-check queue: {e}")
+
+        while True:
+            risk_score_id = await self._deep_check_queue.get()
+            try:
+                async with AsyncSessionLocal() as db:
+                    await self.deep_check(risk_score_id, db)
+            except Exception as e:
+                logger.error(f"Risk deep check failed for {risk_score_id}: {e}")
+            finally:
+                self._deep_check_queue.task_done()
+
+    # ──────────────────────────────────────────────
+    # VECTORIZED RE-SCORING
+    # ──────────────────────────────────────────────
+
+    def score_matrix(self, factor_rows: Sequence[Dict[str, bool]], rules: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """
+        Score many stored factor dicts at once.
+        Produces the same numbers as calculate_scores/calculate_overall/classify_overall row by row.
+        """
+        factor_columns = FACTOR_NAMES + list(DERIVED_FACTORS)
+        matrix = np.zeros((len(factor_rows), len(factor_columns)), dtype=np.int32)
+        for row, factors in enumerate(factor_rows):
+            factors = factors or {}
+            for col, name in enumerate(FACTOR_NAMES):
+                if factors.get(name):
+                    matrix[row, col] = 1
+        for offset, sources in enumerate(DERIVED_FACTORS.values()):
+            source_cols = [FACTOR_NAMES.index(source) for source in sources]
+            matrix[:, len(FACTOR_NAMES) + offset] = matrix[:, source_cols].max(axis=1, initial=0)
+
+        weights = np.zeros((len(factor_columns), len(DIMENSIONS)), dtype=np.int32)
+        for factor, dims in rules["factor_weights"].items():
+            if factor not in factor_columns:
+                continue
+            for dimension, points in dims.items():
+                weights[factor_columns.index(factor), DIMENSIONS.index(dimension)] = points
+
+        scores = np.minimum(matrix @ weights, 100)
+
+        # Accumulate in the same order as calculate_overall so rounding matches exactly
+        dimension_weights = rules["dimension_weights"]
+        overall = np.zeros(len(factor_rows), dtype=np.float64)
+        for col, dimension in enumerate(DIMENSIONS):
+            overall = overall + scores[:, col] * dimension_weights.get(dimension, 0.0)
+        overall = np.rint(overall).astype(np.int64)
+
+        thresholds = rules["classification_thresholds"]
+        classification = np.full(len(factor_rows), "Low", dtype=object)
+        # Apply from the lowest band up so the highest matching band wins
+        for lower_bound, label in reversed(thresholds):
+            classification[overall > lower_bound] = label
+
+        return {
+            "legal": scores[:, 0],
+            "defamation": scores[:, 1],
+            "platform": scores[:, 2],
+            "political": scores[:, 3],
+            "overall": overall,
+            "classification": classification,
+            "requires_review": overall > rules["review_threshold"],
+        }
+
+    async def rescore_all(
+        self,
+        db: AsyncSession,
+        rules: Optional[Dict[str, Any]] = None,
+        batch_size: int = 5000,
+        reanalyze: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Recompute stored risk scores that were produced by another rule set version.
+        Uses the persisted risk_factors; article text is only re-read when reanalyze=True
+        (needed after a lexicon change).
+        """
+        rules = rules or await self.get_active_rules(db)
+        version = rules["version"]
+        started = time.monotonic()
+        updated = 0
+        last_id = None
+
+        while True:
+            query = select(RiskScore.id, RiskScore.risk_factors).where(
+                or_(RiskScore.rule_set_version != version, RiskScore.rule_set_version == None)
+            )
+            if reanalyze:
+                query = select(
+                    RiskScore.id, RiskScore.risk_factors,
+                    NormalizedArticle.headline, NormalizedArticle.summary, NormalizedArticle.tags,
+                ).join(NormalizedArticle, NormalizedArticle.id == RiskScore.article_id).where(
+                    or_(RiskScore.rule_set_version != version, RiskScore.rule_set_version == None)
+                )
+            if last_id is not None:
+                query = query.where(RiskScore.id > last_id)
+            query = query.order_by(RiskScore.id).limit(batch_size)
+
+            rows = (await db.execute(query)).all()
+            if not rows:
+                break
+
+            if reanalyze:
+                factor_rows = [
+                    self.analyze_content(
+                        NormalizedArticle(headline=row.headline, summary=row.summary, tags=row.tags), rules
+                    )
+                    for row in rows
+                ]
+            else:
+                factor_rows = [row.risk_factors or {} for row in rows]
+
+            result = self.score_matrix(factor_rows, rules)
+            params = []
+            for i, row in enumerate(rows):
+                values = {
+                    "id": row.id,
+                    "legal_risk": int(result["legal"][i]),
+                    "defamation_risk": int(result["defamation"][i]),
+                    "platform_risk": int(result["platform"][i]),
+                    "political_risk": int(result["political"][i]),
+                    "overall_score": int(result["overall"][i]),
+                    "classification": str(result["classification"][i]),
+                    "requires_senior_review": bool(result["requires_review"][i]),
+                    "rule_set_version": version,
+                }
+                if reanalyze:
+                    values["risk_factors"] = factor_rows[i]
+                params.append(values)
+
+            await db.execute(update(RiskScore), params)
+            await db.commit()
+
+            updated += len(rows)
+            last_id = rows[-1].id
+            logger.info(f"Risk re-score: {updated} rows updated to rule set v{version}")
+
+        elapsed = round(time.monotonic() - started, 2)
+        logger.info(f"Risk re-score finished: {updated} rows in {elapsed}s (rule set v{version})")
+        return {"version": version, "updated": updated, "elapsed_seconds": elapsed}
+
 
 risk_service = RiskService()
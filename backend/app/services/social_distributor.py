@@ -56,6 +56,8 @@ class SocialDistributor:
             content_type: "video", "report", or "summary"
             platforms: List of platform keys (e.g., ["telegram", "youtube"])
             params: Dictionary containing media paths, titles, descriptions, etc.
+                (`thumbnail_paths` maps platform keys to a size-specific thumbnail
+                and takes precedence over a shared `thumbnail_path`)
             profile_configs: Optional platform-specific credentials from a Profile
         """
         results = {}
@@ -77,7 +79,8 @@ class SocialDistributor:
                         video_path=params.get("video_path"),
                         title=params.get("title", ""),
                         description=params.get("description", ""),
-                        thumbnail_path=params.get("thumbnail_path"),
+                        thumbnail_path=(params.get("thumbnail_paths") or {}).get(platform_key)
+                        or params.get("thumbnail_path"),
                         config=platform_config
                     )
                 elif content_type == "report":
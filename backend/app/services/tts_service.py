@@ -2,16 +2,51 @@
 Text-to-Speech Service
 Multi-engine TTS: Edge-TTS (free, high quality) | ElevenLabs (paid) | Piper (offline) | gTTS (fallback)
 """
+import asyncio
 import os
-import uuid
 import logging
+import re
+import unicodedata
+from functools import lru_cache
+from importlib import metadata
+from typing import Optional, Dict, Any, List
+
 import httpx
-from typing import Optional, Dict, Any
 
 from app.core.config import settings
+from app.core.tracing import span
 
 logger = logging.getLogger(__name__)
 
+ELEVENLABS_MODEL = "eleven_monolingual_v1"
+ELEVENLABS_DEFAULT_VOICE = "21m00Tcm4TlvDq8ikWAM"  # Rachel
+
+# Distribution whose version is part of an engine's cache key (a new release may sound different)
+ENGINE_PACKAGES = {"edge_tts": "edge-tts", "piper": "piper-tts", "gtts": "gTTS"}
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=\S)")
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form of narration text: NFC, straight quotes, single spaces."""
+    text = unicodedata.normalize("NFC", text)
+    text = text.translate(str.maketrans({"\u2018": "'", "\u2019": "'", "\u201c": '"', "\u201d": '"'}))
+    return " ".join(text.split())
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s for s in _SENTENCE_END.split(normalize_text(text)) if s]
+
+
+@lru_cache(maxsize=None)
+def engine_version(engine: str) -> Optional[str]:
+    if engine == "elevenlabs":
+        return ELEVENLABS_MODEL
+    try:
+        return metadata.version(ENGINE_PACKAGES[engine])
+    except (KeyError, metadata.PackageNotFoundError):
+        return None
+
 
 class TTSService:
     """Multi-engine Text-to-Speech service."""
@@ -40,24 +75,69 @@ class TTSService:
     ) -> Dict[str, Any]:
         """
         Generate audio from text. Supports overrides from a Profile persona.
+        Identical (normalized) text + resolved voice + engine + engine version is served from
+        the artifact store; results carry the exact `duration_us` either way.
         """
-        if not filename:
-            filename = f"{uuid.uuid4().hex}.mp3"
-        output_path = os.path.join(self.output_dir, filename)
+        from app.services.artifact_store import artifact_store
+        from app.services.media_probe import media_probe
+        from app.services.video_service import video_render_service
 
         # Profile Overrides
         engine = profile.get("voice_engine", self.engine) if profile else self.engine
         voice = profile.get("voice_id", voice_id) if profile else voice_id
 
-        # Engine priority
-        if engine == "elevenlabs" and self.api_key:
-            return await self._elevenlabs_generate(text, voice, output_path)
-        elif engine == "edge_tts":
-            return await self._edge_tts_generate(text, voice, output_path)
-        elif engine == "piper":
-            return await self._piper_tts_generate(text, output_path)
-        else:
-            return await self._gtts_fallback(text, output_path)
+        # Engine that will actually run (mirrors the priority chain below)
+        if (engine == "elevenlabs" and not self.api_key) or engine not in ("elevenlabs", "edge_tts", "piper"):
+            engine = "gtts"
+
+        text = normalize_text(text)
+        key = artifact_store.make_key(
+            "audio",
+            text=text,
+            voice=self._resolve_voice(engine, voice),
+            engine=engine,
+            engine_version=engine_version(engine),
+        )
+        with span("tts", engine=engine, chars=len(text)):
+            async with artifact_store.lock(key):
+                cached = await artifact_store.lookup(key)
+                if cached:
+                    return cached
+
+                if not filename:
+                    filename = f"{key[:32]}.mp3"
+                output_path = os.path.join(self.output_dir, filename)
+
+                # Engine priority
+                if engine == "elevenlabs":
+                    result = await self._elevenlabs_generate(text, voice, output_path)
+                elif engine == "edge_tts":
+                    result = await self._edge_tts_generate(text, voice, output_path)
+                elif engine == "piper":
+                    result = await self._piper_tts_generate(text, output_path)
+                else:
+                    result = await self._gtts_fallback(text, output_path)
+
+                if "error" not in result:
+                    duration = await media_probe.duration(result["path"])
+                    result["duration_us"] = round((duration or result["duration_seconds"]) * 1_000_000)
+                    # Measured once here; renders master the narration with these stats
+                    result["loudness"] = await video_render_service.measure_loudness(result["path"])
+
+                # Only cache what the requested engine produced, not a fallback
+                if "error" not in result and result.get("engine") == engine:
+                    await artifact_store.store(key, "audio", result["path"], result.get("url"), meta=result)
+                return result
+
+    def _resolve_voice(self, engine: str, voice_id: str) -> str:
+        """The voice an engine will actually use for `voice_id`."""
+        if engine == "edge_tts":
+            return voice_id if voice_id != "default" else self.edge_voice
+        if engine == "piper":
+            return self.piper_model
+        if engine == "elevenlabs":
+            return voice_id if voice_id != "default" else ELEVENLABS_DEFAULT_VOICE
+        return "en"
 
     # ─────────────────────────────────────────────
     # ENGINE: Edge-TTS (Free, Cloud, High Quality)
@@ -100,45 +180,11 @@ class TTSService:
     async def _piper_tts_generate(
         self, text: str, output_path: str
     ) -> Dict[str, Any]:
-        """Generate audio using Piper TTS (offline, local)."""
-        try:
-            import subprocess
-            import wave
-            import io
-
-            # Piper outputs WAV, we'll convert to MP3
-            wav_path = output_path.replace(".mp3", ".wav")
-
-            # Use piper CLI which auto-downloads models
-            cmd = [
-                "piper",
-                "--model", self.piper_model,
-                "--output_file", wav_path,
-            ]
-
-            process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            stdout, stderr = process.communicate(input=text.encode("utf-8"))
+        """Generate audio using Piper TTS (offline, local) on the persistent worker pool."""
+        from app.services.piper_pool import piper_pool
 
-            if process.returncode != 0:
-                logger.error(f"Piper TTS failed: {stderr.decode()}")
-                return await self._gtts_fallback(text, output_path)
-
-            # Convert WAV to MP3 using ffmpeg
-            mp3_cmd = [
-                "ffmpeg", "-y", "-i", wav_path,
-                "-codec:a", "libmp3lame", "-b:a", "192k",
-                output_path,
-            ]
-            subprocess.run(mp3_cmd, capture_output=True)
-
-            # Clean up WAV
-            if os.path.exists(wav_path):
-                os.remove(wav_path)
+        try:
+            await piper_pool.synthesize(text, output_path, self.piper_model)
 
             file_size = os.path.getsize(output_path)
             duration = await self._get_audio_duration(output_path)
@@ -165,7 +211,7 @@ class TTSService:
         import httpx
 
         if voice_id == "default":
-            voice_id = "21m00Tcm4TlvDq8ikWAM"  # Rachel
+            voice_id = ELEVENLABS_DEFAULT_VOICE
 
         url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
         headers = {
@@ -175,7 +221,7 @@ class TTSService:
         }
         payload = {
             "text": text,
-            "model_id": "eleven_monolingual_v1",
+            "model_id": ELEVENLABS_MODEL,
             "voice_settings": {"stability": 0.5, "similarity_boost": 0.75},
         }
 
@@ -246,17 +292,86 @@ class TTSService:
         except Exception:
             return 0.0
 
+    async def _generate_concurrently(
+        self, texts: List[str], voice_id: str, profile: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """generate_audio for every text, at most TTS_CONCURRENCY at a time, in input order."""
+        slots = asyncio.Semaphore(max(1, settings.TTS_CONCURRENCY))
+
+        async def one(text: str) -> Dict[str, Any]:
+            async with slots:
+                return await self.generate_audio(text, voice_id, profile=profile)
+
+        return await asyncio.gather(*(one(text) for text in texts))
+
+    async def generate_narration(
+        self, texts: List[str], voice_id: str = "default", profile: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Synthesize every scene (sentence by sentence with TTS_SENTENCE_CACHE, so a recurring
+        intro or sign-off is cached on its own) concurrently and join the clips gaplessly
+        into a single narration. `scene_durations` holds each scene's exact length so renders
+        can cut scenes on the narration instead of estimating from the script.
+        """
+        from app.services.artifact_store import artifact_store
+        from app.services.media_probe import media_probe
+        from app.services.video_service import video_render_service
+
+        scene_texts = [split_sentences(t) or [t] if settings.TTS_SENTENCE_CACHE else [t] for t in texts]
+        flat = [sentence for sentences in scene_texts for sentence in sentences]
+        if len(flat) == 1:
+            result = await self.generate_audio(flat[0], voice_id, profile=profile)
+            if "error" not in result:
+                result["scene_durations"] = [result["duration_us"] / 1_000_000]
+            return result
+
+        with span("tts.narration", scenes=len(texts), clips=len(flat)):
+            clips = await self._generate_concurrently(flat, voice_id, profile)
+            failed = next((clip for clip in clips if "error" in clip), None)
+            if failed:
+                return failed
+            scene_durations, start = [], 0
+            for sentences in scene_texts:
+                scene_clips = clips[start:start + len(sentences)]
+                scene_durations.append(sum(clip["duration_us"] for clip in scene_clips) / 1_000_000)
+                start += len(sentences)
+
+            key = artifact_store.make_key(
+                "narration", clips=[artifact_store.file_fingerprint(clip["path"]) for clip in clips]
+            )
+            async with artifact_store.lock(key):
+                cached = await artifact_store.lookup(key)
+                if cached:
+                    return cached
+
+                output_path = os.path.join(self.output_dir, f"narration_{key[:32]}.mp3")
+                error = await video_render_service.concat_audio([clip["path"] for clip in clips], output_path)
+                if error:
+                    return {"error": error}
+
+                engines = sorted({clip["engine"] for clip in clips})
+                duration = await media_probe.duration(output_path) or sum(scene_durations)
+                result = {
+                    "path": output_path,
+                    "url": f"/output/audio/{os.path.basename(output_path)}",
+                    "duration_seconds": duration,
+                    "duration_us": round(duration * 1_000_000),
+                    "file_size": os.path.getsize(output_path),
+                    "engine": engines[0] if len(engines) == 1 else "mixed",
+                    "scene_durations": scene_durations,
+                    "loudness": await video_render_service.measure_loudness(output_path),
+                }
+                await artifact_store.store(key, "audio", output_path, result["url"], meta=result)
+                return result
+
     async def generate_segment_audios(
         self, segments: list, voice_id: str = "default", profile: Optional[Dict[str, Any]] = None
     ) -> list:
-        """Generate audio for each script segment."""
+        """Generate audio for each script segment (concurrently)."""
+        indexed = [(i, segment) for i, segment in enumerate(segments) if segment.get("content", "")]
+        clips = await self._generate_concurrently([s["content"] for _, s in indexed], voice_id, profile)
         results = []
-        for i, segment in enumerate(segments):
-            content = segment.get("content", "")
-            if not content:
-                continue
-            filename = f"segment_{i}_{uuid.uuid4().hex[:8]}.mp3"
-            result = await self.generate_audio(content, voice_id, filename, profile=profile)
+        for (i, segment), result in zip(indexed, clips):
             result["segment_index"] = i
             result["segment_type"] = segment.get("type", "unknown")
             results.append(result)
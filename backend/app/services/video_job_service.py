@@ -0,0 +1,316 @@
+"""
+Video Job Queue Service
+DB-backed render queue: workers claim VideoJobs with SKIP LOCKED, heartbeat their lease,
+record per-stage progress and retry failures with exponential backoff.
+"""
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import or_, select, update
+
+from app.core.config import settings
+from app.db.base import AsyncSessionLocal
+from app.models.video import VideoJob, VideoJobStatus
+
+logger = logging.getLogger(__name__)
+
+# Statuses that mean a worker currently holds the job
+ACTIVE_STATUSES = [
+    VideoJobStatus.PROCESSING,
+    VideoJobStatus.TTS_GENERATING,
+    VideoJobStatus.AVATAR_RENDERING,
+    VideoJobStatus.VIDEO_COMPOSITING,
+]
+
+MAX_RETRY_DELAY_SECONDS = 3600
+
+
+class PermanentJobError(Exception):
+    """A failure that retrying cannot fix (missing script, empty content)."""
+
+
+class JobLeaseLost(Exception):
+    """The job was cancelled or handed to another worker while rendering."""
+
+
+class VideoJobService:
+    """Claims, runs and retries queued video jobs."""
+
+    def __init__(self):
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+
+    # ─── Queue operations ────────────────────────────────────────────────
+
+    def retry_delay(self, retry_count: int) -> timedelta:
+        """Exponential backoff for the given (1-based) retry number."""
+        seconds = settings.VIDEO_JOB_RETRY_BASE_SECONDS * (2 ** max(retry_count - 1, 0))
+        return timedelta(seconds=min(seconds, MAX_RETRY_DELAY_SECONDS))
+
+    async def claim_next(self) -> Optional[Any]:
+        """Lease the highest-priority runnable job; returns its id or None."""
+        now = datetime.utcnow()
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(VideoJob)
+                .where(
+                    VideoJob.status == VideoJobStatus.QUEUED,
+                    or_(VideoJob.next_attempt_at.is_(None), VideoJob.next_attempt_at <= now),
+                )
+                .order_by(VideoJob.priority.desc(), VideoJob.created_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            job = result.scalar_one_or_none()
+            if not job:
+                return None
+
+            job.status = VideoJobStatus.PROCESSING
+            job.worker_id = self.worker_id
+            job.heartbeat_at = now
+            job.processing_started_at = now
+            job.next_attempt_at = None
+            await db.commit()
+            logger.info(f"Worker {self.worker_id} claimed video job {job.id} (priority {job.priority})")
+            return job.id
+
+    async def heartbeat(self, job_id) -> bool:
+        """Refresh the lease. False means the job was cancelled or another worker took it over."""
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                update(VideoJob)
+                .where(
+                    VideoJob.id == job_id,
+                    VideoJob.worker_id == self.worker_id,
+                    VideoJob.status.in_(ACTIVE_STATUSES),
+                )
+                .values(heartbeat_at=datetime.utcnow())
+            )
+            await db.commit()
+            return result.rowcount > 0
+
+    async def requeue_stale(self) -> int:
+        """Treat jobs whose worker stopped heartbeating as failed attempts."""
+        now = datetime.utcnow()
+        cutoff = now - timedelta(seconds=settings.VIDEO_JOB_STALE_SECONDS)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(VideoJob)
+                .where(VideoJob.status.in_(ACTIVE_STATUSES), VideoJob.heartbeat_at < cutoff)
+                .with_for_update(skip_locked=True)
+            )
+            jobs = result.scalars().all()
+            for job in jobs:
+                logger.warning(f"Video job {job.id} lost its worker ({job.worker_id}); requeueing")
+                self._record_failure(job, f"Worker {job.worker_id} stopped heartbeating", now)
+            await db.commit()
+            return len(jobs)
+
+    async def release(self, job_id):
+        """Return a job to the queue without spending a retry (worker shutdown)."""
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(VideoJob)
+                .where(
+                    VideoJob.id == job_id,
+                    VideoJob.worker_id == self.worker_id,
+                    VideoJob.status.in_(ACTIVE_STATUSES),
+                )
+                .values(status=VideoJobStatus.QUEUED, worker_id=None, heartbeat_at=None)
+            )
+            await db.commit()
+
+    async def fail(self, job_id, message: str, retryable: bool = True):
+        async with AsyncSessionLocal() as db:
+            job = await db.get(VideoJob, job_id, with_for_update=True)
+            if not job or job.worker_id != self.worker_id or job.status not in ACTIVE_STATUSES:
+                return
+            self._record_failure(job, message, datetime.utcnow(), retryable)
+            await db.commit()
+
+    def _record_failure(self, job: VideoJob, message: str, now: datetime, retryable: bool = True):
+        job.retry_count = (job.retry_count or 0) + 1
+        job.error_message = message[:2000]
+        job.worker_id = None
+        job.heartbeat_at = None
+
+        max_retries = job.max_retries if job.max_retries is not None else 3
+        if retryable and job.retry_count <= max_retries:
+            job.status = VideoJobStatus.QUEUED
+            job.next_attempt_at = now + self.retry_delay(job.retry_count)
+            logger.warning(
+                f"Video job {job.id} failed (attempt {job.retry_count}/{max_retries + 1}); "
+                f"retrying at {job.next_attempt_at.isoformat()}: {message}"
+            )
+        else:
+            job.status = VideoJobStatus.FAILED
+            job.processing_completed_at = now
+            logger.error(f"Video job {job.id} failed permanently: {message}")
+
+    # ─── Execution ───────────────────────────────────────────────────────
+
+    async def process(self, job_id):
+        """Run a claimed job, heartbeating until it finishes or the lease is lost."""
+        render = asyncio.create_task(self._render_job(job_id))
+        try:
+            while True:
+                done, _ = await asyncio.wait({render}, timeout=settings.VIDEO_WORKER_HEARTBEAT_SECONDS)
+                if done:
+                    break
+                if not await self.heartbeat(job_id):
+                    logger.warning(f"Video job {job_id} was cancelled or reassigned; stopping render")
+                    render.cancel()
+                    await asyncio.gather(render, return_exceptions=True)
+                    return
+            render.result()
+        except JobLeaseLost:
+            logger.warning(f"Video job {job_id} was cancelled or reassigned; dropping result")
+        except asyncio.CancelledError:
+            render.cancel()
+            await asyncio.gather(render, return_exceptions=True)
+            await self.release(job_id)
+            raise
+        except PermanentJobError as e:
+            await self.fail(job_id, str(e), retryable=False)
+        except Exception as e:
+            logger.error(f"Video job {job_id} failed: {e}")
+            await self.fail(job_id, str(e))
+
+    async def _render_job(self, job_id):
+        from app.models.script import Script
+        from app.services.tts_service import tts_service
+        from app.services.avatar_service import avatar_service
+        from app.services.video_service import video_render_service
+
+        async with AsyncSessionLocal() as db:
+            job = await db.get(VideoJob, job_id)
+            script = await db.get(Script, job.script_id)
+            if not script:
+                raise PermanentJobError("Script not found")
+
+            text = script.full_script
+            if not text and script.segments:
+                text = " ".join(seg.get("content", "") for seg in script.segments if seg.get("content"))
+            if not text:
+                raise PermanentJobError("Script has no content to render")
+
+            with_avatar = job.job_type != "short"
+            stages = ["tts", "avatar", "compositing", "thumbnail"] if with_avatar else ["tts", "compositing", "thumbnail"]
+
+            # ── TTS (reused from an earlier attempt when the file survived) ──
+            tts = (job.stage_progress or {}).get("tts", {})
+            audio_path = tts.get("path")
+            loudness = tts.get("loudness")
+            if tts.get("status") != "completed" or not audio_path or not os.path.exists(audio_path):
+                await self._set_stage(db, job, stages, "tts", "running", VideoJobStatus.TTS_GENERATING)
+                audio = await tts_service.generate_audio(text)
+                if "error" in audio:
+                    raise RuntimeError(f"TTS: {audio['error']}")
+                audio_path = audio["path"]
+                loudness = audio.get("loudness")
+                job.tts_audio_url = audio.get("url")
+                await self._set_stage(
+                    db, job, stages, "tts", "completed", path=audio_path, url=audio.get("url"), loudness=loudness
+                )
+
+            # ── Avatar ──
+            avatar_path = None
+            if with_avatar:
+                await self._set_stage(db, job, stages, "avatar", "running", VideoJobStatus.AVATAR_RENDERING)
+                avatar = await avatar_service.generate_lipsync(audio_url=audio_path)
+                if avatar.get("skipped") or avatar.get("fallback"):
+                    await self._set_stage(db, job, stages, "avatar", "skipped", reason=avatar.get("reason") or avatar.get("error", ""))
+                elif "error" in avatar:
+                    raise RuntimeError(f"Avatar: {avatar['error']}")
+                else:
+                    avatar_path = avatar["path"]
+                    job.avatar_video_url = avatar.get("url")
+                    await self._set_stage(db, job, stages, "avatar", "completed", path=avatar_path, url=avatar.get("url"))
+
+            # ── Compositing ──
+            await self._set_stage(db, job, stages, "compositing", "running", VideoJobStatus.VIDEO_COMPOSITING)
+
+            async def on_render_progress(fraction: float):
+                # Raises JobLeaseLost if the job was cancelled, which kills the FFmpeg process
+                await self._set_stage(db, job, stages, "compositing", "running", percent=round(fraction * 100))
+
+            if avatar_path:
+                video = await video_render_service.render_presenter_video(
+                    audio_path=audio_path,
+                    avatar_video_path=avatar_path,
+                    headline=script.title,
+                    lower_third_text=script.topic or script.title,
+                    on_progress=on_render_progress,
+                    loudness=loudness,
+                )
+            else:
+                video = await video_render_service.render_short_clip(
+                    audio_path=audio_path,
+                    headline=script.title,
+                    script_text=text,
+                    on_progress=on_render_progress,
+                    loudness=loudness,
+                )
+            if "error" in video:
+                raise RuntimeError(f"Render: {video['error']}")
+            await self._set_stage(db, job, stages, "compositing", "completed", path=video["path"], url=video["url"])
+
+            # ── Thumbnail (best effort) ──
+            # Short clips carry thumbnails cut from their own title card
+            thumb = (video.get("thumbnails") or {}).get("youtube")
+            if not thumb or not os.path.exists(thumb["path"]):
+                thumb = await video_render_service.create_thumbnail(script.title)
+            if "error" in thumb:
+                await self._set_stage(db, job, stages, "thumbnail", "skipped", reason=thumb["error"])
+            else:
+                job.thumbnail_url = thumb["url"]
+                await self._set_stage(db, job, stages, "thumbnail", "completed", url=thumb["url"])
+
+            await self._ensure_lease(db, job)
+            job.final_video_url = video["url"]
+            job.duration_seconds = int(video.get("duration_seconds") or 0)
+            job.file_size_bytes = video.get("file_size")
+            job.status = VideoJobStatus.COMPLETED
+            job.progress_percent = 100.0
+            job.current_stage = None
+            job.error_message = None
+            job.worker_id = None
+            job.heartbeat_at = None
+            job.processing_completed_at = datetime.utcnow()
+            await db.commit()
+            logger.info(f"Video job {job_id} completed: {job.final_video_url}")
+
+    async def _ensure_lease(self, db, job: VideoJob):
+        """Never overwrite a job that was cancelled or reassigned mid-render."""
+        await db.refresh(job, attribute_names=["status", "worker_id"])
+        if job.worker_id != self.worker_id or job.status not in ACTIVE_STATUSES:
+            raise JobLeaseLost()
+
+    async def _set_stage(
+        self,
+        db,
+        job: VideoJob,
+        stages,
+        stage: str,
+        state: str,
+        status: Optional[VideoJobStatus] = None,
+        **details: Any,
+    ):
+        """Record a stage transition in stage_progress and commit it so pollers see it."""
+        await self._ensure_lease(db, job)
+        progress: Dict[str, Any] = dict(job.stage_progress or {})
+        progress[stage] = {"status": state, "updated_at": datetime.utcnow().isoformat(), **details}
+        job.stage_progress = progress
+        job.current_stage = stage
+        if status:
+            job.status = status
+        finished = sum(1 for s in stages if progress.get(s, {}).get("status") in ("completed", "skipped"))
+        partial = progress[stage].get("percent", 0) / 100 if state == "running" else 0
+        job.progress_percent = round(100.0 * (finished + partial) / len(stages), 1)
+        await db.commit()
+
+
+video_job_service = VideoJobService()
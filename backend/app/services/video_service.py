@@ -1,19 +1,141 @@
 """
 Video Rendering Service
 Composites audio, graphics, and presenter video into final output using FFmpeg.
+FFmpeg/ffprobe run as asyncio subprocesses so renders never block the event loop;
+renders share a process-wide slot pool sized to the CPU count.
 """
+import asyncio
+import json
+import math
 import os
-import uuid
 import logging
-import subprocess
 import re
-import json
-from typing import Optional, Dict, Any, List
+import shutil
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Callable, Awaitable, Tuple
 
 from app.core.config import settings
+from app.core.tracing import span
+from app.services.artifact_store import artifact_store
+from app.services.media_probe import FONT_CANDIDATES, media_probe
 
 logger = logging.getLogger(__name__)
 
+# Called with the completed fraction (0.0-1.0) of a render; raising aborts the render
+ProgressCallback = Callable[[float], Awaitable[None]]
+
+# Progress is reported in steps of this fraction to keep listeners cheap
+PROGRESS_STEP = 0.05
+
+VIDEO_FPS = 30
+FRAME_WIDTH, FRAME_HEIGHT = 1080, 1920
+
+
+
+@dataclass(frozen=True)
+class RenderTier:
+    """Output geometry and encoder settings for a short clip render."""
+    name: str
+    width: int
+    height: int
+    fps: int
+    preset: str
+    crf: int
+    audio_bitrate: str
+
+    def px(self, value: float) -> int:
+        """Scale a pixel size laid out for the 1080x1920 frame to this tier."""
+        return max(1, int(round(value * self.height / FRAME_HEIGHT)))
+
+
+# "preview" keeps the full scene/caption spec but renders a quarter of the pixels at half the
+# frame rate with the fastest encoder settings, for checking timing and captions
+RENDER_TIERS = {
+    "full": RenderTier("full", FRAME_WIDTH, FRAME_HEIGHT, VIDEO_FPS, "veryfast", 20, "192k"),
+    "preview": RenderTier("preview", 540, 960, 15, "ultrafast", 32, "96k"),
+}
+FULL_TIER = RENDER_TIERS["full"]
+
+BRANDING_TEXT = "@StrategicContext"
+# Bump when the static chrome layout changes so cached layers are rebuilt
+CHROME_VERSION = 1
+
+# Thumbnails cut from the title card during the full-quality render, one per distribution
+# target (Telegram rejects video thumbs larger than 320px on either side)
+THUMBNAIL_SIZES = {
+    "youtube": (720, 1280),
+    "discord": (540, 960),
+    "telegram": (180, 320),
+}
+
+# loudnorm loudness range target (LU); integrated and true-peak targets come from settings
+LOUDNESS_RANGE = 11.0
+LOUDNESS_CACHE_SIZE = 256
+# Music gain when the track cannot be measured: the old fixed volume=0.12
+MUSIC_FALLBACK_GAIN_DB = -18.4
+# Bump when the mastering chain changes so cached mixes are rebuilt
+MASTERING_VERSION = 1
+
+# Ken Burns stills are pre-scaled this much larger than the frame; the crop pans across the slack
+PAN_MARGIN = 1.15
+
+# Impact keywords for yellow caption highlighting
+HIGHLIGHT_KEYWORDS = {
+    "conflict", "surge", "ceasefire", "attack", "crisis", "war",
+    "strike", "escalation", "missile", "rebel", "military",
+    "agreement", "deal", "threat", "sanctions", "nuclear",
+    "troops", "invasion", "bombing", "killed", "tension"
+}
+
+_NAMED_COLORS = {
+    "white": "#FFFFFF", "black": "#000000", "yellow": "#FFFF00", "red": "#FF0000",
+    "green": "#00FF00", "blue": "#0000FF", "gold": "#FFD700", "orange": "#FFA500",
+}
+
+
+def _ass_color(color: str) -> str:
+    """CSS-style color (#RRGGBB or a basic name) as an ASS &HBBGGRR& override; unknown values fall back to white."""
+    value = _NAMED_COLORS.get(color.lower(), color) if color else "#FFFFFF"
+    if not re.fullmatch(r"#[0-9A-Fa-f]{6}", value):
+        value = "#FFFFFF"
+    r, g, b = value[1:3], value[3:5], value[5:7]
+    return f"&H{b}{g}{r}&".upper()
+
+
+def _ass_time(seconds: float) -> str:
+    """Seconds as an ASS H:MM:SS.cc timestamp."""
+    centis = max(0, int(round(seconds * 100)))
+    hours, centis = divmod(centis, 360000)
+    minutes, centis = divmod(centis, 6000)
+    secs, centis = divmod(centis, 100)
+    return f"{hours}:{minutes:02d}:{secs:02d}.{centis:02d}"
+
+
+def _filter_path(path: str) -> str:
+    """Escape a file path for use as a quoted filter option value."""
+    return path.replace("\\", "/").replace(":", "\\:")
+
+
+_render_slots: Optional[asyncio.Semaphore] = None
+
+
+def _render_slot() -> asyncio.Semaphore:
+    """Process-wide cap on concurrent FFmpeg renders (FFMPEG_MAX_CONCURRENCY, default CPU count)."""
+    global _render_slots
+    if _render_slots is None:
+        _render_slots = asyncio.Semaphore(settings.FFMPEG_MAX_CONCURRENCY or os.cpu_count() or 1)
+    return _render_slots
+
+
+async def _kill(process: asyncio.subprocess.Process):
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
 
 class VideoRenderService:
     """Video rendering service using FFmpeg for compositing."""
@@ -23,33 +145,78 @@ class VideoRenderService:
         self.short_clip_dir = os.path.join(self.output_dir, "shorts")
         self.presenter_dir = os.path.join(self.output_dir, "presenter")
         self.thumbnail_dir = os.path.join(self.output_dir, "thumbnails")
+        self.stills_dir = os.path.join(self.short_clip_dir, "stills")
+        self.chrome_dir = os.path.join(self.short_clip_dir, "chrome")
+        self.mastered_dir = os.path.join(self.output_dir, "audio", "mastered")
+        # loudnorm analysis by (path, size, mtime_ns)
+        self._loudness: "OrderedDict[Tuple[str, int, int], Optional[Dict[str, float]]]" = OrderedDict()
 
-        for d in [self.output_dir, self.short_clip_dir, self.presenter_dir, self.thumbnail_dir]:
+        for d in [
+            self.output_dir, self.short_clip_dir, self.presenter_dir, self.thumbnail_dir,
+            self.stills_dir, self.chrome_dir, self.mastered_dir,
+        ]:
             os.makedirs(d, exist_ok=True)
 
-    def _check_ffmpeg(self) -> bool:
-        """Check if FFmpeg is available."""
-        try:
-            subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            logger.error("FFmpeg not found. Install it: apt-get install ffmpeg")
-            return False
+    async def _check_ffmpeg(self) -> bool:
+        """Check if FFmpeg is available (detected once per process)."""
+        return (await media_probe.capabilities())["available"]
+
+    async def _run_ffmpeg(
+        self,
+        args: List[str],
+        timeout: float,
+        op: str,
+        duration: Optional[float] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Tuple[int, str]:
+        """
+        Run `ffmpeg <args>` in a render slot and return (returncode, stderr).
+        Progress is parsed from `-progress pipe:1` and reported to `on_progress` when the
+        expected output `duration` is known. On timeout, cancellation or a raising
+        progress callback the FFmpeg process is killed before the exception propagates.
+        """
+        cmd = ["ffmpeg", "-hide_banner", "-nostats", "-progress", "pipe:1"] + args
+        async with _render_slot():
+            with span("ffmpeg", op=op):
+                process = await asyncio.create_subprocess_exec(
+                    *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+                )
+                stderr_task = asyncio.create_task(process.stderr.read())
+                try:
+                    await asyncio.wait_for(
+                        self._follow_progress(process, duration, on_progress), timeout=timeout
+                    )
+                    stderr = await stderr_task
+                except BaseException:
+                    await _kill(process)
+                    stderr_task.cancel()
+                    raise
+        return process.returncode, stderr.decode("utf-8", errors="replace")
+
+    async def _follow_progress(
+        self,
+        process: asyncio.subprocess.Process,
+        duration: Optional[float],
+        on_progress: Optional[ProgressCallback],
+    ):
+        reported = 0.0
+        async for raw in process.stdout:
+            key, _, value = raw.decode("utf-8", errors="replace").strip().partition("=")
+            if not on_progress or not duration:
+                continue
+            if key == "out_time_us" and value.isdigit():
+                fraction = min(1.0, int(value) / 1_000_000 / duration)
+                if fraction - reported >= PROGRESS_STEP:
+                    reported = fraction
+                    await on_progress(fraction)
+            elif key == "progress" and value == "end" and reported < 1.0:
+                reported = 1.0
+                await on_progress(1.0)
+        await process.wait()
 
     def _find_font(self) -> str:
         """Find a usable TrueType font. Returns path or empty string."""
-        candidates = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-            "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
-            "C:/Windows/Fonts/arial.ttf",
-        ]
-        for font in candidates:
-            if os.path.exists(font):
-                return font
-        logger.warning("No TrueType font found, captions will use FFmpeg default")
-        return ""
+        return media_probe.find_font()
 
     async def render_short_clip(
         self,
@@ -62,7 +229,12 @@ class VideoRenderService:
         music_path: Optional[str] = None,
         profile: Optional[Dict[str, Any]] = None,
         scenes: Optional[List[Dict[str, Any]]] = None,
-        sentiment: str = "stable"
+        sentiment: str = "stable",
+        on_progress: Optional[ProgressCallback] = None,
+        mode: Optional[str] = None,
+        quality: str = "full",
+        loudness: Optional[Dict[str, float]] = None,
+        scene_durations: Optional[List[float]] = None,
     ) -> Dict[str, Any]:
         """
         Render a professional YouTube-quality short clip with:
@@ -75,60 +247,185 @@ class VideoRenderService:
         - Snappy 2-3 word captions with keyword highlighting
         - Animated progress bar
         - Branding watermark
+
+        `mode` (default VIDEO_RENDER_MODE) is "segmented" — every scene rendered as its own
+        segment in parallel, then joined by the concat demuxer with the audio mix — or
+        "single" for one monolithic filter graph. `quality` picks a RENDER_TIERS entry: "preview"
+        is a low-resolution draft of the same spec; re-rendering with "full" reuses its cached stills.
+        Narration and music go through `master_audio` once (pass the TTS result's `loudness` to
+        skip re-measuring it) and every tier and mode reuses the mastered mix. `scene_durations`
+        (per-scene narration lengths from `tts_service.generate_narration`) replace the scripted
+        `duration_seconds` so scene cuts land where each scene's narration ends.
         """
-        if not self._check_ffmpeg():
+        mode = mode or settings.VIDEO_RENDER_MODE
+        if scenes and scene_durations and len(scene_durations) == len(scenes) and all(d > 0 for d in scene_durations):
+            scenes = [{**scene, "duration_seconds": d} for scene, d in zip(scenes, scene_durations)]
+        tier = RENDER_TIERS.get(quality)
+        if tier is None:
+            return {"error": f"Unknown render quality: {quality}"}
+        key = artifact_store.make_key(
+            "short_clip",
+            audio=artifact_store.file_fingerprint(audio_path),
+            images=[artifact_store.file_fingerprint(p) for p in image_paths],
+            music=artifact_store.file_fingerprint(music_path),
+            headline=headline,
+            script_text=script_text,
+            colors=[background_color, text_color],
+            style=(profile or {}).get("video_style"),
+            scenes=scenes,
+            sentiment=sentiment,
+            mode=mode,
+            quality=tier.name,
+            mastering=MASTERING_VERSION,
+        )
+        cached = await artifact_store.lookup(key)
+        if cached:
+            return cached
+
+        if not await self._check_ffmpeg():
             return {"error": "FFmpeg not available"}
 
-        filename = f"short_{uuid.uuid4().hex[:12]}.mp4"
+        filename = f"{'short' if tier is FULL_TIER else tier.name}_{key[:16]}.mp4"
         output_path = os.path.join(self.short_clip_dir, filename)
 
         # 0. Style and Timing
         style = profile.get("video_style", {}) if profile else {}
         bg_color = style.get("backgroundColor", background_color)
         txt_color = style.get("textColor", text_color)
-        duration = self._get_media_duration(audio_path)
+        duration = await self._get_media_duration(audio_path)
         if duration <= 0: duration = 30
-        
-        # 1. Prepare Scenes and Normalization
+
+        # 1. Prepare Scenes
         if not scenes:
             scenes = [{"voiceover": script_text or headline, "duration_seconds": duration, "overlay_text": headline}]
-        
-        # Normalize scene durations to actual audio length
-        total_requested = sum(s.get("duration_seconds", 5) for s in scenes)
-        
-        # 2. Build Video Filter (Images with Ken Burns)
-        video_filters = []
-        inputs = []
-        font_path = self._find_font()
-        font_spec = f":fontfile='{font_path}'" if font_path else ""
-        
-        for i, scene in enumerate(scenes):
-            # Pick image for this scene (looping if needed)
-            img_idx = i % len(image_paths) if image_paths else -1
-            img = image_paths[img_idx] if img_idx >= 0 else None
-            
-            # Scene timing
-            scene_raw_dur = scene.get("duration_seconds", 5)
-            scene_duration = (scene_raw_dur / total_requested) * duration
-            
-            if img:
-                inputs.extend(["-loop", "1", "-t", f"{scene_duration:.2f}", "-i", img])
-                # Ken Burns effect specific to scene
-                zoom_dir = "min(zoom+0.001,1.3)" if i % 2 == 0 else "if(eq(on,1),1.3,max(zoom-0.001,1.0))"
-                video_filters.append(
-                    f"[{i}:v]scale=2160:-1,crop=1080:1920,"
-                    f"zoompan=z='{zoom_dir}':d={int(scene_duration*30)}:s=1080x1920"
-                    f":x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':fps=30[v{i}]"
-                )
+        if music_path and not os.path.exists(music_path):
+            music_path = None
+
+        # Full renders tee the title card into the thumbnail sizes within the same FFmpeg pass
+        thumbnails = {
+            name: os.path.join(self.thumbnail_dir, f"short_{key[:16]}_{name}.jpg") for name in THUMBNAIL_SIZES
+        } if tier is FULL_TIER else {}
+
+        render = self._render_segmented if mode == "segmented" else self._render_single
+        try:
+            # Each distinct image is scaled once (and cached) at the size a full-tier pan needs
+            unique_images = list(dict.fromkeys(image_paths))
+            stills = dict(zip(unique_images, await asyncio.gather(*(
+                self._prescale_still(p, FRAME_WIDTH, FRAME_HEIGHT) for p in unique_images
+            ))))
+            image_paths = [stills[p] for p in image_paths]
+            chrome_path = await self._chrome_layer(tier)
+            mastered = await self.master_audio(audio_path, music_path, loudness)
+            if "error" in mastered:
+                logger.warning(f"Audio mastering failed, mixing in the render instead: {mastered['error']}")
             else:
-                inputs.extend(["-f", "lavfi", "-i", f"color=c={bg_color}:s=1080x1920:d={scene_duration:.2f}:r=30"])
-                video_filters.append(f"[{i}:v]null[v{i}]")
+                audio_path, music_path = mastered["path"], None
+            error = await render(
+                output_path=output_path,
+                audio_path=audio_path,
+                music_path=music_path,
+                headline=headline,
+                image_paths=image_paths,
+                scenes=scenes,
+                duration=duration,
+                bg_color=bg_color,
+                txt_color=txt_color,
+                sentiment=sentiment,
+                on_progress=on_progress,
+                tier=tier,
+                chrome_path=chrome_path,
+                thumbnails=thumbnails,
+            )
+            if error:
+                return {"error": error}
 
-        # Concatenate scene clips
-        concat_filter = "".join([f"[v{i}]" for i in range(len(scenes))])
-        video_filters.append(f"{concat_filter}concat=n={len(scenes)}:v=1:a=0[rawbg]")
+            clip = {
+                "path": output_path,
+                "url": f"/output/shorts/{filename}",
+                "duration_seconds": duration,
+                "file_size": os.path.getsize(output_path),
+                "resolution": f"{tier.width}x{tier.height}",
+                "quality": tier.name,
+                "type": "short_clip",
+            }
+            thumbs = {}
+            for name, path in thumbnails.items():
+                if not os.path.exists(path):
+                    continue
+                width, height = THUMBNAIL_SIZES[name]
+                thumbs[name] = {
+                    "path": path,
+                    "url": f"/output/thumbnails/{os.path.basename(path)}",
+                    "width": width,
+                    "height": height,
+                }
+                thumb_key = artifact_store.make_key("thumbnail", short_clip=key, size=name)
+                await artifact_store.store(thumb_key, "thumbnail", path, thumbs[name]["url"], thumbs[name])
+            if thumbs:
+                clip["thumbnails"] = thumbs
+            await artifact_store.store(key, "short_clip", output_path, clip["url"], clip)
+            return clip
+        except asyncio.TimeoutError:
+            return {"error": "FFmpeg rendering timed out (5 min limit)"}
+        except Exception as e:
+            return {"error": str(e)}
+
+    # ─── Short clip filter building blocks ───────────────────────────────
 
-        # 3. Sentiment-based Color Grading
+    @staticmethod
+    def _scene_durations(scenes: List[Dict[str, Any]], duration: float) -> List[float]:
+        """Scale the scripted scene durations to the actual narration length."""
+        total_requested = sum(s.get("duration_seconds", 5) for s in scenes)
+        return [(s.get("duration_seconds", 5) / total_requested) * duration for s in scenes]
+
+    @staticmethod
+    def _pan_size(width: int, height: int) -> Tuple[int, int]:
+        """Still size for a Ken Burns pan over a width x height frame (even dimensions)."""
+        return int(width * PAN_MARGIN) // 2 * 2, int(height * PAN_MARGIN) // 2 * 2
+
+    @classmethod
+    def _still_filter(cls, width: int, height: int) -> str:
+        """Scale-to-cover and centre-crop an image to the pan size."""
+        pan_w, pan_h = cls._pan_size(width, height)
+        return f"scale={pan_w}:{pan_h}:force_original_aspect_ratio=increase,crop={pan_w}:{pan_h}"
+
+    @staticmethod
+    def _pan_filter(index: int, frames: int, width: int, height: int, fps: int = VIDEO_FPS) -> str:
+        """
+        Ken Burns motion on a single still: the frame is held in memory for `frames` frames and
+        a fixed-size crop window glides across it — no per-frame rescaling. The direction
+        alternates per scene (top-left to bottom-right, then back).
+        """
+        last = max(frames - 1, 1)
+        position = f"(n/{last})" if index % 2 == 0 else f"(1-n/{last})"
+        return (
+            f"format=yuv420p,loop=loop={frames - 1}:size=1:start=0,setpts=N/{fps}/TB,"
+            f"crop={width}:{height}:x='(iw-ow)*{position}':y='(ih-oh)*{position}'"
+        )
+
+    async def _prescale_still(self, image_path: str, width: int, height: int) -> str:
+        """
+        Scale an image once to the pan size for a width x height frame and cache it, keyed on the
+        source file and size. Falls back to the original (scaled in the render graph) on failure.
+        """
+        key = artifact_store.make_key(
+            "kenburns_still", image=artifact_store.file_fingerprint(image_path), size=[width, height]
+        )
+        still_path = os.path.join(self.stills_dir, f"still_{key[:16]}.png")
+        async with artifact_store.lock(key):
+            if os.path.exists(still_path):
+                return still_path
+            cmd = ["-y", "-i", image_path, "-vf", self._still_filter(width, height), "-frames:v", "1", still_path]
+            returncode, stderr = await self._run_ffmpeg(cmd, timeout=60, op="still")
+            if returncode != 0 or not os.path.exists(still_path):
+                logger.warning(f"Failed to pre-scale {image_path}: {stderr[-200:]}")
+                return image_path
+            await artifact_store.store(key, "kenburns_still", still_path)
+            return still_path
+
+    @staticmethod
+    def _grade(sentiment: str) -> str:
+        """Sentiment-based color grading."""
         color_grading = "null"
         if sentiment == "tense":
             # Desaturate and blue-ish tint
@@ -136,134 +433,410 @@ class VideoRenderService:
         elif sentiment == "hopeful":
             # Warm and vibrant
             color_grading = "eq=saturation=1.2:brightness=0.02,colorbalance=rt=0.05:gt=0.02"
+        return color_grading
 
-        video_filters.append(f"[rawbg]{color_grading}[gradedbg]")
+    @staticmethod
+    def _title_card(headline: str, title_duration: float, font_spec: str, tier: RenderTier = FULL_TIER) -> str:
+        safe_headline = re.sub(r"['\";\\()\[\]{}]", "", headline[:50]).replace(":", "\\:").replace(",", "\\,").replace("%", "%%")
+        px = tier.px
+        return (
+            f"drawtext=text='INTELLIGENCE REPORT':fontcolor=#C7A84A:fontsize={px(32)}{font_spec}"
+            f":x=(w-text_w)/2:y={px(250)}:borderw={px(2)}:bordercolor=black:enable='between(t,0,{title_duration})',"
+            f"drawtext=text='{safe_headline}':fontcolor=white:fontsize={px(56)}{font_spec}"
+            f":x=(w-text_w)/2:y=(h/2)-{px(60)}:borderw={px(3)}:bordercolor=black"
+            f":shadowcolor=black@0.8:shadowx={px(4)}:shadowy={px(4)}:enable='between(t,0,{title_duration})'"
+        )
 
-        # 4. Overlays (Gradient + Text)
-        video_filters.append(
-            f"[gradedbg]drawbox=x=0:y=ih*0.4:w=iw:h=ih*0.6:color=black@0.55:t=fill,"
-            f"drawbox=x=0:y=0:w=iw:h=ih*0.15:color=black@0.5:t=fill[bgv]"
+    @staticmethod
+    def _scene_overlay_text(
+        scene: Dict[str, Any], start: float, end: float, font_spec: str, tier: RenderTier = FULL_TIER
+    ) -> Optional[str]:
+        scene_text = scene.get("overlay_text", "").upper()
+        if not scene_text:
+            return None
+        safe_scene_text = re.sub(r"['\";\\()\[\]{}]", "", scene_text).replace(":", "\\:").replace(",", "\\,")
+        return (
+            f"drawtext=text='{safe_scene_text}':fontcolor=#FFD700:fontsize={tier.px(42)}{font_spec}"
+            f":x=(w-text_w)/2:y={tier.px(350)}:borderw={tier.px(3)}:bordercolor=black"
+            f":enable='between(t,{start:.2f},{end:.2f})'"
         )
 
-        overlay_filters = []
-        title_duration = min(3.0, duration * 0.1)
-        
-        # ── Title Card (only for first scene) ──
-        safe_headline = re.sub(r"['\";\\()\[\]{}]", "", headline[:50]).replace(":", "\\:").replace(",", "\\,").replace("%", "%%")
-        overlay_filters.append(
-            f"drawtext=text='INTELLIGENCE REPORT':fontcolor=#C7A84A:fontsize=32{font_spec}"
-            f":x=(w-text_w)/2:y=250:borderw=2:bordercolor=black:enable='between(t,0,{title_duration})',"
-            f"drawtext=text='{safe_headline}':fontcolor=white:fontsize=56{font_spec}"
-            f":x=(w-text_w)/2:y=(h/2)-60:borderw=3:bordercolor=black"
-            f":shadowcolor=black@0.8:shadowx=4:shadowy=4:enable='between(t,0,{title_duration})'"
+    @staticmethod
+    def _static_chrome(font_spec: str, tier: RenderTier = FULL_TIER) -> List[str]:
+        """
+        Per-frame filter fallback for the static chrome layer: gradient bands behind the text,
+        progress bar track, branding and LIVE badge. Only used when the cached PNG layer cannot
+        be built.
+        """
+        px = tier.px
+        return [
+            # Dark gradient bands for text readability
+            f"drawbox=x=0:y=ih*0.4:w=iw:h=ih*0.6:color=black@0.55:t=fill,"
+            f"drawbox=x=0:y=0:w=iw:h=ih*0.15:color=black@0.5:t=fill",
+            # Progress bar track
+            f"drawbox=x=0:y=h-{px(8)}:w=iw:h={px(8)}:color=white@0.15:t=fill",
+            # Branding
+            f"drawtext=text='{BRANDING_TEXT}':fontcolor=white@0.85:fontsize={px(28)}{font_spec}:x=(w-text_w)/2:y=h-{px(60)}:box=1:boxcolor=black@0.5:boxborderw={px(8)}",
+            # Badge
+            f"drawtext=text='LIVE':fontcolor=white:fontsize={px(24)}{font_spec}:x={px(50)}:y={px(50)}:box=1:boxcolor=red@0.8:boxborderw={px(10)}",
+        ]
+
+    @staticmethod
+    def _progress_fill(duration: float, time_offset: float = 0.0, tier: RenderTier = FULL_TIER) -> str:
+        """Animated progress bar fill; `time_offset` shifts it for mid-clip segments."""
+        elapsed = f"(t+{time_offset:.3f})" if time_offset else "t"
+        return f"drawbox=x=0:y=h-{tier.px(8)}:w='iw*{elapsed}/{duration:.2f}':h={tier.px(8)}:color=#C7A84A:t=fill"
+
+    async def _chrome_layer(self, tier: RenderTier = FULL_TIER) -> Optional[str]:
+        """
+        The static chrome as a transparent PNG for one overlay, built once per tier, font and
+        branding and cached. Returns None when it cannot be drawn (no Pillow or font).
+        """
+        font_path = self._find_font()
+        key = artifact_store.make_key(
+            "chrome",
+            version=CHROME_VERSION,
+            size=[tier.width, tier.height],
+            font=artifact_store.file_fingerprint(font_path),
+            branding=BRANDING_TEXT,
         )
+        chrome_path = os.path.join(self.chrome_dir, f"chrome_{key[:16]}.png")
+        async with artifact_store.lock(key):
+            if os.path.exists(chrome_path):
+                return chrome_path
+            if not font_path or not await asyncio.to_thread(self._draw_chrome, chrome_path, tier, font_path):
+                return None
+            await artifact_store.store(key, "chrome", chrome_path)
+            return chrome_path
+
+    @staticmethod
+    def _draw_chrome(path: str, tier: RenderTier, font_path: str) -> bool:
+        """Composite the static chrome layers (see _static_chrome) into an RGBA PNG."""
+        try:
+            from PIL import Image, ImageDraw, ImageFont
+        except ImportError:
+            logger.warning("Pillow not installed, drawing chrome with FFmpeg filters. Run: pip install Pillow")
+            return False
+
+        w, h, px = tier.width, tier.height, tier.px
+        canvas = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+
+        def layer(draw_fn):
+            # Each element on its own layer so overlapping translucent parts blend like drawbox/drawtext
+            nonlocal canvas
+            overlay = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+            draw_fn(ImageDraw.Draw(overlay))
+            canvas = Image.alpha_composite(canvas, overlay)
+
+        def boxed_text(text: str, size: int, position, fill, box_fill, border: int):
+            font = ImageFont.truetype(font_path, size)
+            left, top, right, bottom = ImageDraw.Draw(canvas).textbbox((0, 0), text, font=font)
+            x, y = position(right - left, bottom - top)
+            layer(lambda d: d.rectangle([x - border, y - border, x + right - left + border, y + bottom - top + border], fill=box_fill))
+            layer(lambda d: d.text((x - left, y - top), text, font=font, fill=fill))
+
+        layer(lambda d: d.rectangle([0, int(h * 0.4), w, h], fill=(0, 0, 0, 140)))
+        layer(lambda d: d.rectangle([0, 0, w, int(h * 0.15)], fill=(0, 0, 0, 128)))
+        layer(lambda d: d.rectangle([0, h - px(8), w, h], fill=(255, 255, 255, 38)))
+        boxed_text(BRANDING_TEXT, px(28), lambda tw, th: ((w - tw) // 2, h - px(60)),
+                   (255, 255, 255, 217), (0, 0, 0, 128), px(8))
+        boxed_text("LIVE", px(24), lambda tw, th: (px(50), px(50)),
+                   (255, 255, 255, 255), (255, 0, 0, 204), px(10))
+
+        canvas.save(path)
+        return True
+
+    @staticmethod
+    def _thumbnail_branch(frame: int, thumbnails: Dict[str, str]) -> Tuple[str, List[str]]:
+        """
+        Tail for a video filter chain that ends in [out_v] while teeing frame `frame` into one
+        scaled JPEG per `thumbnails` entry (name -> path), plus the output arguments for them.
+        """
+        names = list(thumbnails)
+        graph = f"split=2[out_v][thumb];[thumb]select='eq(n,{frame})',split={len(names)}"
+        graph += "".join(f"[thumb{i}]" for i in range(len(names)))
+        outputs = []
+        for i, name in enumerate(names):
+            width, height = THUMBNAIL_SIZES[name]
+            graph += f";[thumb{i}]scale={width}:{height}[thumb_{name}]"
+            outputs += ["-map", f"[thumb_{name}]", "-frames:v", "1", "-q:v", "2", thumbnails[name]]
+        return graph, outputs
+
+    @staticmethod
+    def _glitch(end: float) -> str:
+        """Noise burst over the last half second."""
+        return f"noise=alls=20:allf=t+u:enable='between(t,{end-0.5:.2f},{end:.2f})'"
+
+    @staticmethod
+    def _audio_mix(audio_idx: int, has_music: bool) -> str:
+        """
+        Narration plus (optionally) looped background music at 12%. Only used when mastering
+        failed; a mastered mix passes straight through.
+        """
+        mix_filter = f"[{audio_idx}:a]volume=1.0[main_a]"
+        if has_music:
+            mix_filter += f";[{audio_idx + 1}:a]volume=0.12,apad[bg_a]; [main_a][bg_a]amix=inputs=2:duration=first[out_a]"
+        else:
+            mix_filter += f";[main_a]anull[out_a]"
+        return mix_filter
+
+    # ─── Short clip render modes ─────────────────────────────────────────
+
+    async def _render_single(
+        self, output_path, audio_path, music_path, headline, image_paths, scenes, duration,
+        bg_color, txt_color, sentiment, on_progress, tier: RenderTier = FULL_TIER, chrome_path: Optional[str] = None,
+        thumbnails: Optional[Dict[str, str]] = None,
+    ) -> Optional[str]:
+        """One filter graph for the whole clip. Returns an error message or None."""
+        scene_durations = self._scene_durations(scenes, duration)
+        video_filters = []
+        inputs = []
+        font_path = self._find_font()
+        font_spec = f":fontfile='{font_path}'" if font_path else ""
 
-        # ── Per-Scene Overlays & Captions ──
+        # Images with Ken Burns: one input per distinct image, split across the scenes using it
+        scene_images = [image_paths[i % len(image_paths)] if image_paths else None for i in range(len(scenes))]
+        image_scenes: Dict[str, List[int]] = {}
+        for i, img in enumerate(scene_images):
+            if img:
+                image_scenes.setdefault(img, []).append(i)
+        input_count = 0
+        for img, scene_indexes in image_scenes.items():
+            inputs.extend(["-i", img])
+            labels = "".join(f"[s{i}]" for i in scene_indexes)
+            video_filters.append(
+                f"[{input_count}:v]{self._still_filter(tier.width, tier.height)},split={len(scene_indexes)}{labels}"
+            )
+            input_count += 1
+
+        for i, scene_duration in enumerate(scene_durations):
+            if scene_images[i]:
+                frames = max(1, int(scene_duration * tier.fps))
+                video_filters.append(f"[s{i}]{self._pan_filter(i, frames, tier.width, tier.height, tier.fps)}[v{i}]")
+            else:
+                inputs.extend(["-f", "lavfi", "-i", f"color=c={bg_color}:s={tier.width}x{tier.height}:d={scene_duration:.2f}:r={tier.fps}"])
+                video_filters.append(f"[{input_count}:v]null[v{i}]")
+                input_count += 1
+
+        # Concatenate scene clips, grade, then lay the static chrome over them
+        concat_filter = "".join([f"[v{i}]" for i in range(len(scenes))])
+        video_filters.append(f"{concat_filter}concat=n={len(scenes)}:v=1:a=0[rawbg]")
+        if chrome_path:
+            inputs.extend(["-i", chrome_path])
+            video_filters.append(f"[rawbg]{self._grade(sentiment)}[graded]")
+            video_filters.append(f"[graded][{input_count}:v]overlay=0:0[bgv]")
+            input_count += 1
+        else:
+            video_filters.append(f"[rawbg]{self._grade(sentiment)},{','.join(self._static_chrome(font_spec, tier))}[bgv]")
+
+        title_duration = min(3.0, duration * 0.1)
+        overlay_filters = [self._title_card(headline, title_duration, font_spec, tier)]
+
+        # Per-Scene Overlays & Captions
+        caption_events = []
         current_time = 3.0 # Start after title
-        for i, scene in enumerate(scenes):
-            scene_dur = (scene.get("duration_seconds", 5) / total_requested) * duration
+        for scene, scene_dur in zip(scenes, scene_durations):
             start = current_time
             end = current_time + scene_dur
             current_time = end
 
-            # Scene Overlay Text (Middle-top headline)
-            scene_text = scene.get("overlay_text", "").upper()
+            scene_text = self._scene_overlay_text(scene, start, end, font_spec, tier)
             if scene_text:
-                safe_scene_text = re.sub(r"['\";\\()\[\]{}]", "", scene_text).replace(":", "\\:").replace(",", "\\,")
-                overlay_filters.append(
-                    f"drawtext=text='{safe_scene_text}':fontcolor=#FFD700:fontsize=42{font_spec}"
-                    f":x=(w-text_w)/2:y=350:borderw=3:bordercolor=black"
-                    f":enable='between(t,{start:.2f},{end:.2f})'"
-                )
-
-            # Scene Captions (at bottom)
+                overlay_filters.append(scene_text)
             voiceover = scene.get("voiceover", "")
             if voiceover:
-                caption_f = self._create_caption_filter(voiceover, scene_dur, txt_color, start)
-                if caption_f: overlay_filters.append(caption_f)
-
-        # ── Constant Elements ──
-        overlay_filters.append(
-            # Progress Bar
-            f"drawbox=x=0:y=h-8:w=iw:h=8:color=white@0.15:t=fill,"
-            f"drawbox=x=0:y=h-8:w='iw*t/{duration:.2f}':h=8:color=#C7A84A:t=fill"
-        )
-        overlay_filters.append(
-            # Branding
-            f"drawtext=text='@StrategicContext':fontcolor=white@0.85:fontsize=28{font_spec}:x=(w-text_w)/2:y=h-60:box=1:boxcolor=black@0.5:boxborderw=8"
-        )
-        overlay_filters.append(
-            # Badge
-            f"drawtext=text='LIVE':fontcolor=white:fontsize=24{font_spec}:x=50:y=50:box=1:boxcolor=red@0.8:boxborderw=10"
-        )
+                caption_events.extend(self._caption_events(voiceover, scene_dur, txt_color, start))
 
-        # Final Glitch Effect (last 0.5s)
-        overlay_filters.append(
-            f"noise=alls=20:allf=t+u:enable='between(t,{duration-0.5:.2f},{duration:.2f})'"
-        )
+        captions_path = None
+        if caption_events:
+            captions_path = self._write_captions(os.path.splitext(output_path)[0] + ".ass", caption_events)
+            overlay_filters.append(self._caption_filter(captions_path))
 
-        # 5. FFmpeg Command Construction
-        all_overlays_str = ",".join(overlay_filters)
-        # Ensure there is a semicolon before the overlay chain if it's separate, 
-        # or just chain them if bgv is the last filter's output.
-        full_video_filter = ";".join(video_filters) + f";[bgv]{all_overlays_str}[out_v]"
-
-        # 4. Audio Mixing (TTS + Background Music)
-        # The audio input index will be after all image/color inputs.
-        # Each scene potentially adds one video input.
-        # So, the audio_path input index is len(scenes).
-        audio_input_idx = len(scenes) 
+        overlay_filters.append(self._progress_fill(duration, tier=tier))
+        overlay_filters.append(self._glitch(duration))
+        full_video_filter = ";".join(video_filters) + f";[bgv]{','.join(overlay_filters)}"
+        thumbnail_outputs = []
+        if thumbnails:
+            # Mid-way through the title card
+            tail, thumbnail_outputs = self._thumbnail_branch(int(title_duration / 2 * tier.fps), thumbnails)
+            full_video_filter += tail
+        else:
+            full_video_filter += "[out_v]"
+
+        # Audio Mixing (TTS + Background Music) after all image/color inputs
+        audio_input_idx = input_count
         inputs.extend(["-i", audio_path])
-        
-        mix_filter = f";[{audio_input_idx}:a]volume=1.0[main_a]"
-        if music_path and os.path.exists(music_path):
-            music_idx = audio_input_idx + 1 # Music input comes after the main audio input
+        if music_path:
             inputs.extend(["-stream_loop", "-1", "-i", music_path])
-            mix_filter += f";[{music_idx}:a]volume=0.12,apad[bg_a]; [main_a][bg_a]amix=inputs=2:duration=first[out_a]"
-        else:
-            mix_filter += f";[main_a]anull[out_a]"
 
-        # Full FFmpeg Command
         cmd = [
-            "ffmpeg", "-y",
+            "-y",
         ] + inputs + [
-            "-filter_complex", 
-            f"{full_video_filter}{mix_filter}",
+            "-filter_complex",
+            f"{full_video_filter};{self._audio_mix(audio_input_idx, bool(music_path))}",
+        ] + thumbnail_outputs + [
             "-map", "[out_v]",
             "-map", "[out_a]",
-            "-c:v", "libx264", "-preset", "veryfast",
-            "-crf", "20",
-            "-c:a", "aac", "-b:a", "192k",
+            "-c:v", "libx264", "-preset", tier.preset,
+            "-crf", str(tier.crf),
+            "-c:a", "aac", "-b:a", tier.audio_bitrate,
             "-shortest",
             "-pix_fmt", "yuv420p",
             output_path,
         ]
 
-        logger.info(f"Running FFmpeg: {' '.join(cmd)}")
+        logger.info(f"Running FFmpeg: ffmpeg {' '.join(cmd)}")
+        try:
+            returncode, stderr = await self._run_ffmpeg(
+                cmd, timeout=300, op="short_clip", duration=duration, on_progress=on_progress
+            )
+        finally:
+            if captions_path and os.path.exists(captions_path):
+                os.remove(captions_path)
+        if returncode != 0:
+            logger.error(f"FFmpeg failed with return code {returncode}")
+            logger.error(f"FFmpeg command: ffmpeg {' '.join(cmd)}")
+            logger.error(f"FFmpeg stderr: {stderr}")
+            return f"FFmpeg rendering failed: {stderr[-200:]}"
+        return None
+
+    async def _render_segmented(
+        self, output_path, audio_path, music_path, headline, image_paths, scenes, duration,
+        bg_color, txt_color, sentiment, on_progress, tier: RenderTier = FULL_TIER, chrome_path: Optional[str] = None,
+        thumbnails: Optional[Dict[str, str]] = None,
+    ) -> Optional[str]:
+        """
+        Render each scene as an independent video-only segment (in parallel, one render slot
+        each) with all of its overlays baked in — time-based chrome is offset by the segment
+        start — then join the segments with the concat demuxer (stream copy) while mixing the
+        audio. Returns an error message or None.
+        """
+        font_path = self._find_font()
+        font_spec = f":fontfile='{font_path}'" if font_path else ""
+        title_duration = min(3.0, duration * 0.1)
+
+        # Whole frames per segment so stream-copied segments line up with the narration
+        frame_counts = [max(1, round(d * tier.fps)) for d in self._scene_durations(scenes, duration)]
+        segment_dir = os.path.splitext(output_path)[0] + "_segments"
+        os.makedirs(segment_dir, exist_ok=True)
+
+        # Segments report 90% of the progress, the final mux the rest
+        segment_progress = [0.0] * len(scenes)
+        total_frames = sum(frame_counts)
+
+        async def report(fraction: float):
+            if on_progress:
+                await on_progress(fraction)
+
+        def segment_reporter(index: int):
+            async def on_segment_progress(fraction: float):
+                segment_progress[index] = fraction
+                done = sum(p * n for p, n in zip(segment_progress, frame_counts)) / total_frames
+                await report(round(0.9 * done, 3))
+            return on_segment_progress
+
+        async def render_segment(i: int, scene: Dict[str, Any], start_frame: int, frames: int) -> str:
+            seg_duration = frames / tier.fps
+            offset = start_frame / tier.fps
+            img = image_paths[i % len(image_paths)] if image_paths else None
+            if img:
+                inputs = ["-i", img]
+                base = (
+                    f"[0:v]{self._still_filter(tier.width, tier.height)},"
+                    f"{self._pan_filter(i, frames, tier.width, tier.height, tier.fps)}"
+                )
+            else:
+                inputs = ["-f", "lavfi", "-i", f"color=c={bg_color}:s={tier.width}x{tier.height}:d={seg_duration:.3f}:r={tier.fps}"]
+                base = "[0:v]null"
+
+            if chrome_path:
+                inputs += ["-i", chrome_path]
+                filters = [f"{base},{self._grade(sentiment)}[graded];[graded][1:v]overlay=0:0"]
+            else:
+                filters = [base, self._grade(sentiment)] + self._static_chrome(font_spec, tier)
+            if i == 0:
+                filters.append(self._title_card(headline, title_duration, font_spec, tier))
+            scene_text = self._scene_overlay_text(scene, 0, seg_duration, font_spec, tier)
+            if scene_text:
+                filters.append(scene_text)
+            voiceover = scene.get("voiceover", "")
+            if voiceover:
+                caption_start = title_duration if i == 0 and title_duration < seg_duration else 0.0
+                caption_events = self._caption_events(voiceover, seg_duration, txt_color, caption_start)
+                if caption_events:
+                    captions_path = os.path.join(segment_dir, f"segment_{i:03d}.ass")
+                    filters.append(self._caption_filter(self._write_captions(captions_path, caption_events)))
+            filters.append(self._progress_fill(duration, time_offset=offset, tier=tier))
+            if i == len(scenes) - 1:
+                filters.append(self._glitch(seg_duration))
+
+            graph, thumbnail_outputs = ",".join(filters), []
+            if i == 0 and thumbnails:
+                # The title card lives in the first segment
+                frame = min(int(title_duration / 2 * tier.fps), frames - 1)
+                tail, thumbnail_outputs = self._thumbnail_branch(frame, thumbnails)
+                graph += "," + tail
+            else:
+                graph += "[out_v]"
+
+            segment_path = os.path.join(segment_dir, f"segment_{i:03d}.mp4")
+            cmd = ["-y"] + inputs + ["-filter_complex", graph] + thumbnail_outputs + [
+                "-map", "[out_v]",
+                "-frames:v", str(frames),
+                "-r", str(tier.fps),
+                "-c:v", "libx264", "-preset", tier.preset,
+                "-crf", str(tier.crf),
+                "-pix_fmt", "yuv420p",
+                "-an",
+                segment_path,
+            ]
+            returncode, stderr = await self._run_ffmpeg(
+                cmd, timeout=300, op="short_clip.segment", duration=seg_duration, on_progress=segment_reporter(i)
+            )
+            if returncode != 0:
+                logger.error(f"FFmpeg segment {i} failed: {stderr[-500:]}")
+                raise RuntimeError(f"FFmpeg segment {i} failed: {stderr[-200:]}")
+            return segment_path
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            if result.returncode != 0:
-                logger.error(f"FFmpeg failed with return code {result.returncode}")
-                logger.error(f"FFmpeg command: {' '.join(cmd)}")
-                logger.error(f"FFmpeg stderr: {result.stderr}")
-                return {"error": f"FFmpeg rendering failed: {result.stderr[:200]}"}
-
-            return {
-                "path": output_path,
-                "url": f"/output/shorts/{filename}",
-                "duration_seconds": duration,
-                "file_size": os.path.getsize(output_path),
-                "resolution": "1080x1920",
-                "type": "short_clip",
-            }
-        except Exception as e:
-            return {"error": str(e)}
+            starts = [sum(frame_counts[:i]) for i in range(len(frame_counts))]
+            segment_paths = await asyncio.gather(*(
+                render_segment(i, scene, starts[i], frame_counts[i]) for i, scene in enumerate(scenes)
+            ))
 
-    def _create_caption_filter(self, text: str, total_duration: float, color: str, start_offset: float = 0.0) -> str:
-        """Create professional snappy caption filters with keyword highlighting."""
-        import re
+            list_path = os.path.join(segment_dir, "segments.txt")
+            with open(list_path, "w", encoding="utf-8") as f:
+                for path in segment_paths:
+                    f.write(f"file '{os.path.abspath(path)}'\n")
 
+            inputs = ["-f", "concat", "-safe", "0", "-i", list_path, "-i", audio_path]
+            if music_path:
+                inputs.extend(["-stream_loop", "-1", "-i", music_path])
+            cmd = ["-y"] + inputs + [
+                "-filter_complex", self._audio_mix(1, bool(music_path)),
+                "-map", "0:v",
+                "-map", "[out_a]",
+                "-c:v", "copy",
+                "-c:a", "aac", "-b:a", tier.audio_bitrate,
+                "-shortest",
+                "-movflags", "+faststart",
+                output_path,
+            ]
+            returncode, stderr = await self._run_ffmpeg(cmd, timeout=120, op="short_clip.concat")
+            if returncode != 0:
+                logger.error(f"FFmpeg concat failed: {stderr[-500:]}")
+                return f"FFmpeg rendering failed: {stderr[-200:]}"
+            await report(1.0)
+            return None
+        except RuntimeError as e:
+            return str(e)
+        finally:
+            shutil.rmtree(segment_dir, ignore_errors=True)
+
+    # ─── Captions (ASS subtitle track) ───────────────────────────────────
+
+    def _caption_events(self, text: str, total_duration: float, color: str, start_offset: float = 0.0) -> List[Dict[str, Any]]:
+        """Split narration into snappy 2-3 word phrases timed by character weight, with keyword highlighting."""
         # Split text into snappy 2-3 word phrases
         words = text.split()
         phrases = []
@@ -275,67 +848,85 @@ class VideoRenderService:
                 current_phrase = []
         if current_phrase:
             phrases.append(" ".join(current_phrase))
-            
+
         if not phrases:
-            return ""
+            return []
 
         # Captions start after the title card
         caption_duration = total_duration - start_offset
         if caption_duration <= 0:
             caption_duration = total_duration
             start_offset = 0
-            
-        filters = []
-        font_path = self._find_font()
-        font_spec = f":fontfile='{font_path}'" if font_path else ""
-        
-        # Impact keywords for yellow highlighting
-        highlight_keywords = {
-            "conflict", "surge", "ceasefire", "attack", "crisis", "war",
-            "strike", "escalation", "missile", "rebel", "military",
-            "agreement", "deal", "threat", "sanctions", "nuclear",
-            "troops", "invasion", "bombing", "killed", "tension"
-        }
 
         # Calculate character density for perfect audio sync
         total_weight = sum(len(p) + 4 for p in phrases) # +4 base weight per phrase
         current_time = start_offset
+        events = []
 
-        for i, phrase in enumerate(phrases):
-            phrase_weight = len(phrase) + 4
-            phrase_duration = caption_duration * (phrase_weight / total_weight)
-            
+        for phrase in phrases:
+            phrase_duration = caption_duration * ((len(phrase) + 4) / total_weight)
             start = current_time
             end = current_time + phrase_duration
             current_time = end
 
             # Dynamic color highlighting
-            phrase_lower = phrase.lower()
-            is_highlighted = any(k in phrase_lower for k in highlight_keywords)
-            dynamic_color = "#FFD700" if is_highlighted else color
-
-            # Sanitize text for FFmpeg drawtext
-            safe_phrase = re.sub(r"['\";\\()\[\]{}]", "", phrase)
-            safe_phrase = safe_phrase.replace(":", "\\:")
-            safe_phrase = safe_phrase.replace("%", "%%")
-            safe_phrase = safe_phrase.replace(",", "\\,")
+            is_highlighted = any(k in phrase.lower() for k in HIGHLIGHT_KEYWORDS)
 
             # Dynamic font scaling to prevent overflow
             font_size = 80 if is_highlighted else 72
-            if len(safe_phrase) > 20:
+            if len(phrase) > 20:
                 font_size = 50
-            elif len(safe_phrase) > 15:
+            elif len(phrase) > 15:
                 font_size = 60
 
-            filters.append(
-                f"drawtext=text='{safe_phrase}':fontcolor={dynamic_color}:fontsize={font_size}{font_spec}"
-                f":x=(w-text_w)/2:y=(h*0.65)"
-                f":borderw=5:bordercolor=black"
-                f":shadowcolor=black@0.9:shadowx=4:shadowy=4"
-                f":enable='between(t,{start:.2f},{end:.2f})'"
+            events.append({
+                "start": start,
+                "end": end,
+                "text": phrase,
+                "color": "#FFD700" if is_highlighted else color,
+                "font_size": font_size,
+            })
+        return events
+
+    def _write_captions(self, path: str, events: List[Dict[str, Any]]) -> str:
+        """Write caption events as an ASS subtitle file (1080x1920 script resolution) and return its path."""
+        font_path = self._find_font()
+        font_name = FONT_CANDIDATES.get(font_path, "Sans")
+        lines = [
+            "[Script Info]",
+            "ScriptType: v4.00+",
+            "PlayResX: 1080",
+            "PlayResY: 1920",
+            "WrapStyle: 2",
+            "ScaledBorderAndShadow: yes",
+            "",
+            "[V4+ Styles]",
+            "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, "
+            "Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, "
+            "Alignment, MarginL, MarginR, MarginV, Encoding",
+            # Top-centre aligned at 65% height; black border and soft drop shadow
+            f"Style: Caption,{font_name},72,&H00FFFFFF,&H00FFFFFF,&H00000000,&H1A000000,"
+            f"0,0,0,0,100,100,0,0,1,5,4,8,40,40,0,1",
+            "",
+            "[Events]",
+            "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+        ]
+        for event in events:
+            # Braces open override blocks and backslashes start escapes in ASS text
+            text = event["text"].replace("\\", "/").replace("{", "(").replace("}", ")")
+            lines.append(
+                f"Dialogue: 0,{_ass_time(event['start'])},{_ass_time(event['end'])},Caption,,0,0,0,,"
+                f"{{\\pos(540,1248)\\c{_ass_color(event['color'])}\\fs{event['font_size']}}}{text}"
             )
-            
-        return ",".join(filters)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        return path
+
+    def _caption_filter(self, path: str) -> str:
+        """Burn an ASS caption file in with a single libass filter."""
+        font_path = self._find_font()
+        fonts_dir = f":fontsdir='{_filter_path(os.path.dirname(font_path))}'" if font_path else ""
+        return f"ass=filename='{_filter_path(path)}'{fonts_dir}"
 
 
     async def render_presenter_video(
@@ -344,17 +935,37 @@ class VideoRenderService:
         avatar_video_path: str,
         headline: str = "",
         lower_third_text: str = "",
+        on_progress: Optional[ProgressCallback] = None,
+        loudness: Optional[Dict[str, float]] = None,
     ) -> Dict[str, Any]:
         """
-        Render a full presenter video with lip-synced avatar, lower-third graphics, and audio.
+        Render a full presenter video with lip-synced avatar, lower-third graphics, and audio
+        (the loudness-normalised narration from `master_audio`).
         """
-        if not self._check_ffmpeg():
+        key = artifact_store.make_key(
+            "presenter_video",
+            audio=artifact_store.file_fingerprint(audio_path),
+            avatar=artifact_store.file_fingerprint(avatar_video_path),
+            headline=headline,
+            lower_third_text=lower_third_text,
+            mastering=MASTERING_VERSION,
+        )
+        cached = await artifact_store.lookup(key)
+        if cached:
+            return cached
+
+        if not await self._check_ffmpeg():
             return {"error": "FFmpeg not available"}
 
-        filename = f"presenter_{uuid.uuid4().hex[:12]}.mp4"
+        filename = f"presenter_{key[:16]}.mp4"
         output_path = os.path.join(self.presenter_dir, filename)
 
         safe_lower_third = lower_third_text.replace("'", "'\\''").replace(":", "\\:")
+        mastered = await self.master_audio(audio_path, loudness=loudness)
+        if "error" in mastered:
+            logger.warning(f"Audio mastering failed, using the raw narration: {mastered['error']}")
+        else:
+            audio_path = mastered["path"]
 
         # FFmpeg: overlay avatar video + lower-third text + audio
         filter_complex = (
@@ -366,7 +977,7 @@ class VideoRenderService:
         )
 
         cmd = [
-            "ffmpeg", "-y",
+            "-y",
             "-i", avatar_video_path,
             "-i", audio_path,
             "-filter_complex", filter_complex,
@@ -379,15 +990,18 @@ class VideoRenderService:
         ]
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-            if result.returncode != 0:
-                logger.error(f"FFmpeg error: {result.stderr[:500]}")
-                return {"error": f"FFmpeg rendering failed: {result.stderr[:200]}"}
+            returncode, stderr = await self._run_ffmpeg(
+                cmd, timeout=600, op="presenter_video",
+                duration=await self._get_media_duration(audio_path), on_progress=on_progress,
+            )
+            if returncode != 0:
+                logger.error(f"FFmpeg error: {stderr[-500:]}")
+                return {"error": f"FFmpeg rendering failed: {stderr[-200:]}"}
 
             file_size = os.path.getsize(output_path)
-            duration = self._get_media_duration(output_path)
+            duration = await self._get_media_duration(output_path)
 
-            return {
+            video = {
                 "path": output_path,
                 "url": f"/output/presenter/{filename}",
                 "duration_seconds": duration,
@@ -395,7 +1009,9 @@ class VideoRenderService:
                 "resolution": "1920x1080",
                 "type": "presenter_video",
             }
-        except subprocess.TimeoutExpired:
+            await artifact_store.store(key, "presenter_video", output_path, video["url"], video)
+            return video
+        except asyncio.TimeoutError:
             return {"error": "FFmpeg rendering timed out (10 min limit)"}
         except Exception as e:
             return {"error": str(e)}
@@ -405,51 +1021,208 @@ class VideoRenderService:
         headline: str,
         background_color: str = "#0f3460",
     ) -> Dict[str, Any]:
-        """Create a thumbnail image with text overlay."""
-        if not self._check_ffmpeg():
+        """
+        Create a standalone title-card thumbnail. Short clips get theirs cut from the render
+        itself (`thumbnails` in the render_short_clip result); this is for everything else.
+        """
+        key = artifact_store.make_key("thumbnail", headline=headline, background_color=background_color)
+        cached = await artifact_store.lookup(key)
+        if cached:
+            return cached
+
+        if not await self._check_ffmpeg():
             return {"error": "FFmpeg not available"}
 
-        filename = f"thumb_{uuid.uuid4().hex[:8]}.png"
+        filename = f"thumb_{key[:16]}.png"
         output_path = os.path.join(self.thumbnail_dir, filename)
         safe_text = headline[:60].replace("'", "'\\''").replace(":", "\\:")
+        font_path = self._find_font()
+        font_spec = f":fontfile='{font_path}'" if font_path else ""
 
         cmd = [
-            "ffmpeg", "-y",
+            "-y",
             "-f", "lavfi",
             "-i", f"color=c={background_color}:s=1280x720:d=1",
             "-vf", (
                 f"drawtext=text='{safe_text}'"
                 f":fontcolor=white:fontsize=56"
                 f":x=(w-text_w)/2:y=(h-text_h)/2"
-                f":font=Arial"
+                f"{font_spec}"
             ),
             "-frames:v", "1",
             output_path,
         ]
 
         try:
-            subprocess.run(cmd, capture_output=True, check=True, timeout=30)
-            return {
+            returncode, stderr = await self._run_ffmpeg(cmd, timeout=30, op="thumbnail")
+            if returncode != 0:
+                return {"error": f"FFmpeg thumbnail failed: {stderr[-200:]}"}
+            thumbnail = {
                 "path": output_path,
                 "url": f"/output/thumbnails/{filename}",
             }
+            await artifact_store.store(key, "thumbnail", output_path, thumbnail["url"])
+            return thumbnail
         except Exception as e:
             return {"error": str(e)}
 
-    def _get_media_duration(self, file_path: str) -> float:
-        """Get media duration using ffprobe."""
+    # ─── Audio mastering ─────────────────────────────────────────────────
+
+    async def measure_loudness(self, path: str) -> Optional[Dict[str, float]]:
+        """
+        loudnorm analysis (integrated loudness, true peak, range, gate threshold, offset) of a
+        file, or None if it is silent or unreadable. Cached per file version in this process;
+        TTS stores it with the audio artifact so renders elsewhere need not measure again.
+        """
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError):
+            return None
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        if key in self._loudness:
+            self._loudness.move_to_end(key)
+            return self._loudness[key]
+
+        cmd = [
+            "-i", path,
+            "-af", f"{self._loudnorm_filter(None)}:print_format=json",
+            "-f", "null", "-",
+        ]
         try:
-            cmd = [
-                "ffprobe", "-v", "quiet",
-                "-print_format", "json",
-                "-show_format",
-                file_path,
+            returncode, stderr = await self._run_ffmpeg(cmd, timeout=120, op="loudness")
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.warning(f"Loudness analysis failed for {path}: {e}")
+            return None
+        match = re.search(r"\{[^{}]*\"input_i\"[^{}]*\}", stderr)
+        if returncode != 0 or not match:
+            logger.warning(f"Loudness analysis failed for {path}: {stderr[-200:]}")
+            return None
+        data = json.loads(match.group(0))
+        stats = {
+            "input_i": float(data["input_i"]),
+            "input_tp": float(data["input_tp"]),
+            "input_lra": float(data["input_lra"]),
+            "input_thresh": float(data["input_thresh"]),
+            "target_offset": float(data["target_offset"]),
+        }
+        # Digital silence measures -inf, which loudnorm cannot take back
+        if not all(math.isfinite(v) for v in stats.values()):
+            stats = None
+
+        self._loudness[key] = stats
+        while len(self._loudness) > LOUDNESS_CACHE_SIZE:
+            self._loudness.popitem(last=False)
+        return stats
+
+    async def concat_audio(self, paths: List[str], output_path: str) -> Optional[str]:
+        """
+        Join audio clips end to end with the concat demuxer. The clips are decoded rather than
+        stream-copied so MP3 encoder padding is trimmed instead of becoming gaps between them.
+        Returns an error message or None.
+        """
+        list_path = os.path.splitext(output_path)[0] + ".txt"
+        with open(list_path, "w", encoding="utf-8") as f:
+            for path in paths:
+                f.write(f"file '{os.path.abspath(path)}'\n")
+        cmd = [
+            "-y", "-f", "concat", "-safe", "0", "-i", list_path,
+            "-c:a", "libmp3lame", "-b:a", "192k",
+            output_path,
+        ]
+        try:
+            returncode, stderr = await self._run_ffmpeg(cmd, timeout=120, op="concat_audio")
+        except (OSError, asyncio.TimeoutError) as e:
+            return str(e)
+        finally:
+            os.remove(list_path)
+        if returncode != 0:
+            logger.error(f"FFmpeg audio concat failed: {stderr[-500:]}")
+            return f"FFmpeg audio concat failed: {stderr[-200:]}"
+        return None
+
+    @staticmethod
+    def _loudnorm_filter(stats: Optional[Dict[str, float]]) -> str:
+        """
+        loudnorm to the configured targets: linear (two-pass quality, no pumping) when earlier
+        measurements are supplied, dynamic single-pass otherwise.
+        """
+        target = f"loudnorm=I={settings.AUDIO_LOUDNESS_TARGET}:TP={settings.AUDIO_TRUE_PEAK}:LRA={LOUDNESS_RANGE}"
+        if not stats:
+            return target
+        return (
+            f"{target}:measured_I={stats['input_i']}:measured_TP={stats['input_tp']}"
+            f":measured_LRA={stats['input_lra']}:measured_thresh={stats['input_thresh']}"
+            f":offset={stats['target_offset']}:linear=true"
+        )
+
+    async def master_audio(
+        self,
+        audio_path: str,
+        music_path: Optional[str] = None,
+        loudness: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Normalise the narration to AUDIO_LOUDNESS_TARGET and lay the (looped) music bed under
+        it at AUDIO_MUSIC_LOUDNESS, ducked by a sidechain compressor keyed on the narration.
+        Encoded once as AAC and shared by every render of the same narration and music.
+        """
+        key = artifact_store.make_key(
+            "mastered_audio",
+            audio=artifact_store.file_fingerprint(audio_path),
+            music=artifact_store.file_fingerprint(music_path),
+            targets=[settings.AUDIO_LOUDNESS_TARGET, settings.AUDIO_TRUE_PEAK, settings.AUDIO_MUSIC_LOUDNESS],
+            version=MASTERING_VERSION,
+        )
+        async with artifact_store.lock(key):
+            cached = await artifact_store.lookup(key)
+            if cached:
+                return cached
+
+            loudness = loudness or await self.measure_loudness(audio_path)
+            inputs = ["-i", audio_path]
+            graph = f"[0:a]{self._loudnorm_filter(loudness)},aresample=48000"
+            if music_path:
+                music = await self.measure_loudness(music_path)
+                gain = settings.AUDIO_MUSIC_LOUDNESS - music["input_i"] if music else MUSIC_FALLBACK_GAIN_DB
+                limit = 10 ** (settings.AUDIO_TRUE_PEAK / 20)
+                inputs += ["-stream_loop", "-1", "-i", music_path]
+                graph += (
+                    ",asplit=2[voice][key];"
+                    f"[1:a]volume={gain:.2f}dB,aresample=48000[bed];"
+                    "[bed][key]sidechaincompress=threshold=0.02:ratio=6:attack=20:release=400[ducked];"
+                    f"[voice][ducked]amix=inputs=2:duration=first:normalize=0,alimiter=limit={limit:.3f}:level=false"
+                )
+            graph += "[out_a]"
+
+            filename = f"master_{key[:16]}.m4a"
+            output_path = os.path.join(self.mastered_dir, filename)
+            cmd = ["-y"] + inputs + [
+                "-filter_complex", graph,
+                "-map", "[out_a]",
+                "-c:a", "aac", "-b:a", FULL_TIER.audio_bitrate,
+                output_path,
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-            data = json.loads(result.stdout)
-            return float(data.get("format", {}).get("duration", 0))
-        except Exception:
-            return 0.0
+            try:
+                returncode, stderr = await self._run_ffmpeg(cmd, timeout=120, op="master_audio")
+            except (OSError, asyncio.TimeoutError) as e:
+                return {"error": str(e)}
+            if returncode != 0:
+                logger.error(f"FFmpeg mastering failed: {stderr[-500:]}")
+                return {"error": f"FFmpeg mastering failed: {stderr[-200:]}"}
+
+            mastered = {
+                "path": output_path,
+                "url": f"/output/audio/mastered/{filename}",
+                "duration_seconds": await self._get_media_duration(output_path),
+                "loudness": loudness,
+                "type": "mastered_audio",
+            }
+            await artifact_store.store(key, "audio", output_path, mastered["url"], mastered)
+            return mastered
+
+    async def _get_media_duration(self, file_path: str) -> float:
+        """Get media duration (cached ffprobe)."""
+        return await media_probe.duration(file_path)
 
 
 video_render_service = VideoRenderService()
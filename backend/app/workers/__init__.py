@@ -0,0 +1,3 @@
+"""
+Standalone worker processes that can run outside the API server.
+"""
@@ -0,0 +1,67 @@
+"""
+Piper TTS Worker
+Long-lived synthesis process: loads one Piper voice once, then answers JSON requests on
+stdin ({"id": ..., "text": ...}) by streaming raw 16-bit mono PCM on stdout. Every stdout
+message is a JSON line; {"id", "pcm": n} is followed by n bytes of audio and a request ends
+with {"id", "done": true} or {"id", "error": ...}. Started and fed by app.services.piper_pool:
+
+    python -m app.workers.piper_worker --model en_US-lessac-medium --data-dir .
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve_model(model: str, data_dir: str) -> str:
+    """An .onnx path for a model path or voice name, downloading the voice if needed."""
+    if os.path.exists(model):
+        return model
+    path = Path(data_dir) / f"{model}.onnx"
+    if not path.exists():
+        from piper.download_voices import download_voice
+
+        logger.info(f"Downloading Piper voice {model} to {data_dir}")
+        download_voice(model, Path(data_dir))
+    return str(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", required=True)
+    parser.add_argument("--data-dir", default=os.getcwd())
+    args = parser.parse_args()
+
+    # stdout carries the protocol only; anything a library prints goes to stderr
+    out = sys.stdout.buffer
+    sys.stdout = sys.stderr
+
+    def send(message: dict, payload: bytes = b""):
+        out.write(json.dumps(message).encode("utf-8") + b"\n" + payload)
+        out.flush()
+
+    from piper import PiperVoice
+
+    voice = PiperVoice.load(_resolve_model(args.model, args.data_dir))
+    send({"ready": True, "sample_rate": voice.config.sample_rate})
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        try:
+            for chunk in voice.synthesize(request["text"]):
+                pcm = chunk.audio_int16_bytes
+                send({"id": request["id"], "pcm": len(pcm)}, pcm)
+            send({"id": request["id"], "done": True})
+        except Exception as e:
+            send({"id": request["id"], "error": str(e)})
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    main()
@@ -0,0 +1,88 @@
+"""
+Render Farm Worker
+Consumes the RenderTask queue. Run one or more per machine (each sized to its cores) and
+point them at the same database and shared VIDEO_OUTPUT_DIR:
+
+    python -m app.workers.render_worker
+"""
+import asyncio
+import logging
+import signal
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.core.config import settings
+from app.services.render_farm import render_farm, worker_slots
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker(concurrency: Optional[int] = None, stop: Optional[asyncio.Event] = None):
+    """Claim and render tasks until stopped, keeping at most `concurrency` in flight."""
+    concurrency = concurrency or worker_slots()
+    stop = stop or asyncio.Event()
+    running: set = set()
+    next_reap = datetime.min
+
+    logger.info(f"Render worker {render_farm.worker_id} started (slots={concurrency})")
+    try:
+        while not stop.is_set():
+            try:
+                now = datetime.utcnow()
+                if now >= next_reap:
+                    await render_farm.requeue_stale()
+                    next_reap = now + timedelta(seconds=settings.RENDER_WORKER_HEARTBEAT_SECONDS)
+
+                task_id = await render_farm.claim_next() if len(running) < concurrency else None
+                await render_farm.register_worker(concurrency, busy=len(running) + (task_id is not None))
+                if task_id is not None:
+                    task = asyncio.create_task(render_farm.process(task_id))
+                    running.add(task)
+                    task.add_done_callback(running.discard)
+                    continue
+            except Exception as e:
+                logger.error(f"Render worker loop error: {e}")
+
+            # Idle or at capacity: wait for a slot, new work or shutdown
+            waiters = set(running) | {asyncio.create_task(stop.wait())}
+            done, pending = await asyncio.wait(
+                waiters, timeout=settings.RENDER_WORKER_POLL_SECONDS, return_when=asyncio.FIRST_COMPLETED
+            )
+            for waiter in pending - running:
+                waiter.cancel()
+    finally:
+        # Hand unfinished renders back to the queue for another worker
+        for task in list(running):
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        try:
+            await render_farm.unregister_worker()
+        except Exception as e:
+            logger.warning(f"Failed to unregister render worker: {e}")
+        logger.info(f"Render worker {render_farm.worker_id} stopped")
+
+
+async def main():
+    from app.db.base import AsyncSessionLocal
+    from app.db.init_db import load_platform_settings
+
+    async with AsyncSessionLocal() as db:
+        await load_platform_settings(db)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    await run_worker(stop=stop)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=getattr(logging, settings.LOG_LEVEL),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    asyncio.run(main())
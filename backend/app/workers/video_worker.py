@@ -0,0 +1,82 @@
+"""
+Video Render Worker
+Consumes the VideoJob queue. Run one or more per machine to scale rendering horizontally:
+
+    python -m app.workers.video_worker
+"""
+import asyncio
+import logging
+import signal
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.core.config import settings
+from app.services.video_job_service import video_job_service
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker(concurrency: Optional[int] = None, stop: Optional[asyncio.Event] = None):
+    """Claim and render jobs until stopped, keeping at most `concurrency` in flight."""
+    concurrency = concurrency or settings.VIDEO_WORKER_CONCURRENCY
+    stop = stop or asyncio.Event()
+    running: set = set()
+    next_reap = datetime.min
+
+    logger.info(f"Video worker {video_job_service.worker_id} started (concurrency={concurrency})")
+    try:
+        while not stop.is_set():
+            try:
+                now = datetime.utcnow()
+                if now >= next_reap:
+                    await video_job_service.requeue_stale()
+                    next_reap = now + timedelta(seconds=settings.VIDEO_WORKER_HEARTBEAT_SECONDS)
+
+                job_id = await video_job_service.claim_next() if len(running) < concurrency else None
+                if job_id is not None:
+                    task = asyncio.create_task(video_job_service.process(job_id))
+                    running.add(task)
+                    task.add_done_callback(running.discard)
+                    continue
+            except Exception as e:
+                logger.error(f"Video worker loop error: {e}")
+
+            # Idle or at capacity: wait for a slot, new work or shutdown
+            waiters = set(running) | {asyncio.create_task(stop.wait())}
+            done, pending = await asyncio.wait(
+                waiters, timeout=settings.VIDEO_WORKER_POLL_SECONDS, return_when=asyncio.FIRST_COMPLETED
+            )
+            for waiter in pending - running:
+                waiter.cancel()
+    finally:
+        # Hand unfinished jobs back to the queue for another worker
+        for task in list(running):
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        logger.info(f"Video worker {video_job_service.worker_id} stopped")
+
+
+async def main():
+    from app.db.base import AsyncSessionLocal
+    from app.db.init_db import load_platform_settings
+
+    async with AsyncSessionLocal() as db:
+        await load_platform_settings(db)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    await run_worker(stop=stop)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=getattr(logging, settings.LOG_LEVEL),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""
+Ken Burns benchmark
+Encodes the same synthetic still with the legacy zoompan chain (looped input, scale to
+2160 wide and zoompan every frame) and with the pre-scaled pan chain used by
+render_short_clip, and reports frames per second for each as JSON:
+
+    python -m benchmarks.ken_burns --seconds 10 --runs 3
+"""
+import argparse
+import json
+import os
+import subprocess
+import tempfile
+import time
+
+from app.services.video_service import FRAME_HEIGHT, FRAME_WIDTH, VIDEO_FPS, VideoRenderService
+
+LEGACY_FILTER = (
+    "scale=2160:-1,crop=1080:1920,"
+    "zoompan=z='min(zoom+0.001,1.3)':d={frames}:s=1080x1920"
+    ":x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':fps=30"
+)
+
+
+def _ffmpeg(args):
+    subprocess.run(["ffmpeg", "-hide_banner", "-loglevel", "error", "-y"] + args, check=True)
+
+
+def _encode(input_args, video_filter, frames, output_path) -> float:
+    started = time.perf_counter()
+    _ffmpeg(input_args + [
+        "-vf", video_filter, "-frames:v", str(frames),
+        "-c:v", "libx264", "-preset", "veryfast", "-crf", "20", "-pix_fmt", "yuv420p",
+        output_path,
+    ])
+    return time.perf_counter() - started
+
+
+def run(seconds: float, runs: int) -> dict:
+    frames = int(seconds * VIDEO_FPS)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "source.png")
+        still = os.path.join(tmp, "still.png")
+        output = os.path.join(tmp, "out.mp4")
+        _ffmpeg(["-f", "lavfi", "-i", "testsrc2=size=1920x1080", "-frames:v", "1", source])
+
+        legacy, pan, prescale = [], [], []
+        for _ in range(runs):
+            legacy.append(_encode(
+                ["-loop", "1", "-t", f"{seconds:.2f}", "-i", source],
+                LEGACY_FILTER.format(frames=frames), frames, output,
+            ))
+
+            started = time.perf_counter()
+            _ffmpeg(["-i", source, "-vf", VideoRenderService._still_filter(FRAME_WIDTH, FRAME_HEIGHT), "-frames:v", "1", still])
+            prescale.append(time.perf_counter() - started)
+            pan.append(_encode(
+                ["-i", still],
+                VideoRenderService._pan_filter(0, frames, FRAME_WIDTH, FRAME_HEIGHT), frames, output,
+            ))
+
+    legacy_best, pan_best = min(legacy), min(pan)
+    return {
+        "frames": frames,
+        "runs": runs,
+        "legacy_zoompan": {"seconds": round(legacy_best, 3), "fps": round(frames / legacy_best, 1)},
+        "prescaled_pan": {
+            "seconds": round(pan_best, 3),
+            "fps": round(frames / pan_best, 1),
+            "prescale_seconds": round(min(prescale), 3),
+        },
+        "speedup": round(legacy_best / pan_best, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10.0, help="Clip length to encode")
+    parser.add_argument("--runs", type=int, default=3, help="Repetitions; the fastest run is reported")
+    args = parser.parse_args()
+    print(json.dumps(run(args.seconds, args.runs), indent=2))
+
+
+if __name__ == "__main__":
+    main()
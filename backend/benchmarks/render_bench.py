@@ -0,0 +1,248 @@
+"""
+Render benchmark suite
+Renders short clips, presenter videos and thumbnails from synthetic assets (sine/silent
+narration, generated test-pattern images and avatar video — no network, no database) and
+reports wall time, CPU time (including FFmpeg children), peak RSS and output size as JSON.
+
+Every case runs in a fresh interpreter with its own empty VIDEO_OUTPUT_DIR and the artifact
+store bypassed, so each measurement is a cold render and cases cannot share caches:
+
+    python -m benchmarks.render_bench --output bench.json
+    python -m benchmarks.render_bench --scenes 1,3,5 --durations 15,60 --qualities preview,full
+    python -m benchmarks.render_bench --compare baseline.json --output bench.json
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMAGE_SOURCES = ["testsrc2", "mandelbrot", "rgbtestsrc", "smptehdbars", "cellauto"]
+
+
+def _ffmpeg(args: List[str]):
+    subprocess.run(["ffmpeg", "-hide_banner", "-loglevel", "error", "-y"] + args, check=True)
+
+
+def make_assets(asset_dir: str, duration: float, scenes: int, audio: str = "sine") -> Dict[str, Any]:
+    """Synthetic narration (sine tone or silence), one test-pattern image per scene and an avatar clip."""
+    os.makedirs(asset_dir, exist_ok=True)
+    audio_path = os.path.join(asset_dir, f"narration_{audio}_{duration:g}.mp3")
+    if not os.path.exists(audio_path):
+        source = f"sine=frequency=220:sample_rate=44100:duration={duration}" if audio == "sine" \
+            else f"anullsrc=r=44100:cl=mono:d={duration}"
+        _ffmpeg(["-f", "lavfi", "-i", source, "-c:a", "libmp3lame", "-b:a", "128k", audio_path])
+
+    image_paths = []
+    for i in range(scenes):
+        image_path = os.path.join(asset_dir, f"scene_{i}.png")
+        if not os.path.exists(image_path):
+            source = IMAGE_SOURCES[i % len(IMAGE_SOURCES)]
+            _ffmpeg(["-f", "lavfi", "-i", f"{source}=size=1920x1080", "-frames:v", "1", image_path])
+        image_paths.append(image_path)
+
+    avatar_path = os.path.join(asset_dir, f"avatar_{duration:g}.mp4")
+    if not os.path.exists(avatar_path):
+        _ffmpeg([
+            "-f", "lavfi", "-i", f"testsrc2=size=512x512:rate=25:duration={duration}",
+            "-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p", avatar_path,
+        ])
+    return {"audio_path": audio_path, "image_paths": image_paths, "avatar_path": avatar_path}
+
+
+def expand_cases(
+    scenes: List[int], durations: List[float], qualities: List[str], modes: List[str], kinds: List[str]
+) -> List[Dict[str, Any]]:
+    """The benchmark matrix; every case has a stable `id` for comparing runs."""
+    cases = []
+    if "short_clip" in kinds:
+        for scene_count, duration, quality, mode in itertools.product(scenes, durations, qualities, modes):
+            cases.append({
+                "id": f"short_clip/{mode}/{quality}/scenes={scene_count}/duration={duration:g}",
+                "kind": "short_clip", "scenes": scene_count, "duration": duration, "quality": quality, "mode": mode,
+            })
+    if "presenter_video" in kinds:
+        for duration in durations:
+            cases.append({"id": f"presenter_video/duration={duration:g}", "kind": "presenter_video", "duration": duration})
+    if "thumbnail" in kinds:
+        cases.append({"id": "thumbnail", "kind": "thumbnail"})
+    return cases
+
+
+def _scenes(count: int, duration: float) -> List[Dict[str, Any]]:
+    words = "missile strike reported near the border as talks resume and sanctions tighten".split()
+    return [
+        {
+            "voiceover": " ".join(words[(i * 3) % len(words):] + words[:(i * 3) % len(words)]),
+            "duration_seconds": duration / count,
+            "overlay_text": f"Scene {i + 1}",
+        }
+        for i in range(count)
+    ]
+
+
+async def _render(case: Dict[str, Any], assets: Dict[str, Any]) -> Dict[str, Any]:
+    from app.services.video_service import video_render_service
+
+    if case["kind"] == "short_clip":
+        return await video_render_service.render_short_clip(
+            audio_path=assets["audio_path"],
+            headline="Benchmark: Border Tensions Escalate",
+            image_paths=assets["image_paths"],
+            scenes=_scenes(case["scenes"], case["duration"]),
+            sentiment="tense",
+            mode=case["mode"],
+            quality=case["quality"],
+        )
+    if case["kind"] == "presenter_video":
+        return await video_render_service.render_presenter_video(
+            audio_path=assets["audio_path"],
+            avatar_video_path=assets["avatar_path"],
+            headline="Benchmark: Border Tensions Escalate",
+            lower_third_text="Strategic Context",
+        )
+    return await video_render_service.create_thumbnail("Benchmark: Border Tensions Escalate")
+
+
+def run_case(case: Dict[str, Any], asset_dir: str) -> Dict[str, Any]:
+    """Measure one case in this process (called in a fresh child by `main`)."""
+    from app.services.artifact_store import artifact_store
+
+    async def no_lookup(key):
+        return None
+
+    async def no_store(*args, **kwargs):
+        pass
+
+    # Always render: the content-addressed cache would turn repeat runs into lookups
+    artifact_store.lookup = no_lookup
+    artifact_store.store = no_store
+
+    assets = make_assets(asset_dir, case["duration"], case.get("scenes", 1)) if "duration" in case else {}
+    self_before = resource.getrusage(resource.RUSAGE_SELF)
+    children_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    started = time.perf_counter()
+    result = asyncio.run(_render(case, assets))
+    wall = time.perf_counter() - started
+    self_after = resource.getrusage(resource.RUSAGE_SELF)
+    children_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+    cpu = sum(
+        (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+        for before, after in ((self_before, self_after), (children_before, children_after))
+    )
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss_unit = 1 if sys.platform == "darwin" else 1024
+    return {
+        **case,
+        "ok": "error" not in result,
+        "error": result.get("error"),
+        "wall_seconds": round(wall, 3),
+        "cpu_seconds": round(cpu, 3),
+        "peak_rss_bytes": max(self_after.ru_maxrss, children_after.ru_maxrss) * rss_unit,
+        "output_bytes": os.path.getsize(result["path"]) if result.get("path") and os.path.exists(result["path"]) else None,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Per-case wall/CPU ratios (current / baseline) for cases present in both runs."""
+    previous = {r["id"]: r for r in baseline.get("results", []) if r.get("ok")}
+    rows = []
+    for result in current.get("results", []):
+        before = previous.get(result["id"])
+        if not before or not result.get("ok"):
+            continue
+        rows.append({
+            "id": result["id"],
+            "wall_ratio": round(result["wall_seconds"] / before["wall_seconds"], 3) if before["wall_seconds"] else None,
+            "cpu_ratio": round(result["cpu_seconds"] / before["cpu_seconds"], 3) if before["cpu_seconds"] else None,
+            "output_ratio": round(result["output_bytes"] / before["output_bytes"], 3)
+            if result.get("output_bytes") and before.get("output_bytes") else None,
+        })
+    return rows
+
+
+def _environment() -> Dict[str, Any]:
+    def output(cmd: List[str]) -> Optional[str]:
+        try:
+            return subprocess.run(cmd, capture_output=True, text=True, cwd=BACKEND_DIR).stdout.split("\n")[0].strip() or None
+        except OSError:
+            return None
+
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "git_commit": output(["git", "rev-parse", "HEAD"]),
+        "ffmpeg": output(["ffmpeg", "-version"]),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _csv(cast):
+    return lambda value: [cast(v) for v in value.split(",") if v]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kinds", type=_csv(str), default=["short_clip", "presenter_video", "thumbnail"])
+    parser.add_argument("--scenes", type=_csv(int), default=[1, 3])
+    parser.add_argument("--durations", type=_csv(float), default=[15.0, 30.0])
+    parser.add_argument("--qualities", type=_csv(str), default=["preview", "full"])
+    parser.add_argument("--modes", type=_csv(str), default=["segmented"])
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per case; the fastest is reported")
+    parser.add_argument("--output", help="Write the JSON report here as well as to stdout")
+    parser.add_argument("--compare", help="Earlier report to compute wall/CPU ratios against")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    parser.add_argument("--assets", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        # Child process: one measurement, JSON on stdout
+        print(json.dumps(run_case(json.loads(args.case), args.assets)))
+        return
+
+    with tempfile.TemporaryDirectory(prefix="render-bench-") as tmp:
+        asset_dir = os.path.join(tmp, "assets")
+        results = []
+        for case in expand_cases(args.scenes, args.durations, args.qualities, args.modes, args.kinds):
+            runs = []
+            for attempt in range(args.repeat):
+                env = {**os.environ, "VIDEO_OUTPUT_DIR": os.path.join(tmp, f"out-{len(results)}-{attempt}")}
+                child = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.render_bench", "--case", json.dumps(case), "--assets", asset_dir],
+                    capture_output=True, text=True, cwd=BACKEND_DIR, env=env,
+                )
+                if child.returncode != 0:
+                    runs.append({**case, "ok": False, "error": child.stderr.strip()[-500:]})
+                    continue
+                runs.append(json.loads(child.stdout.strip().splitlines()[-1]))
+            ok = [r for r in runs if r.get("ok")]
+            best = min(ok, key=lambda r: r["wall_seconds"]) if ok else runs[-1]
+            print(f"{case['id']}: {best.get('wall_seconds', 'failed')}s", file=sys.stderr)
+            results.append(best)
+
+    report = {"environment": _environment(), "results": results}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            report["comparison"] = compare(json.load(f), report)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
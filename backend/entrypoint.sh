@@ -30,6 +30,12 @@ except Exception:
 done
 
 echo "✅ PostgreSQL is ready!"
+
+# Run an alternate command (e.g. the video render worker) when one is given
+if [ "$#" -gt 0 ]; then
+    exec "$@"
+fi
+
 echo "🚀 Starting Geopolitical Intelligence Platform..."
 
 exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
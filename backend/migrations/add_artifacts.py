@@ -0,0 +1,55 @@
+"""
+Migration: Add artifacts table (content-addressed store for generated media)
+Run this script once to update an existing database.
+"""
+import asyncio
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import text
+from app.db.base import engine
+
+
+async def migrate():
+    """Create the artifacts index used to reuse TTS audio, images and renders."""
+    async with engine.begin() as conn:
+        print("Creating artifacts table...")
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS artifacts (
+                id UUID PRIMARY KEY,
+                key VARCHAR(64) NOT NULL UNIQUE,
+                kind VARCHAR(20) NOT NULL,
+                path TEXT NOT NULL,
+                url TEXT,
+                size_bytes BIGINT DEFAULT 0,
+                meta JSONB DEFAULT '{}'::jsonb,
+                ref_count INTEGER DEFAULT 0,
+                created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW(),
+                last_accessed_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW()
+            )
+        """))
+        await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_artifacts_key ON artifacts (key)"))
+        await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_artifacts_kind ON artifacts (kind)"))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_artifacts_last_accessed_at ON artifacts (last_accessed_at)"
+        ))
+
+        print("Migration completed successfully!")
+
+
+async def rollback():
+    """Drop the artifacts table (cached files stay on disk)."""
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE IF EXISTS artifacts"))
+        print("Rollback completed.")
+
+
+if __name__ == "__main__":
+    action = sys.argv[1] if len(sys.argv) > 1 else "migrate"
+    if action == "rollback":
+        asyncio.run(rollback())
+    else:
+        asyncio.run(migrate())
@@ -0,0 +1,43 @@
+"""
+Migration: Add checkpoints and attempts to pipeline_runs
+Run this script once to update an existing database.
+"""
+import asyncio
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import text
+from app.db.base import engine
+
+
+async def migrate():
+    """Store per-stage outputs so a retried run resumes from the first failed stage."""
+    async with engine.begin() as conn:
+        print("Adding 'checkpoints' and 'attempts' columns to pipeline_runs...")
+        await conn.execute(text(
+            "ALTER TABLE pipeline_runs ADD COLUMN IF NOT EXISTS checkpoints JSONB DEFAULT '{}'::jsonb"
+        ))
+        await conn.execute(text(
+            "ALTER TABLE pipeline_runs ADD COLUMN IF NOT EXISTS attempts INTEGER DEFAULT 1"
+        ))
+
+        print("Migration completed successfully!")
+
+
+async def rollback():
+    """Remove the checkpoint columns."""
+    async with engine.begin() as conn:
+        await conn.execute(text("ALTER TABLE pipeline_runs DROP COLUMN IF EXISTS checkpoints"))
+        await conn.execute(text("ALTER TABLE pipeline_runs DROP COLUMN IF EXISTS attempts"))
+        print("Rollback completed.")
+
+
+if __name__ == "__main__":
+    action = sys.argv[1] if len(sys.argv) > 1 else "migrate"
+    if action == "rollback":
+        asyncio.run(rollback())
+    else:
+        asyncio.run(migrate())
@@ -0,0 +1,43 @@
+"""
+Migration: Add timing spans to pipeline_runs
+Run this script once to update an existing database.
+"""
+import asyncio
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import text
+from app.db.base import engine
+
+
+async def migrate():
+    """Persist per-stage timing spans with each run."""
+    async with engine.begin() as conn:
+        print("Adding 'trace_id' and 'spans' columns to pipeline_runs...")
+        await conn.execute(text(
+            "ALTER TABLE pipeline_runs ADD COLUMN IF NOT EXISTS trace_id VARCHAR(32)"
+        ))
+        await conn.execute(text(
+            "ALTER TABLE pipeline_runs ADD COLUMN IF NOT EXISTS spans JSONB DEFAULT '[]'::jsonb"
+        ))
+
+        print("Migration completed successfully!")
+
+
+async def rollback():
+    """Remove the span columns."""
+    async with engine.begin() as conn:
+        await conn.execute(text("ALTER TABLE pipeline_runs DROP COLUMN IF EXISTS trace_id"))
+        await conn.execute(text("ALTER TABLE pipeline_runs DROP COLUMN IF EXISTS spans"))
+        print("Rollback completed.")
+
+
+if __name__ == "__main__":
+    action = sys.argv[1] if len(sys.argv) > 1 else "migrate"
+    if action == "rollback":
+        asyncio.run(rollback())
+    else:
+        asyncio.run(migrate())
@@ -0,0 +1,60 @@
+"""
+Migration: Add pipeline_runs table for background pipeline execution
+Run this script once to update an existing database.
+"""
+import asyncio
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import text
+from app.db.base import engine
+
+
+async def migrate():
+    """Create pipeline_runs so /pipeline/run-full can return immediately and report progress."""
+    async with engine.begin() as conn:
+        print("Creating 'pipeline_runs' table...")
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS pipeline_runs (
+                id UUID PRIMARY KEY,
+                status VARCHAR(20) DEFAULT 'queued',
+                category VARCHAR(100) NOT NULL,
+                region VARCHAR(100) DEFAULT 'Global',
+                profile_id UUID REFERENCES profiles(id),
+                params JSONB,
+                current_step VARCHAR(50),
+                steps JSONB,
+                errors JSONB,
+                result JSONB,
+                created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT (now() at time zone 'utc'),
+                started_at TIMESTAMP WITHOUT TIME ZONE,
+                finished_at TIMESTAMP WITHOUT TIME ZONE,
+                created_by UUID REFERENCES users(id)
+            )
+        """))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_pipeline_runs_status ON pipeline_runs (status)"
+        ))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_pipeline_runs_created_at ON pipeline_runs (created_at)"
+        ))
+
+        print("Migration completed successfully!")
+
+
+async def rollback():
+    """Drop the pipeline_runs table."""
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE IF EXISTS pipeline_runs"))
+        print("Rollback completed.")
+
+
+if __name__ == "__main__":
+    action = sys.argv[1] if len(sys.argv) > 1 else "migrate"
+    if action == "rollback":
+        asyncio.run(rollback())
+    else:
+        asyncio.run(migrate())
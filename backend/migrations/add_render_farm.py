@@ -0,0 +1,74 @@
+"""
+Migration: Add render_tasks and render_workers tables (render farm)
+Run this script once to update an existing database.
+"""
+import asyncio
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import text
+from app.db.base import engine
+
+
+async def migrate():
+    """Create the render task queue and the worker capacity registry."""
+    async with engine.begin() as conn:
+        print("Creating render_tasks table...")
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS render_tasks (
+                id UUID PRIMARY KEY,
+                kind VARCHAR(30) NOT NULL,
+                spec JSONB NOT NULL DEFAULT '{}'::jsonb,
+                status VARCHAR(20) DEFAULT 'queued',
+                priority INTEGER DEFAULT 0,
+                worker_id VARCHAR(100),
+                heartbeat_at TIMESTAMP WITHOUT TIME ZONE,
+                attempts INTEGER DEFAULT 0,
+                max_attempts INTEGER DEFAULT 3,
+                progress DOUBLE PRECISION DEFAULT 0,
+                result JSONB,
+                error TEXT,
+                created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW(),
+                started_at TIMESTAMP WITHOUT TIME ZONE,
+                finished_at TIMESTAMP WITHOUT TIME ZONE
+            )
+        """))
+        await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_render_tasks_status ON render_tasks (status)"))
+        await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_render_tasks_heartbeat_at ON render_tasks (heartbeat_at)"))
+        await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_render_tasks_created_at ON render_tasks (created_at)"))
+
+        print("Creating render_workers table...")
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS render_workers (
+                worker_id VARCHAR(100) PRIMARY KEY,
+                hostname VARCHAR(255),
+                slots INTEGER DEFAULT 1,
+                busy INTEGER DEFAULT 0,
+                started_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW(),
+                heartbeat_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW()
+            )
+        """))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_render_workers_heartbeat_at ON render_workers (heartbeat_at)"
+        ))
+
+        print("Migration completed successfully!")
+
+
+async def rollback():
+    """Drop the render farm tables."""
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE IF EXISTS render_tasks"))
+        await conn.execute(text("DROP TABLE IF EXISTS render_workers"))
+        print("Rollback completed.")
+
+
+if __name__ == "__main__":
+    action = sys.argv[1] if len(sys.argv) > 1 else "migrate"
+    if action == "rollback":
+        asyncio.run(rollback())
+    else:
+        asyncio.run(migrate())
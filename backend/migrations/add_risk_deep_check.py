@@ -0,0 +1,47 @@
+"""
+Migration: Add deep_checked_at column to risk_scores
+Run this script once to update an existing database.
+"""
+import asyncio
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import text
+from app.db.base import engine
+
+
+async def migrate():
+    """Add deep_checked_at so the deferred risk check can resume after restarts."""
+    async with engine.begin() as conn:
+        print("Adding 'deep_checked_at' column to risk_scores...")
+        await conn.execute(text(
+            "ALTER TABLE risk_scores ADD COLUMN IF NOT EXISTS deep_checked_at TIMESTAMP WITHOUT TIME ZONE"
+        ))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_risk_scores_deep_checked_at ON risk_scores (deep_checked_at)"
+        ))
+
+        # Existing assessments predate the deep check; don't flood the queue with them
+        await conn.execute(text(
+            "UPDATE risk_scores SET deep_checked_at = assessed_at WHERE deep_checked_at IS NULL"
+        ))
+
+        print("Migration completed successfully!")
+
+
+async def rollback():
+    """Remove the deep_checked_at column."""
+    async with engine.begin() as conn:
+        await conn.execute(text("ALTER TABLE risk_scores DROP COLUMN IF EXISTS deep_checked_at"))
+        print("Rollback completed.")
+
+
+if __name__ == "__main__":
+    action = sys.argv[1] if len(sys.argv) > 1 else "migrate"
+    if action == "rollback":
+        asyncio.run(rollback())
+    else:
+        asyncio.run(migrate())
@@ -0,0 +1,65 @@
+"""
+Migration: Add versioned risk rule sets and rule_set_version on risk_scores
+Run this script once to update an existing database.
+"""
+import asyncio
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import text
+from app.db.base import engine
+
+
+async def migrate():
+    """Create risk_rule_sets and tag existing scores with the built-in version 0."""
+    async with engine.begin() as conn:
+        print("Creating 'risk_rule_sets' table...")
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS risk_rule_sets (
+                id UUID PRIMARY KEY,
+                version INTEGER NOT NULL UNIQUE,
+                name VARCHAR(100) NOT NULL,
+                description TEXT,
+                factor_weights JSONB NOT NULL,
+                dimension_weights JSONB NOT NULL,
+                classification_thresholds JSONB NOT NULL,
+                review_threshold INTEGER DEFAULT 40,
+                lexicon JSONB,
+                is_active BOOLEAN DEFAULT FALSE,
+                activated_at TIMESTAMP WITHOUT TIME ZONE,
+                created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT (now() at time zone 'utc'),
+                created_by UUID REFERENCES users(id)
+            )
+        """))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_risk_rule_sets_version ON risk_rule_sets (version)"
+        ))
+
+        print("Adding 'rule_set_version' column to risk_scores...")
+        await conn.execute(text(
+            "ALTER TABLE risk_scores ADD COLUMN IF NOT EXISTS rule_set_version INTEGER DEFAULT 0"
+        ))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_risk_scores_rule_set_version ON risk_scores (rule_set_version)"
+        ))
+
+        print("Migration completed successfully!")
+
+
+async def rollback():
+    """Drop risk_rule_sets and the rule_set_version column."""
+    async with engine.begin() as conn:
+        await conn.execute(text("ALTER TABLE risk_scores DROP COLUMN IF EXISTS rule_set_version"))
+        await conn.execute(text("DROP TABLE IF EXISTS risk_rule_sets"))
+        print("Rollback completed.")
+
+
+if __name__ == "__main__":
+    action = sys.argv[1] if len(sys.argv) > 1 else "migrate"
+    if action == "rollback":
+        asyncio.run(rollback())
+    else:
+        asyncio.run(migrate())
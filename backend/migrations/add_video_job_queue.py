@@ -0,0 +1,55 @@
+"""
+Migration: Add worker lease and backoff columns to video_jobs
+Run this script once to update an existing database.
+"""
+import asyncio
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import text
+from app.db.base import engine
+
+
+async def migrate():
+    """Add heartbeat_at and next_attempt_at so render workers can lease and retry jobs."""
+    async with engine.begin() as conn:
+        print("Adding 'heartbeat_at' and 'next_attempt_at' columns to video_jobs...")
+        await conn.execute(text(
+            "ALTER TABLE video_jobs ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP WITHOUT TIME ZONE"
+        ))
+        await conn.execute(text(
+            "ALTER TABLE video_jobs ADD COLUMN IF NOT EXISTS next_attempt_at TIMESTAMP WITHOUT TIME ZONE"
+        ))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_video_jobs_heartbeat_at ON video_jobs (heartbeat_at)"
+        ))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_video_jobs_next_attempt_at ON video_jobs (next_attempt_at)"
+        ))
+        # Claim order: runnable queued jobs by priority, oldest first
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_video_jobs_queue "
+            "ON video_jobs (priority DESC, created_at) WHERE status = 'QUEUED'"
+        ))
+
+        print("Migration completed successfully!")
+
+
+async def rollback():
+    """Remove the worker lease columns."""
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP INDEX IF EXISTS ix_video_jobs_queue"))
+        await conn.execute(text("ALTER TABLE video_jobs DROP COLUMN IF EXISTS heartbeat_at"))
+        await conn.execute(text("ALTER TABLE video_jobs DROP COLUMN IF EXISTS next_attempt_at"))
+        print("Rollback completed.")
+
+
+if __name__ == "__main__":
+    action = sys.argv[1] if len(sys.argv) > 1 else "migrate"
+    if action == "rollback":
+        asyncio.run(rollback())
+    else:
+        asyncio.run(migrate())
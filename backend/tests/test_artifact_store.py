@@ -0,0 +1,45 @@
+import asyncio
+import os
+
+from app.services.artifact_store import ArtifactStore
+
+
+def test_make_key_is_stable_and_input_sensitive():
+    key = ArtifactStore.make_key("audio", text="Hello", voice="default", engine="gtts")
+
+    assert key == ArtifactStore.make_key("audio", engine="gtts", voice="default", text="Hello")
+    assert key != ArtifactStore.make_key("audio", text="Hello", voice="default", engine="edge_tts")
+    assert key != ArtifactStore.make_key("image", text="Hello", voice="default", engine="gtts")
+    assert len(key) == 64
+
+
+def test_file_fingerprint_tracks_content_changes(tmp_path):
+    path = tmp_path / "scene.png"
+    path.write_bytes(b"abc")
+    first = ArtifactStore.file_fingerprint(str(path))
+
+    path.write_bytes(b"abcdef")
+    os.utime(path, ns=(0, 10 ** 18))
+
+    assert ArtifactStore.file_fingerprint(str(path)) != first
+    assert ArtifactStore.file_fingerprint(str(tmp_path / "missing.png")) is None
+    assert ArtifactStore.file_fingerprint(None) is None
+
+
+def test_lock_serialises_producers_of_the_same_key():
+    store = ArtifactStore()
+    log = []
+
+    async def produce(name):
+        async with store.lock("k"):
+            log.append(("start", name))
+            await asyncio.sleep(0.01)
+            log.append(("end", name))
+
+    async def main():
+        await asyncio.gather(produce("a"), produce("b"))
+
+    asyncio.run(main())
+
+    assert log == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+    assert not store._locks
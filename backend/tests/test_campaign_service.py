@@ -0,0 +1,26 @@
+import asyncio
+
+from app.services.campaign_service import CampaignService
+
+
+def test_start_skips_campaign_already_running():
+    async def scenario():
+        service = CampaignService()
+        release = asyncio.Event()
+
+        async def fake_run(campaign_id, trigger="schedule", generate_presenter=False):
+            await release.wait()
+            return {"trigger": trigger}
+
+        service.run_campaign = fake_run
+        first = service.start("c1", trigger="manual")
+        assert first is not None
+        assert service.start("c1") is None
+        assert service.dispatch("c2") is True
+
+        release.set()
+        assert await first == {"trigger": "manual"}
+        await asyncio.sleep(0)
+        assert not service.is_running("c1")
+
+    asyncio.run(scenario())
@@ -0,0 +1,71 @@
+import asyncio
+import os
+import stat
+
+from app.services.media_probe import MediaProbeService
+
+FAKE_FFPROBE = """#!/bin/sh
+echo probe >> "$FAKE_PROBE_LOG"
+cat <<'JSON'
+{"format": {"duration": "12.5", "format_name": "mp3", "bit_rate": "128000"},
+ "streams": [{"index": 0, "codec_type": "audio", "codec_name": "mp3", "sample_rate": "44100", "channels": 2}]}
+JSON
+"""
+
+FAKE_FFMPEG = """#!/bin/sh
+echo "$*" >> "$FAKE_PROBE_LOG"
+case "$*" in
+  *-version*) echo "ffmpeg version 6.1.1 Copyright (c) 2000-2023 the FFmpeg developers" ;;
+  *-encoders*) printf 'Encoders:\\n V..... = Video\\n ------\\n V....D libx264               libx264 H.264\\n A....D aac                  AAC\\n' ;;
+  *-filters*) printf 'Filters:\\n  T.. = Timeline support\\n TSC zoompan           V->V       Zoom\\n ... ass               V->V       Subtitles\\n' ;;
+esac
+"""
+
+
+def _install(tmp_path, monkeypatch, name, body):
+    script = tmp_path / name
+    script.write_text(body)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_PROBE_LOG", str(tmp_path / "calls.log"))
+
+
+def test_probe_is_cached_until_the_file_changes(tmp_path, monkeypatch):
+    _install(tmp_path, monkeypatch, "ffprobe", FAKE_FFPROBE)
+    media = tmp_path / "voice.mp3"
+    media.write_bytes(b"abc")
+    service = MediaProbeService()
+
+    async def scenario():
+        first = await service.probe(str(media))
+        second = await service.probe(str(media))
+        media.write_bytes(b"abcdef")
+        third = await service.duration(str(media))
+        return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+
+    assert first is second
+    assert first["duration"] == 12.5 and first["bit_rate"] == 128000
+    assert first["streams"][0]["codec_name"] == "mp3" and first["streams"][0]["sample_rate"] == 44100
+    assert third == 12.5
+    assert len((tmp_path / "calls.log").read_text().splitlines()) == 2
+    assert asyncio.run(service.probe(str(tmp_path / "missing.mp3"))) is None
+
+
+def test_capabilities_are_detected_once(tmp_path, monkeypatch):
+    _install(tmp_path, monkeypatch, "ffmpeg", FAKE_FFMPEG)
+    service = MediaProbeService()
+
+    async def scenario():
+        first = await service.capabilities()
+        await service.capabilities()
+        return first, await service.has_encoder("libx264"), await service.has_filter("ass")
+
+    capabilities, has_x264, has_ass = asyncio.run(scenario())
+
+    assert capabilities["available"] and capabilities["version"] == "6.1.1"
+    assert capabilities["encoders"] == ["aac", "libx264"]
+    assert capabilities["filters"] == ["ass", "zoompan"]
+    assert has_x264 and has_ass
+    assert len((tmp_path / "calls.log").read_text().splitlines()) == 3
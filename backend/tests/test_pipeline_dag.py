@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from app.services.pipeline_dag import DagExecutor, Stage
+
+
+def _stage(name, log, inputs=(), outputs=(), delay=0.01, produce=True, **kwargs):
+    async def run(ctx):
+        log.append(("start", name))
+        await asyncio.sleep(delay)
+        log.append(("end", name))
+        return {key: name for key in outputs} if produce else None
+
+    return Stage(name, run, inputs=inputs, outputs=outputs, **kwargs)
+
+
+def test_independent_stages_overlap():
+    log = []
+    stages = [
+        _stage("script", log, outputs=("scenes",)),
+        _stage("audio", log, inputs=("scenes",), outputs=("audio",), delay=0.05),
+        _stage("images", log, inputs=("scenes",), outputs=("images",), delay=0.05),
+        _stage("render", log, inputs=("audio", "images"), outputs=("clip",)),
+    ]
+
+    states = asyncio.run(DagExecutor(stages).run({}))
+
+    assert set(states.values()) == {"success"}
+    # Both branches start before either finishes
+    assert log.index(("start", "images")) < log.index(("end", "audio"))
+    assert log.index(("start", "audio")) < log.index(("end", "images"))
+    assert log[-1] == ("end", "render")
+
+
+def test_dependents_of_failed_stage_are_skipped():
+    log, events = [], []
+
+    async def on_event(name, state, detail):
+        events.append((name, state))
+
+    stages = [
+        _stage("audio", log, outputs=("audio",), produce=False),
+        _stage("render", log, inputs=("audio",), outputs=("clip",)),
+        _stage("upload", log, inputs=("clip",), outputs=("result",)),
+    ]
+
+    states = asyncio.run(DagExecutor(stages, on_event=on_event).run({}))
+
+    assert states == {"audio": "failed", "render": "skipped", "upload": "skipped"}
+    assert ("upload", "skipped") in events
+    assert ("start", "render") not in log
+
+
+def test_resource_class_caps_concurrency(monkeypatch):
+    from app.services import pipeline_dag
+
+    monkeypatch.setattr(pipeline_dag, "_resource_semaphores", {})
+    monkeypatch.setattr(pipeline_dag.settings, "PIPELINE_CPU_RENDER_CONCURRENCY", 1)
+    active, peak = [0], [0]
+
+    def render(name):
+        async def run(ctx):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            return {name: True}
+        return Stage(name, run, outputs=(name,), resource=pipeline_dag.CPU_RENDER)
+
+    asyncio.run(DagExecutor([render("a"), render("b"), render("c")]).run({}))
+
+    assert peak[0] == 1
+
+
+def test_cycle_is_rejected():
+    log = []
+    with pytest.raises(ValueError):
+        DagExecutor([
+            _stage("a", log, inputs=("y",), outputs=("x",)),
+            _stage("b", log, inputs=("x",), outputs=("y",)),
+        ])
+
+
+def test_checkpointed_stages_are_resumed():
+    log, saved = [], {}
+
+    async def on_checkpoint(name, outputs):
+        saved[name] = {"outputs": outputs}
+
+    stages = [
+        _stage("report", log, outputs=("report",)),
+        _stage("audio", log, inputs=("report",), outputs=("audio",)),
+        _stage("render", log, inputs=("audio",), outputs=("clip",), produce=False),
+    ]
+    asyncio.run(DagExecutor(stages).run({}, on_checkpoint=on_checkpoint))
+    assert set(saved) == {"report", "audio"}
+
+    log.clear()
+    states = asyncio.run(DagExecutor(stages).run({}, checkpoints=saved))
+
+    assert states == {"report": "resumed", "audio": "resumed", "render": "failed"}
+    assert log == [("start", "render"), ("end", "render")]
+
+
+def test_stale_artifact_reruns_stage_and_its_dependents(tmp_path):
+    log = []
+    audio_file = tmp_path / "audio.mp3"
+    checkpoints = {
+        "report": {"outputs": {"report": "r"}},
+        "audio": {"outputs": {"audio": str(audio_file)}},
+        "render": {"outputs": {"clip": "c"}},
+    }
+    stages = [
+        _stage("report", log, outputs=("report",)),
+        _stage("audio", log, inputs=("report",), outputs=("audio",), artifacts=lambda o: [o["audio"]]),
+        _stage("render", log, inputs=("audio",), outputs=("clip",)),
+    ]
+
+    states = asyncio.run(DagExecutor(stages).run({}, checkpoints=checkpoints))
+
+    assert states == {"report": "resumed", "audio": "success", "render": "success"}
+    assert ("start", "report") not in log
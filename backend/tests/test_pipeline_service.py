@@ -0,0 +1,111 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.services import pipeline_run_service as run_service_module
+from app.services.pipeline_service import PipelineService
+
+
+def test_set_step_records_and_notifies():
+    service = PipelineService()
+    pipeline_result = {"steps": {}, "errors": []}
+    events = []
+
+    async def on_step(name, data, result):
+        events.append((name, data["status"], dict(result["steps"])))
+
+    async def scenario():
+        await service._set_step(pipeline_result, "audio", {"status": "running"}, on_step)
+        await service._set_step(pipeline_result, "audio", {"status": "success", "url": "/a.mp3"}, on_step)
+
+    asyncio.run(scenario())
+
+    assert pipeline_result["steps"]["audio"]["url"] == "/a.mp3"
+    assert [(name, status) for name, status, _ in events] == [("audio", "running"), ("audio", "success")]
+
+
+def test_set_step_survives_failing_listener():
+    service = PipelineService()
+    pipeline_result = {"steps": {}, "errors": []}
+
+    async def on_step(name, data, result):
+        raise RuntimeError("db unavailable")
+
+    asyncio.run(service._set_step(pipeline_result, "report", {"status": "success"}, on_step))
+
+    assert pipeline_result["steps"]["report"] == {"status": "success"}
+
+
+def test_dedupe_articles_keeps_story_in_first_category():
+    articles = {
+        "Conflict": [{"url": "https://a"}, {"url": "https://b"}],
+        "Economy": [{"url": "https://b"}, {"url": "https://c"}],
+        "Energy": [{"url": "https://a"}],
+    }
+
+    removed = PipelineService.dedupe_articles(articles)
+
+    assert removed == 1
+    assert articles["Economy"] == [{"url": "https://c"}]
+    # A category is never emptied by deduplication
+    assert articles["Energy"] == [{"url": "https://a"}]
+
+
+def test_batch_pipeline_shares_loading_and_runs_targets_concurrently():
+    service = PipelineService()
+    loads, running, peak = [], [], []
+
+    async def load_profile(db, profile_id):
+        loads.append("profile")
+        return {"name": "Desk"}
+
+    async def load_articles(db, category, limit=10):
+        loads.append(category)
+        return [{"url": f"https://{category}"}]
+
+    async def run_full_pipeline(db, category, region, profile=None, articles=None, **kwargs):
+        running.append(category)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(category)
+        return {"category": category, "region": region, "profile": profile, "articles": articles}
+
+    service.load_profile = load_profile
+    service.load_articles = load_articles
+    service.run_full_pipeline = run_full_pipeline
+
+    batch = asyncio.run(service.run_batch_pipeline(
+        db=None, targets=[("Conflict", "Global"), ("Economy", "Europe"), ("Conflict", "Asia")], profile_id="p1"
+    ))
+
+    assert loads == ["profile", "Conflict", "Economy"]
+    assert [r["region"] for r in batch["results"]] == ["Global", "Europe", "Asia"]
+    assert all(r["profile"] == {"name": "Desk"} for r in batch["results"])
+    assert max(peak) == 3
+
+
+def test_promote_run_redoes_only_the_short_render(monkeypatch):
+    released = []
+
+    async def release_paths(paths):
+        released.extend(paths)
+
+    async def noop(*args, **kwargs):
+        pass
+
+    monkeypatch.setattr(run_service_module.artifact_store, "release_paths", release_paths)
+    run = SimpleNamespace(
+        status="completed", attempts=1, steps={"short_clip": {}}, errors=[], result={}, current_step=None,
+        finished_at=None, params={"voice_id": "default", "preview": True},
+        checkpoints={
+            "audio": {"artifacts": ["/out/voice.mp3"]},
+            "short_clip": {"artifacts": ["/out/preview.mp4"]},
+        },
+    )
+    db = SimpleNamespace(commit=noop, refresh=noop)
+
+    promoted = asyncio.run(run_service_module.PipelineRunService().promote_run(db, run))
+
+    assert promoted.params == {"voice_id": "default", "preview": False}
+    assert list(promoted.checkpoints) == ["audio"]
+    assert released == ["/out/preview.mp4"]
+    assert promoted.status == "queued" and promoted.attempts == 2
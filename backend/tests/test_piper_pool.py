@@ -0,0 +1,64 @@
+import asyncio
+import os
+import stat
+import sys
+
+from app.services.piper_pool import PiperPool
+
+# Speaks the worker protocol: two PCM chunks per request, "fail" reports an error
+FAKE_WORKER = """
+import json, sys
+out = sys.stdout.buffer
+def send(message, payload=b""):
+    out.write(json.dumps(message).encode() + b"\\n" + payload)
+    out.flush()
+send({"ready": True, "sample_rate": 16000})
+for line in sys.stdin:
+    request = json.loads(line)
+    if request["text"] == "fail":
+        send({"id": request["id"], "error": "bad text"})
+        continue
+    for chunk in (request["text"].encode(), b"|pcm"):
+        send({"id": request["id"], "pcm": len(chunk)}, chunk)
+    send({"id": request["id"], "done": True})
+"""
+
+# Encoder stand-in: copy the piped PCM to the output file
+COPYING_FFMPEG = """#!/bin/sh
+for last; do :; done
+cat > "$last"
+"""
+
+
+def test_worker_stays_loaded_and_pcm_is_piped_to_the_encoder(tmp_path, monkeypatch):
+    worker_script = tmp_path / "worker.py"
+    worker_script.write_text(FAKE_WORKER)
+    ffmpeg = tmp_path / "ffmpeg"
+    ffmpeg.write_text(COPYING_FFMPEG)
+    ffmpeg.chmod(ffmpeg.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    pool = PiperPool()
+    monkeypatch.setattr(pool, "_command", lambda model: [sys.executable, str(worker_script)])
+
+    async def scenario():
+        await pool.synthesize("hello", str(tmp_path / "one.mp3"), "voice-a")
+        first = pool._idle[0].process.pid
+        await pool.synthesize("again", str(tmp_path / "two.mp3"), "voice-a")
+        reused = pool._idle[0].process.pid == first
+        try:
+            await pool.synthesize("fail", str(tmp_path / "three.mp3"), "voice-a")
+            failed = False
+        except RuntimeError:
+            failed = True
+        # The failed worker is replaced, and a different voice gets its own process
+        await pool.synthesize("other", str(tmp_path / "four.mp3"), "voice-b")
+        replaced = pool._idle[0].process.pid != first and pool._idle[0].model == "voice-b"
+        await pool.shutdown()
+        return reused, failed, replaced
+
+    reused, failed, replaced = asyncio.run(scenario())
+
+    assert reused and failed and replaced
+    assert (tmp_path / "one.mp3").read_bytes() == b"hello|pcm"
+    assert (tmp_path / "two.mp3").read_bytes() == b"again|pcm"
+    assert pool._idle == []
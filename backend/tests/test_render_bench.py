@@ -0,0 +1,24 @@
+from benchmarks.render_bench import compare, expand_cases
+
+
+def test_expand_cases_builds_stable_ids():
+    cases = expand_cases([1, 3], [15.0], ["preview"], ["segmented"], ["short_clip", "thumbnail"])
+
+    assert [c["id"] for c in cases] == [
+        "short_clip/segmented/preview/scenes=1/duration=15",
+        "short_clip/segmented/preview/scenes=3/duration=15",
+        "thumbnail",
+    ]
+
+
+def test_compare_reports_ratios_for_shared_successful_cases():
+    baseline = {"results": [
+        {"id": "a", "ok": True, "wall_seconds": 10.0, "cpu_seconds": 40.0, "output_bytes": 1000},
+        {"id": "b", "ok": False},
+    ]}
+    current = {"results": [
+        {"id": "a", "ok": True, "wall_seconds": 5.0, "cpu_seconds": 30.0, "output_bytes": 900},
+        {"id": "b", "ok": True, "wall_seconds": 1.0, "cpu_seconds": 1.0, "output_bytes": 1},
+    ]}
+
+    assert compare(baseline, current) == [{"id": "a", "wall_ratio": 0.5, "cpu_ratio": 0.75, "output_ratio": 0.9}]
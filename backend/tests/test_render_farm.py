@@ -0,0 +1,62 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.services import render_farm as render_farm_module
+from app.services.render_farm import RenderFarmService
+
+
+def _task(attempts=1, max_attempts=3):
+    return SimpleNamespace(
+        id="task-1",
+        attempts=attempts,
+        max_attempts=max_attempts,
+        status="running",
+        worker_id="host-1",
+        heartbeat_at=datetime(2026, 3, 28, 10, 0),
+        progress=0.4,
+        error=None,
+        finished_at=None,
+    )
+
+
+def test_failure_requeues_until_attempts_exhausted():
+    service = RenderFarmService()
+    now = datetime(2026, 3, 28, 10, 5)
+
+    task = _task(attempts=1)
+    service._record_failure(task, "ffmpeg crashed", now)
+    assert task.status == "queued"
+    assert task.worker_id is None
+    assert task.progress == 0.0
+
+    task = _task(attempts=3)
+    service._record_failure(task, "ffmpeg crashed", now)
+    assert task.status == "failed"
+    assert task.finished_at == now
+
+
+def test_render_falls_back_to_local_without_live_workers(monkeypatch):
+    service = RenderFarmService()
+    calls = []
+
+    async def no_capacity():
+        return 0
+
+    async def render_short_clip(**spec):
+        calls.append(spec)
+        return {"path": "/out/short.mp4"}
+
+    async def submit(*args, **kwargs):
+        raise AssertionError("nothing should be queued without workers")
+
+    service.live_capacity = no_capacity
+    service.submit = submit
+    monkeypatch.setattr(
+        render_farm_module, "video_render_service", SimpleNamespace(render_short_clip=render_short_clip)
+    )
+
+    result = asyncio.run(service.render("short_clip", {"audio_path": "/a.mp3", "headline": "H"}))
+
+    assert result == {"path": "/out/short.mp4"}
+    assert calls == [{"audio_path": "/a.mp3", "headline": "H", "on_progress": None}]
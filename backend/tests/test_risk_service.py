@@ -64,3 +64,45 @@ def test_safe_mode_violation_flags():
     assert safe_mode["blocked"]
     assert "Criminal allegations not allowed" in safe_mode["violations"][0]
     assert "Active conflict analysis restricted" in safe_mode["violations"][1]
+
+
+def test_score_matrix_matches_row_by_row_scoring():
+    from itertools import product
+    from app.services.risk_service import FACTOR_NAMES, DEFAULT_RISK_RULES
+
+    factor_rows = [dict(zip(FACTOR_NAMES, combo)) for combo in product([False, True], repeat=len(FACTOR_NAMES))]
+    result = risk_service.score_matrix(factor_rows, DEFAULT_RISK_RULES)
+
+    for i, factors in enumerate(factor_rows):
+        scores = risk_service.calculate_scores(factors)
+        overall = risk_service.calculate_overall(scores)
+        assert result["legal"][i] == scores["legal"]
+        assert result["political"][i] == scores["political"]
+        assert result["overall"][i] == overall
+        assert result["classification"][i] == risk_service.classify_overall(overall)
+
+
+def test_score_matrix_applies_new_rule_weights():
+    rules = risk_service.build_rules({
+        "factor_weights": {"war_topic": {"legal": 50, "defamation": 50, "platform": 50, "political": 50}},
+        "classification_thresholds": [[45, "High"], [10, "Moderate"]],
+    })
+    result = risk_service.score_matrix([{"war_topic": True}, {}], rules)
+
+    assert list(result["overall"]) == [50, 0]
+    assert list(result["classification"]) == ["High", "Low"]
+    assert bool(result["requires_review"][0]) is True
+
+
+def test_build_score_uses_rule_set_version():
+    from app.services.risk_service import DEFAULT_RISK_RULES
+
+    article = create_article(
+        headline="Minister accused of fraud",
+        summary="Anonymous officials describe corruption.",
+    )
+    score = risk_service._build_score(article, DEFAULT_RISK_RULES, None, safe_mode_enabled=False)
+
+    assert score.rule_set_version == 0
+    assert score.risk_factors["criminal_allegation"]
+    assert score.requires_senior_review == (score.overall_score > 40)
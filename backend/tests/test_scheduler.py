@@ -2,7 +2,13 @@ import pytest
 from datetime import datetime, timedelta
 from types import SimpleNamespace
 
-from app.core.scheduler import _compute_next_run, _should_run, _croniter_available
+from app.core.scheduler import (
+    ScheduleHeap,
+    _compute_next_run,
+    _croniter_available,
+    _next_due_at,
+    _should_run,
+)
 
 
 def test_compute_next_run_interval():
@@ -54,3 +60,33 @@ def test_should_run_cron_expression():
     now = datetime(2026, 3, 28, 12, 0)
 
     assert _should_run(schedule, now) is True
+
+
+def test_schedule_heap_pops_due_items_in_order():
+    heap = ScheduleHeap()
+    now = datetime(2026, 3, 28, 10, 0)
+    heap.push(now + timedelta(minutes=5), "automation", "b")
+    heap.push(now - timedelta(minutes=1), "source", "a")
+    heap.push(now, "campaign", "c")
+
+    assert heap.pop_due(now) == [("source", "a"), ("campaign", "c")]
+    assert heap.seconds_until_next(now) == 300
+    assert len(heap) == 1
+
+
+def test_schedule_heap_empty_has_no_next():
+    assert ScheduleHeap().seconds_until_next(datetime(2026, 3, 28, 10, 0)) is None
+
+
+def test_next_due_at_campaign_uses_schedule_type():
+    now = datetime(2026, 3, 28, 10, 0)
+    campaign = SimpleNamespace(schedule_type="6h", last_run_at=datetime(2026, 3, 28, 8, 0))
+
+    assert _next_due_at("campaign", campaign, now) == datetime(2026, 3, 28, 14, 0)
+
+
+def test_next_due_at_source_without_fetch_is_due_now():
+    now = datetime(2026, 3, 28, 10, 0)
+    source = SimpleNamespace(last_fetch_at=None, fetch_interval_minutes=30)
+
+    assert _next_due_at("source", source, now) == now
@@ -0,0 +1,53 @@
+import asyncio
+
+from app.core.tracing import annotate, flame_view, percentile, span, start_trace, to_otlp
+
+
+def test_spans_nest_across_tasks():
+    async def child(name):
+        with span(name):
+            await asyncio.sleep(0.01)
+            annotate(cache_hit=True)
+
+    async def scenario():
+        with start_trace("pipeline.run") as trace:
+            with span("stage.images"):
+                await asyncio.gather(child("image"), child("image"))
+        return trace
+
+    trace = asyncio.run(scenario())
+    by_name = {}
+    for s in trace.spans:
+        by_name.setdefault(s["name"], []).append(s)
+
+    root = by_name["pipeline.run"][0]
+    stage = by_name["stage.images"][0]
+    assert root["parent_id"] is None
+    assert stage["parent_id"] == root["span_id"]
+    assert [s["parent_id"] for s in by_name["image"]] == [stage["span_id"]] * 2
+    assert all(s["attributes"]["cache_hit"] for s in by_name["image"])
+    assert [s["depth"] for s in flame_view(trace.spans)] == [0, 1, 2, 2]
+
+
+def test_span_records_errors_and_is_noop_without_trace():
+    with span("orphan") as record:
+        assert record is None
+
+    with start_trace("run") as trace:
+        try:
+            with span("ffmpeg"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+    ffmpeg = next(s for s in trace.spans if s["name"] == "ffmpeg")
+    assert ffmpeg["status"] == "error"
+    otlp = to_otlp(trace.trace_id, trace.spans)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert {s["name"]: s["status"]["code"] for s in otlp} == {"ffmpeg": 2, "run": 1}
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 21)]
+    assert percentile(values, 50) == 10.0
+    assert percentile(values, 95) == 19.0
+    assert percentile([], 50) is None
@@ -0,0 +1,86 @@
+import asyncio
+
+from app.services import tts_service as tts_module
+from app.services.artifact_store import artifact_store
+from app.services.media_probe import media_probe
+from app.services.tts_service import TTSService, normalize_text, split_sentences
+from app.services.video_service import video_render_service
+
+
+def _fake_backends(tmp_path, monkeypatch, service):
+    """Fake synthesis (clip length = len(text) / 2 seconds) plus no-op store, concat and analysis."""
+    synthesized, running, peak, durations = [], [], [], {}
+
+    async def generate_audio(text, voice_id="default", profile=None):
+        synthesized.append(text)
+        running.append(text)
+        peak.append(len(running))
+        await asyncio.sleep(0.01 * len(text))
+        running.remove(text)
+        path = tmp_path / f"{abs(hash(text))}.mp3"
+        path.write_bytes(b"mp3")
+        return {
+            "path": str(path), "duration_seconds": round(len(text) / 2),
+            "duration_us": len(text) * 500_000, "engine": "edge_tts",
+        }
+
+    async def duration(path):
+        return durations.get(path, 0.0)
+
+    async def concat_audio(paths, output_path):
+        durations[output_path] = 42.0
+        open(output_path, "wb").close()
+
+    async def measure_loudness(path):
+        return {"input_i": -20.0}
+
+    async def lookup(key):
+        return None
+
+    async def store(*args, **kwargs):
+        pass
+
+    monkeypatch.setattr(service, "generate_audio", generate_audio)
+    monkeypatch.setattr(media_probe, "duration", duration)
+    monkeypatch.setattr(video_render_service, "concat_audio", concat_audio)
+    monkeypatch.setattr(video_render_service, "measure_loudness", measure_loudness)
+    monkeypatch.setattr(artifact_store, "lookup", lookup)
+    monkeypatch.setattr(artifact_store, "store", store)
+    return synthesized, peak
+
+
+def test_narration_synthesizes_scenes_concurrently_and_keeps_their_durations(tmp_path, monkeypatch):
+    monkeypatch.setattr(tts_module.settings, "TTS_CONCURRENCY", 2)
+    service = TTSService()
+    service.output_dir = str(tmp_path)
+    synthesized, peak = _fake_backends(tmp_path, monkeypatch, service)
+
+    result = asyncio.run(service.generate_narration(["opening", "mid", "closing line"], profile=None))
+
+    assert max(peak) == 2
+    # Exact per-clip lengths in scene order, not the rounded estimates
+    assert result["scene_durations"] == [3.5, 1.5, 6.0]
+    assert result["duration_seconds"] == 42.0 and result["duration_us"] == 42_000_000
+    assert result["engine"] == "edge_tts" and result["loudness"] == {"input_i": -20.0}
+
+
+def test_narration_is_synthesized_per_sentence(tmp_path, monkeypatch):
+    monkeypatch.setattr(tts_module.settings, "TTS_SENTENCE_CACHE", True)
+    service = TTSService()
+    service.output_dir = str(tmp_path)
+    synthesized, _ = _fake_backends(tmp_path, monkeypatch, service)
+
+    result = asyncio.run(service.generate_narration(
+        ["This is Strategic Context. Markets fell.", "Talks resume!  This is Strategic Context."]
+    ))
+
+    # The shared sign-off is its own clip, so its cache entry serves both scenes
+    assert synthesized.count("This is Strategic Context.") == 2
+    assert sorted(set(synthesized)) == ["Markets fell.", "Talks resume!", "This is Strategic Context."]
+    assert result["scene_durations"] == [19.5, 19.5]
+
+
+def test_cache_key_text_is_normalized():
+    assert normalize_text("  “Missiles”   reported\n near the border ") == '"Missiles" reported near the border'
+    assert split_sentences("Dr Smith spoke. Then?  Talks resumed!") == ["Dr Smith spoke.", "Then?", "Talks resumed!"]
+    assert tts_module.engine_version("elevenlabs") == tts_module.ELEVENLABS_MODEL
@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from app.core.config import settings
+from app.models.video import VideoJobStatus
+from app.services.video_job_service import VideoJobService
+
+
+def _job(retry_count=0, max_retries=3):
+    return SimpleNamespace(
+        id="job-1",
+        retry_count=retry_count,
+        max_retries=max_retries,
+        status=VideoJobStatus.PROCESSING,
+        worker_id="host-1",
+        heartbeat_at=datetime(2026, 3, 28, 10, 0),
+        error_message=None,
+        next_attempt_at=None,
+        processing_completed_at=None,
+    )
+
+
+def test_retry_delay_doubles_per_attempt():
+    service = VideoJobService()
+    base = settings.VIDEO_JOB_RETRY_BASE_SECONDS
+
+    assert service.retry_delay(1) == timedelta(seconds=base)
+    assert service.retry_delay(3) == timedelta(seconds=base * 4)
+
+
+def test_failure_requeues_with_backoff_until_retries_exhausted():
+    service = VideoJobService()
+    now = datetime(2026, 3, 28, 10, 5)
+
+    job = _job(retry_count=0)
+    service._record_failure(job, "ffmpeg crashed", now)
+    assert job.status == VideoJobStatus.QUEUED
+    assert job.worker_id is None
+    assert job.next_attempt_at == now + service.retry_delay(1)
+
+    job = _job(retry_count=3)
+    service._record_failure(job, "ffmpeg crashed", now)
+    assert job.status == VideoJobStatus.FAILED
+    assert job.processing_completed_at == now
+
+
+def test_permanent_failure_is_not_retried():
+    service = VideoJobService()
+    job = _job(retry_count=0)
+
+    service._record_failure(job, "Script not found", datetime(2026, 3, 28, 10, 5), retryable=False)
+
+    assert job.status == VideoJobStatus.FAILED
@@ -0,0 +1,334 @@
+import asyncio
+import os
+import stat
+
+import pytest
+
+from app.services import video_service
+from app.services.video_service import VideoRenderService
+
+FAKE_FFMPEG = """#!/bin/sh
+echo "frame=1"
+echo "out_time_us=1000000"
+echo "progress=continue"
+echo "out_time_us=2000000"
+echo "progress=continue"
+if [ -n "$FAKE_FFMPEG_SLEEP" ]; then
+    echo $$ > "$FAKE_FFMPEG_PIDFILE"
+    exec sleep "$FAKE_FFMPEG_SLEEP"
+fi
+echo "out_time_us=4000000"
+echo "progress=end"
+echo "encoder warning" >&2
+exit 0
+"""
+
+
+def _install_fake_ffmpeg(tmp_path, monkeypatch):
+    script = tmp_path / "ffmpeg"
+    script.write_text(FAKE_FFMPEG)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+
+def test_run_ffmpeg_reports_progress(tmp_path, monkeypatch):
+    _install_fake_ffmpeg(tmp_path, monkeypatch)
+    service = VideoRenderService()
+    reported = []
+
+    async def on_progress(fraction):
+        reported.append(fraction)
+
+    returncode, stderr = asyncio.run(
+        service._run_ffmpeg(["-y", "out.mp4"], timeout=10, op="test", duration=4.0, on_progress=on_progress)
+    )
+
+    assert returncode == 0
+    assert "encoder warning" in stderr
+    assert reported == [0.25, 0.5, 1.0]
+
+
+def test_cancelled_render_kills_ffmpeg(tmp_path, monkeypatch):
+    _install_fake_ffmpeg(tmp_path, monkeypatch)
+    pidfile = tmp_path / "pid"
+    monkeypatch.setenv("FAKE_FFMPEG_SLEEP", "30")
+    monkeypatch.setenv("FAKE_FFMPEG_PIDFILE", str(pidfile))
+    service = VideoRenderService()
+
+    async def scenario():
+        task = asyncio.create_task(service._run_ffmpeg(["-y", "out.mp4"], timeout=60, op="test"))
+        while not pidfile.exists() or not pidfile.read_text().strip():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    assert asyncio.run(scenario())
+    pid = int(pidfile.read_text())
+    try:
+        os.kill(pid, 0)
+        alive = True
+    except ProcessLookupError:
+        alive = False
+    assert not alive
+
+
+RECORDING_FFMPEG = """#!/bin/sh
+printf '%s\\n' "$*" >> "$FAKE_FFMPEG_LOG"
+for last; do :; done
+touch "$last"
+exit 0
+"""
+
+
+def test_segmented_render_concats_scene_segments(tmp_path, monkeypatch):
+    script = tmp_path / "ffmpeg"
+    script.write_text(RECORDING_FFMPEG)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    log = tmp_path / "calls.log"
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_FFMPEG_LOG", str(log))
+    service = VideoRenderService()
+    output_path = str(tmp_path / "short.mp4")
+    scenes = [
+        {"voiceover": "First scene words", "duration_seconds": 5, "overlay_text": "One"},
+        {"voiceover": "Second scene words", "duration_seconds": 5, "overlay_text": "Two"},
+    ]
+
+    error = asyncio.run(service._render_segmented(
+        output_path=output_path, audio_path="voice.wav", music_path=None, headline="Headline",
+        image_paths=[], scenes=scenes, duration=10.0, bg_color="#000000", txt_color="white",
+        sentiment="stable", on_progress=None,
+    ))
+
+    assert error is None
+    calls = log.read_text().splitlines()
+    segments = [c for c in calls if "segment_" in c.split()[-1]]
+    assert len(segments) == 2
+    assert all("-frames:v 150" in c for c in segments)
+    # The progress bar of the second segment continues from where the first left off
+    assert any("(t+5.000)" in c for c in segments)
+    # Captions are burned in from one ASS file per segment, not a drawtext per phrase
+    assert all(c.count("ass=filename=") == 1 for c in segments)
+    assert not any("First scene words" in c for c in segments)
+    assert "-f concat" in calls[-1] and "-c:v copy" in calls[-1]
+    assert os.path.exists(output_path)
+    assert not os.path.exists(str(tmp_path / "short_segments"))
+
+
+def test_captions_written_as_ass_track(tmp_path):
+    service = VideoRenderService()
+    events = service._caption_events("Missile strike reported. Talks resume {soon}", 4.0, "white", start_offset=1.0)
+
+    assert [e["text"] for e in events] == ["Missile strike reported.", "Talks resume {soon}"]
+    assert events[0]["start"] == 1.0 and abs(events[-1]["end"] - 4.0) < 1e-9
+    assert events[0]["color"] == "#FFD700" and events[1]["color"] == "white"
+
+    path = service._write_captions(str(tmp_path / "captions.ass"), events)
+    dialogue = [line for line in open(path, encoding="utf-8") if line.startswith("Dialogue:")]
+
+    assert len(dialogue) == 2
+    assert dialogue[0].startswith("Dialogue: 0,0:00:01.00,0:00:02.65,Caption")
+    assert "\\c&H00D7FF&\\fs50}Missile strike reported." in dialogue[0]
+    assert "\\c&HFFFFFF&" in dialogue[1] and dialogue[1].rstrip().endswith("Talks resume (soon)")
+
+
+def test_prescaled_still_is_cached_and_panned_without_rescaling(tmp_path, monkeypatch):
+    script = tmp_path / "ffmpeg"
+    script.write_text(RECORDING_FFMPEG)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    log = tmp_path / "calls.log"
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_FFMPEG_LOG", str(log))
+
+    async def store(*args, **kwargs):
+        pass
+
+    monkeypatch.setattr(video_service.artifact_store, "store", store)
+    service = VideoRenderService()
+    service.stills_dir = str(tmp_path)
+    image = tmp_path / "photo.jpg"
+    image.write_bytes(b"jpeg")
+
+    first = asyncio.run(service._prescale_still(str(image), 1080, 1920))
+    second = asyncio.run(service._prescale_still(str(image), 1080, 1920))
+
+    assert first == second and first.endswith(".png")
+    assert len(log.read_text().splitlines()) == 1
+    assert "scale=1242:2208" in log.read_text()
+
+    pan = service._pan_filter(1, 150, 1080, 1920)
+    assert "zoompan" not in pan and "scale" not in pan
+    assert "loop=loop=149" in pan and "(1-n/149)" in pan
+
+
+def test_preview_tier_renders_small_fast_segments(tmp_path, monkeypatch):
+    script = tmp_path / "ffmpeg"
+    script.write_text(RECORDING_FFMPEG)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    log = tmp_path / "calls.log"
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_FFMPEG_LOG", str(log))
+    service = VideoRenderService()
+
+    error = asyncio.run(service._render_segmented(
+        output_path=str(tmp_path / "preview.mp4"), audio_path="voice.wav", music_path=None, headline="Headline",
+        image_paths=[], scenes=[{"voiceover": "Words", "duration_seconds": 4, "overlay_text": "One"}],
+        duration=4.0, bg_color="#000000", txt_color="white", sentiment="stable", on_progress=None,
+        tier=video_service.RENDER_TIERS["preview"],
+    ))
+
+    assert error is None
+    segment = log.read_text().splitlines()[0]
+    assert "s=540x960" in segment and "-r 15" in segment and "-frames:v 60" in segment
+    assert "-preset ultrafast" in segment and "-crf 32" in segment
+    # Overlay geometry is scaled down with the frame
+    assert "fontsize=14" in segment and "fontsize=24" not in segment
+
+
+def test_static_chrome_is_one_overlay(tmp_path, monkeypatch):
+    script = tmp_path / "ffmpeg"
+    script.write_text(RECORDING_FFMPEG)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    log = tmp_path / "calls.log"
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_FFMPEG_LOG", str(log))
+    service = VideoRenderService()
+    chrome = tmp_path / "chrome.png"
+    chrome.write_bytes(b"png")
+
+    error = asyncio.run(service._render_segmented(
+        output_path=str(tmp_path / "short.mp4"), audio_path="voice.wav", music_path=None, headline="Headline",
+        image_paths=[], scenes=[{"voiceover": "Words", "duration_seconds": 4, "overlay_text": "One"}],
+        duration=4.0, bg_color="#000000", txt_color="white", sentiment="stable", on_progress=None,
+        chrome_path=str(chrome),
+    ))
+
+    assert error is None
+    segment = log.read_text().splitlines()[0]
+    assert f"-i {chrome}" in segment and "[1:v]overlay=0:0" in segment
+    assert "StrategicContext" not in segment and "LIVE" not in segment and "black@0.55" not in segment
+    # Only the progress fill is still drawn per frame
+    assert segment.count("drawbox") == 1
+
+
+def test_draw_chrome_layer(tmp_path):
+    pytest.importorskip("PIL")
+    service = VideoRenderService()
+    font_path = service._find_font()
+    if not font_path:
+        pytest.skip("No TrueType font available")
+    from PIL import Image
+
+    path = str(tmp_path / "chrome.png")
+    assert service._draw_chrome(path, video_service.RENDER_TIERS["preview"], font_path)
+
+    image = Image.open(path)
+    assert image.mode == "RGBA" and image.size == (540, 960)
+    assert image.getpixel((270, 300))[3] == 0  # clear between the bands
+    assert image.getpixel((270, 50))[3] == 128  # top band
+
+
+def test_thumbnails_cut_from_title_card_in_render_pass(tmp_path, monkeypatch):
+    script = tmp_path / "ffmpeg"
+    script.write_text(RECORDING_FFMPEG)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    log = tmp_path / "calls.log"
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_FFMPEG_LOG", str(log))
+    # The render slot semaphore belongs to the event loop of whichever test used it first
+    monkeypatch.setattr(video_service, "_render_slots", None)
+    service = VideoRenderService()
+    thumbnails = {name: str(tmp_path / f"thumb_{name}.jpg") for name in video_service.THUMBNAIL_SIZES}
+    scenes = [
+        {"voiceover": "First scene words", "duration_seconds": 5, "overlay_text": "One"},
+        {"voiceover": "Second scene words", "duration_seconds": 5, "overlay_text": "Two"},
+    ]
+
+    error = asyncio.run(service._render_segmented(
+        output_path=str(tmp_path / "short.mp4"), audio_path="voice.wav", music_path=None, headline="Headline",
+        image_paths=[], scenes=scenes, duration=10.0, bg_color="#000000", txt_color="white",
+        sentiment="stable", on_progress=None, thumbnails=thumbnails,
+    ))
+
+    assert error is None
+    first, second = [c for c in log.read_text().splitlines() if "segment_" in c.split()[-1]]
+    # One select half-way through the 1s title card, fanned out to every size
+    assert "select='eq(n,15)',split=3" in first
+    assert "scale=180:320[thumb_telegram]" in first and "scale=720:1280[thumb_youtube]" in first
+    assert all(f"-frames:v 1 -q:v 2 {path}" in first for path in thumbnails.values())
+    assert "select=" not in second
+
+
+LOUDNORM_FFMPEG = """#!/bin/sh
+printf '%s\\n' "$*" >> "$FAKE_FFMPEG_LOG"
+case "$*" in
+*print_format=json*)
+    cat >&2 <<'JSON'
+[Parsed_loudnorm_0 @ 0x1]
+{
+	"input_i" : "-23.51",
+	"input_tp" : "-4.02",
+	"input_lra" : "6.10",
+	"input_thresh" : "-33.80",
+	"output_i" : "-14.02",
+	"output_tp" : "-1.00",
+	"output_lra" : "5.20",
+	"output_thresh" : "-24.30",
+	"normalization_type" : "dynamic",
+	"target_offset" : "0.02"
+}
+JSON
+    exit 0;;
+esac
+for last; do :; done
+touch "$last"
+exit 0
+"""
+
+
+def test_master_audio_uses_cached_loudness_and_ducks_music(tmp_path, monkeypatch):
+    script = tmp_path / "ffmpeg"
+    script.write_text(LOUDNORM_FFMPEG)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    log = tmp_path / "calls.log"
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_FFMPEG_LOG", str(log))
+
+    async def lookup(key):
+        return None
+
+    async def store(*args, **kwargs):
+        pass
+
+    monkeypatch.setattr(video_service.artifact_store, "lookup", lookup)
+    monkeypatch.setattr(video_service.artifact_store, "store", store)
+    service = VideoRenderService()
+    service.mastered_dir = str(tmp_path)
+    narration = tmp_path / "voice.mp3"
+    narration.write_bytes(b"mp3")
+    music = tmp_path / "music.mp3"
+    music.write_bytes(b"music")
+
+    async def scenario():
+        loudness = await service.measure_loudness(str(narration))
+        again = await service.measure_loudness(str(narration))
+        mastered = await service.master_audio(str(narration), str(music), loudness)
+        return loudness, again, mastered
+
+    loudness, again, mastered = asyncio.run(scenario())
+
+    assert loudness == again == {
+        "input_i": -23.51, "input_tp": -4.02, "input_lra": 6.1, "input_thresh": -33.8, "target_offset": 0.02,
+    }
+    calls = log.read_text().splitlines()
+    # Narration measured once (the second lookup is cached), music measured for its gain
+    assert sum("print_format=json" in c for c in calls) == 2
+    master = calls[-1]
+    assert "measured_I=-23.51" in master and "linear=true" in master
+    # Music brought down from -23.51 LUFS to the -32 LUFS bed, then ducked under the narration
+    assert "volume=-8.49dB" in master and "sidechaincompress" in master
+    assert mastered["path"].endswith(".m4a") and mastered["loudness"] == loudness